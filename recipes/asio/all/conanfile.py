@@ -16,13 +16,42 @@ class Asio(ConanFile):
 
     package_type = "header-library"
     settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "with_io_uring": [True, False],
+        "disable_epoll": [True, False],
+    }
+    default_options = {
+        "with_io_uring": False,
+        "disable_epoll": False,
+    }
+    options_description = {
+        "with_io_uring": "Use liburing for file and socket I/O (ASIO_HAS_IO_URING)",
+        "disable_epoll": "Also use io_uring instead of epoll for the reactor (ASIO_DISABLE_EPOLL)",
+    }
     no_copy_source = True
 
+    def config_options(self):
+        if self.settings.os != "Linux":
+            del self.options.with_io_uring
+            del self.options.disable_epoll
+
+    def configure(self):
+        if not self.options.get_safe("with_io_uring"):
+            self.options.rm_safe("disable_epoll")
+
     def layout(self):
         basic_layout(self, src_folder="src")
 
+    def requirements(self):
+        if self.options.get_safe("with_io_uring"):
+            self.requires("liburing/[^2.4]", transitive_headers=True, transitive_libs=True)
+
     def package_id(self):
-        self.info.clear()
+        if self.info.options.get_safe("with_io_uring"):
+            # The backend is selected at compile time and affects the ABI of consumers
+            self.info.settings.clear()
+        else:
+            self.info.clear()
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -40,6 +69,10 @@ class Asio(ConanFile):
     def package_info(self):
         self.cpp_info.set_property("pkg_config_name", "asio")
         self.cpp_info.defines.append("ASIO_STANDALONE")
+        if self.options.get_safe("with_io_uring"):
+            self.cpp_info.defines.append("ASIO_HAS_IO_URING")
+            if self.options.disable_epoll:
+                self.cpp_info.defines.append("ASIO_DISABLE_EPOLL")
         self.cpp_info.bindirs = []
         self.cpp_info.libdirs = []
         if self.settings.os in ["Linux", "FreeBSD"]:
@@ -27,11 +27,19 @@ class AssimpConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "double_precision": [True, False],
+        "formats": ["standard", "all", "gltf_obj_fbx", "none"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "double_precision": False,
+        "formats": "standard",
+    }
+    options_description = {
+        "formats": ("Preset for the importers and exporters to build, which can be overridden per format with the with_<format> options. "
+                    "'standard' enables all formats that don't require additional external dependencies, "
+                    "'gltf_obj_fbx' only the glTF, OBJ and FBX importers. "
+                    "Building fewer formats greatly reduces the build time and the size of the library."),
     }
 
     _format_option_map = {
@@ -102,8 +110,31 @@ class AssimpConan(ConanFile):
         "with_m3d_exporter": ("ASSIMP_BUILD_M3D_EXPORTER", "5.1.0"),
         "with_iqm": ("ASSIMP_BUILD_IQM_IMPORTER", "5.2.0"),
     }
-    options.update(dict.fromkeys(_format_option_map, [True, False]))
-    default_options.update(dict.fromkeys(_format_option_map, True))
+    # None: follow the 'formats' preset
+    options.update(dict.fromkeys(_format_option_map, [None, True, False]))
+    default_options.update(dict.fromkeys(_format_option_map, None))
+
+    # Formats that require external dependencies
+    _formats_with_deps = [
+        "with_3mf_exporter",
+        "with_blend",
+        "with_gltf",
+        "with_gltf_exporter",
+        "with_ifc",
+        "with_m3d",
+        "with_m3d_exporter",
+        "with_opengex",
+        "with_pbrt_exporter",
+    ]
+
+    @property
+    def _preset_formats(self):
+        return {
+            "standard": [opt for opt in self._format_option_map if opt not in self._formats_with_deps],
+            "all": list(self._format_option_map),
+            "gltf_obj_fbx": ["with_gltf", "with_obj", "with_fbx"],
+            "none": [],
+        }[str(self.options.formats)]
 
     def export_sources(self):
         export_conandata_patches(self)
@@ -113,17 +144,6 @@ class AssimpConan(ConanFile):
         if self.settings.os == "Windows":
             del self.options.fPIC
 
-        # Disable importers/that require external deps by default
-        self.options.with_3mf_exporter = False
-        self.options.with_blend = False
-        self.options.with_gltf = False
-        self.options.with_gltf_exporter = False
-        self.options.with_ifc = False
-        self.options.with_m3d = False
-        self.options.with_m3d_exporter = False
-        self.options.with_opengex = False
-        self.options.with_pbrt_exporter = False
-
         for option, (_, min_version) in self._format_option_map.items():
             if Version(self.version) < Version(min_version):
                 delattr(self.options, option)
@@ -131,6 +151,14 @@ class AssimpConan(ConanFile):
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        preset_formats = self._preset_formats
+        for option in self._format_option_map:
+            if option in self.options and getattr(self.options, option).value is None:
+                setattr(self.options, option, option in preset_formats)
+
+    def package_id(self):
+        # The preset is fully reflected in the with_<format> option values
+        del self.info.options.formats
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -178,7 +206,7 @@ class AssimpConan(ConanFile):
         if self._depends_on_rapidjson:
             self.requires("rapidjson/[>=cci.20250205]")
         if self._depends_on_draco:
-            self.requires("draco/1.5.6")
+            self.requires("draco/[^1.5.6]")
         if self._depends_on_clipper:
             if Version(self.version) >= "5.3.0":
                 self.requires("clipper/6.4.2")
@@ -0,0 +1,90 @@
+import os
+
+from conan import ConanFile
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
+from conan.tools.files import *
+
+required_conan_version = ">=2.1"
+
+
+class AwsLcConan(ConanFile):
+    name = "aws-lc"
+    description = ("AWS-LC is a general-purpose cryptographic library maintained by AWS, "
+                   "based on BoringSSL and largely API-compatible with OpenSSL")
+    license = "Apache-2.0 OR ISC"
+    homepage = "https://github.com/aws/aws-lc"
+    topics = ("ssl", "tls", "crypto", "encryption", "openssl", "boringssl")
+    package_type = "library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "build_libssl": [True, False],
+        "no_asm": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "build_libssl": True,
+        "no_asm": False,
+    }
+    options_description = {
+        "build_libssl": "Build libssl in addition to libcrypto",
+        "no_asm": "Disable the assembly-optimized implementations (OPENSSL_NO_ASM)",
+    }
+    implements = ["auto_shared_fpic"]
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
+
+    def build_requirements(self):
+        self.tool_requires("cmake/[>=3.16 <5]")
+        if self.settings.os == "Windows" and self.settings.arch in ["x86", "x86_64"] and not self.options.no_asm:
+            self.tool_requires("nasm/[^2.16]")
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.cache_variables["BUILD_TESTING"] = False
+        tc.cache_variables["BUILD_TOOL"] = False
+        tc.cache_variables["BUILD_LIBSSL"] = self.options.build_libssl
+        tc.cache_variables["OPENSSL_NO_ASM"] = self.options.no_asm
+        # Use the pre-generated sources and assembly instead of requiring Go and Perl
+        tc.cache_variables["DISABLE_GO"] = True
+        tc.cache_variables["DISABLE_PERL"] = True
+        tc.cache_variables["ENABLE_PRE_SONAME_BUILD"] = False
+        tc.generate()
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def package(self):
+        copy(self, "LICENSE", self.source_folder, os.path.join(self.package_folder, "licenses"))
+        cmake = CMake(self)
+        cmake.install()
+        rmdir(self, os.path.join(self.package_folder, "lib", "crypto"))
+        rmdir(self, os.path.join(self.package_folder, "lib", "ssl"))
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        rmdir(self, os.path.join(self.package_folder, "share"))
+
+    def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "aws-lc")
+        self.cpp_info.set_property("pkg_config_name", "openssl")
+
+        self.cpp_info.components["crypto"].set_property("cmake_target_name", "AWS::crypto")
+        self.cpp_info.components["crypto"].set_property("pkg_config_name", "libcrypto")
+        self.cpp_info.components["crypto"].libs = ["crypto"]
+        if self.settings.os in ["Linux", "FreeBSD"]:
+            self.cpp_info.components["crypto"].system_libs = ["pthread", "dl", "m"]
+        elif self.settings.os == "Windows":
+            self.cpp_info.components["crypto"].system_libs = ["ws2_32"]
+
+        if self.options.build_libssl:
+            self.cpp_info.components["ssl"].set_property("cmake_target_name", "AWS::ssl")
+            self.cpp_info.components["ssl"].set_property("pkg_config_name", "libssl")
+            self.cpp_info.components["ssl"].libs = ["ssl"]
+            self.cpp_info.components["ssl"].requires = ["crypto"]
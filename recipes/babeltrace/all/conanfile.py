@@ -0,0 +1,89 @@
+import os
+
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.files import *
+from conan.tools.gnu import Autotools, AutotoolsDeps, AutotoolsToolchain, PkgConfigDeps
+from conan.tools.layout import basic_layout
+
+required_conan_version = ">=2.4"
+
+
+class BabeltraceConan(ConanFile):
+    name = "babeltrace"
+    description = "Babeltrace 1: Common Trace Format (CTF) reader, converter and writer library"
+    license = "MIT AND GPL-2.0-only AND LGPL-2.1-only"
+    homepage = "https://babeltrace.org"
+    topics = ("ctf", "tracing", "lttng", "perf", "trace-conversion")
+    package_type = "library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+    }
+    implements = ["auto_shared_fpic"]
+    languages = ["C"]
+
+    def layout(self):
+        basic_layout(self, src_folder="src")
+
+    def requirements(self):
+        # babeltrace/ctf-writer/*.h and babeltrace/ctf/*.h include glib.h and uuid.h
+        self.requires("glib/[^2.70.0]", transitive_headers=True)
+        self.requires("util-linux-libuuid/2.41", transitive_headers=True)
+        # Only used by the babeltrace command line tool, but checked for unconditionally by configure
+        self.requires("popt/1.19")
+
+    def validate(self):
+        if self.settings.os not in ["Linux", "FreeBSD"]:
+            raise ConanInvalidConfiguration(f"{self.ref} only supports Linux and FreeBSD")
+
+    def build_requirements(self):
+        if not self.conf.get("tools.gnu:pkg_config", default=False, check_type=str):
+            self.tool_requires("pkgconf/[>=2.2 <3]")
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+    def generate(self):
+        tc = AutotoolsToolchain(self)
+        tc.configure_args.append("--disable-python-bindings")
+        tc.configure_args.append("--disable-python-bindings-doc")
+        tc.configure_args.append("--disable-debug-info")
+        tc.configure_args.append("--disable-man-pages")
+        tc.generate()
+        AutotoolsDeps(self).generate()
+        PkgConfigDeps(self).generate()
+
+    def build(self):
+        autotools = Autotools(self)
+        autotools.configure()
+        autotools.make()
+
+    def package(self):
+        copy(self, "LICENSE", self.source_folder, os.path.join(self.package_folder, "licenses"))
+        copy(self, "*.txt", os.path.join(self.source_folder, "LICENSES"), os.path.join(self.package_folder, "licenses"))
+        autotools = Autotools(self)
+        autotools.install()
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        rmdir(self, os.path.join(self.package_folder, "share"))
+        rm(self, "*.la", os.path.join(self.package_folder, "lib"))
+
+    def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "babeltrace")
+
+        self.cpp_info.components["babeltrace_"].set_property("cmake_target_name", "babeltrace::babeltrace")
+        self.cpp_info.components["babeltrace_"].set_property("pkg_config_name", "babeltrace")
+        self.cpp_info.components["babeltrace_"].libs = ["babeltrace"]
+        self.cpp_info.components["babeltrace_"].requires = ["glib::glib-2.0", "glib::gmodule-2.0", "util-linux-libuuid::util-linux-libuuid", "popt::popt"]
+        self.cpp_info.components["babeltrace_"].system_libs = ["pthread"]
+
+        self.cpp_info.components["ctf"].set_property("cmake_target_name", "babeltrace::ctf")
+        self.cpp_info.components["ctf"].set_property("pkg_config_name", "babeltrace-ctf")
+        self.cpp_info.components["ctf"].libs = ["babeltrace-ctf"]
+        self.cpp_info.components["ctf"].requires = ["babeltrace_", "glib::glib-2.0", "util-linux-libuuid::util-linux-libuuid"]
+        self.cpp_info.components["ctf"].system_libs = ["m"]
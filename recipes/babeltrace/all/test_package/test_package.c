@@ -0,0 +1,15 @@
+#include <babeltrace/ctf-writer/clock.h>
+
+#include <stdio.h>
+
+int main(void)
+{
+    /* The CTF writer API is what perf uses for 'perf data convert --to-ctf' */
+    struct bt_ctf_clock *clock = bt_ctf_clock_create("test_clock");
+    if (!clock) {
+        return 1;
+    }
+    printf("clock frequency: %llu\n", (unsigned long long) bt_ctf_clock_get_frequency(clock));
+    bt_ctf_clock_put(clock);
+    return 0;
+}
@@ -0,0 +1,54 @@
+#include <benchmark/benchmark.h>
+#include <cblas.h>
+
+#include <cstdint>
+#include <vector>
+
+template <typename T>
+static std::vector<T> make_matrix(size_t n) {
+    std::vector<T> m(n * n);
+    uint32_t seed = 12345;
+    for (auto &x : m) {
+        seed = seed * 1103515245u + 12345u;
+        x = static_cast<T>((seed >> 16) % 1000) / T(1000);
+    }
+    return m;
+}
+
+static void BM_dgemm(benchmark::State &state) {
+    const int n = static_cast<int>(state.range(0));
+    const auto A = make_matrix<double>(n);
+    const auto B = make_matrix<double>(n);
+    std::vector<double> C(n * n);
+    for (auto _ : state) {
+        cblas_dgemm(CblasColMajor, CblasNoTrans, CblasNoTrans, n, n, n, 1.0, A.data(), n, B.data(), n, 0.0, C.data(), n);
+        benchmark::ClobberMemory();
+    }
+    state.counters["FLOPS"] = benchmark::Counter(2.0 * n * n * n, benchmark::Counter::kIsIterationInvariantRate);
+}
+BENCHMARK(BM_dgemm)->RangeMultiplier(4)->Range(64, 1024)->ArgName("n")->UseRealTime();
+
+static void BM_sgemm(benchmark::State &state) {
+    const int n = static_cast<int>(state.range(0));
+    const auto A = make_matrix<float>(n);
+    const auto B = make_matrix<float>(n);
+    std::vector<float> C(n * n);
+    for (auto _ : state) {
+        cblas_sgemm(CblasColMajor, CblasNoTrans, CblasNoTrans, n, n, n, 1.0f, A.data(), n, B.data(), n, 0.0f, C.data(), n);
+        benchmark::ClobberMemory();
+    }
+    state.counters["FLOPS"] = benchmark::Counter(2.0 * n * n * n, benchmark::Counter::kIsIterationInvariantRate);
+}
+BENCHMARK(BM_sgemm)->RangeMultiplier(4)->Range(64, 1024)->ArgName("n")->UseRealTime();
+
+static void BM_dgemv(benchmark::State &state) {
+    const int n = static_cast<int>(state.range(0));
+    const auto A = make_matrix<double>(n);
+    std::vector<double> x(n, 1.0), y(n);
+    for (auto _ : state) {
+        cblas_dgemv(CblasColMajor, CblasNoTrans, n, n, 1.0, A.data(), n, x.data(), 1, 0.0, y.data(), 1);
+        benchmark::ClobberMemory();
+    }
+    state.counters["FLOPS"] = benchmark::Counter(2.0 * n * n, benchmark::Counter::kIsIterationInvariantRate);
+}
+BENCHMARK(BM_dgemv)->Arg(1024)->Arg(4096)->ArgName("n")->UseRealTime();
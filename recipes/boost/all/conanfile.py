@@ -77,6 +77,8 @@ class BoostConan(ConanFile):
         "error_code_header_only": [True, False],
         "system_no_deprecated": [True, False],
         "asio_no_deprecated": [True, False],
+        "asio_io_uring": [True, False],
+        "asio_disable_epoll": [True, False],
         "filesystem_no_deprecated": [True, False],
         "filesystem_use_std_fs": [True, False],
         "filesystem_version": [None, "3", "4"],
@@ -113,6 +115,8 @@ class BoostConan(ConanFile):
         "error_code_header_only": False,
         "system_no_deprecated": False,
         "asio_no_deprecated": False,
+        "asio_io_uring": False,
+        "asio_disable_epoll": False,
         "filesystem_no_deprecated": False,
         "filesystem_use_std_fs": False,
         "filesystem_version": None,
@@ -292,6 +296,11 @@ class BoostConan(ConanFile):
         if self.settings.os == "Windows":
             del self.options.with_stacktrace_backtrace
 
+        # Asio's io_uring backend is Linux-only and available since Boost 1.78
+        if self.settings.os != "Linux" or Version(self.version) < "1.78.0":
+            del self.options.asio_io_uring
+            del self.options.asio_disable_epoll
+
         # iconv is off by default on Windows and Solaris
         if self._is_windows_platform or self.settings.os == "SunOS":
             self.options.i18n_backend_iconv = "off"
@@ -414,6 +423,8 @@ class BoostConan(ConanFile):
             self.options.rm_safe("with_stacktrace_backtrace")
         if not self.options.with_fiber:
             self.options.rm_safe("numa")
+        if not self.options.get_safe("asio_io_uring"):
+            self.options.rm_safe("asio_disable_epoll")
 
     def _enable_transitive_dependencies(self):
         while True:
@@ -572,6 +583,10 @@ class BoostConan(ConanFile):
     def _with_stacktrace_backtrace(self):
         return self.options.get_safe("with_stacktrace_backtrace", False)
 
+    @property
+    def _with_io_uring(self):
+        return self.options.get_safe("asio_io_uring", False)
+
     def requirements(self):
         if self._with_zlib:
             self.requires("zlib-ng/[^2.0]")
@@ -583,6 +598,8 @@ class BoostConan(ConanFile):
             self.requires("zstd/[>=1.5 <1.6]")
         if self._with_stacktrace_backtrace:
             self.requires("libbacktrace/cci.20210118", transitive_headers=True, transitive_libs=True)
+        if self._with_io_uring:
+            self.requires("liburing/[^2.4]", transitive_headers=True, transitive_libs=True)
         if self._with_icu:
             self.requires("icu/[*]")
         if self._with_iconv:
@@ -594,7 +611,14 @@ class BoostConan(ConanFile):
 
     def package_id(self):
         if self.info.options.header_only:
-            self.info.clear()
+            if self.info.options.get_safe("asio_io_uring"):
+                # The Asio backend is selected at compile time and affects the ABI of consumers
+                self.info.settings.clear()
+                for opt, _ in list(self.info.options.items()):
+                    if opt not in ["asio_io_uring", "asio_disable_epoll"]:
+                        delattr(self.info.options, opt)
+            else:
+                self.info.clear()
         else:
             del self.info.options.build_all
             del self.info.options.debug_level
@@ -1134,6 +1158,10 @@ class BoostConan(ConanFile):
             flags.append("define=BOOST_SYSTEM_NO_DEPRECATED=1")
         if self.options.asio_no_deprecated:
             flags.append("define=BOOST_ASIO_NO_DEPRECATED=1")
+        if self._with_io_uring:
+            flags.append("define=BOOST_ASIO_HAS_IO_URING=1")
+            if self.options.asio_disable_epoll:
+                flags.append("define=BOOST_ASIO_DISABLE_EPOLL=1")
         if self.options.filesystem_no_deprecated:
             flags.append("define=BOOST_FILESYSTEM_NO_DEPRECATED=1")
         if self.options.filesystem_use_std_fs:
@@ -1356,6 +1384,12 @@ class BoostConan(ConanFile):
             cppflags += " ".join(f"-I{p}" for p in backtrace_aggregated_cpp_info.includedirs) + " "
             ldflags += " ".join(f"-L{p}" for p in backtrace_aggregated_cpp_info.libdirs) + " "
 
+        if self._with_io_uring:
+            liburing_cpp_info = self.dependencies["liburing"].cpp_info.aggregated_components()
+            cppflags += " ".join(f"-I{p}" for p in liburing_cpp_info.includedirs) + " "
+            ldflags += " ".join(f"-L{p}" for p in liburing_cpp_info.libdirs) + " "
+            ldflags += " ".join(f"-l{lib}" for lib in liburing_cpp_info.libs) + " "
+
         if cxxflags.strip():
             contents += f'<cxxflags>"{cxxflags.strip()}" '
         if cflags.strip():
@@ -1526,6 +1560,12 @@ class BoostConan(ConanFile):
         if self.options.asio_no_deprecated:
             self.cpp_info.components["headers"].defines.append("BOOST_ASIO_NO_DEPRECATED")
 
+        if self._with_io_uring:
+            self.cpp_info.components["headers"].defines.append("BOOST_ASIO_HAS_IO_URING")
+            if self.options.asio_disable_epoll:
+                self.cpp_info.components["headers"].defines.append("BOOST_ASIO_DISABLE_EPOLL")
+            self.cpp_info.components["headers"].requires.append("liburing::liburing")
+
         if self.options.filesystem_no_deprecated:
             self.cpp_info.components["headers"].defines.append("BOOST_FILESYSTEM_NO_DEPRECATED")
 
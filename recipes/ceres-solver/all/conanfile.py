@@ -186,6 +186,7 @@ class CeresSolverConan(ConanFile):
                             "CMAKE_CUDA_ARCHITECTURES_ignored")
 
     def generate(self):
+        self._utils.configure_unity_build(self)
         tc = CMakeToolchain(self)
         tc.variables["BUILD_TESTING"] = False
         tc.variables["BUILD_DOCUMENTATION"] = False
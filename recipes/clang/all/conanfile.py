@@ -36,6 +36,12 @@ class ClangConan(ConanFile):
 
     no_copy_source = True
 
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -52,6 +58,7 @@ class ClangConan(ConanFile):
         # llvm-tblgen
         if not can_run(self):
             self.tool_requires("llvm-core/<host_version>")
+        self._utils.linker_tool_requires(self)
 
     def validate(self):
         check_min_cppstd(self, 17)
@@ -63,6 +70,7 @@ class ClangConan(ConanFile):
         apply_conandata_patches(self)
 
     def generate(self):
+        self._utils.configure_linker(self)
         if can_run(self):
             # for llvm-tblgen
             VirtualRunEnv(self).generate(scope="build")
@@ -29,8 +29,10 @@ class CoinClpConan(ConanFile):
         "enable_inexact_solver": [True, False],
         "with_asl": [True, False],
         "with_mumps": [True, False],
+        "mumps_ordering": ["metis", "scotch", "both"],
         "with_hsl": [True, False],
         "with_spral": [True, False],
+        "with_pardiso_mkl": [True, False],
     }
     default_options = {
         "shared": False,
@@ -40,11 +42,24 @@ class CoinClpConan(ConanFile):
         "enable_inexact_solver": False,
         "with_asl": False,
         "with_mumps": False,
+        "mumps_ordering": "metis",
         "with_hsl": False,
         "with_spral": True,
+        "with_pardiso_mkl": False,
+    }
+    options_description = {
+        "mumps_ordering": "Fill-reducing ordering libraries to build MUMPS with, sets the coin-mumps/*:ordering option",
+        "with_pardiso_mkl": ("Enable the multithreaded PARDISO linear solver from oneMKL (linear_solver=pardisomkl). "
+                             "The threading layer is selected by the onemkl/*:threading option."),
     }
     implements = ["auto_shared_fpic"]
 
+    def configure(self):
+        if self.options.with_mumps:
+            self.options["coin-mumps"].ordering = self.options.mumps_ordering
+        else:
+            self.options.rm_safe("mumps_ordering")
+
     def layout(self):
         basic_layout(self, src_folder="src")
 
@@ -59,7 +74,8 @@ class CoinClpConan(ConanFile):
             self.requires("coin-hsl/[*]")
         if self.options.with_spral:
             self.requires("spral/[*]")
-        # TODO: optionally use MKL instead of OpenBLAS for pardisomkl solver support
+        if self.options.with_pardiso_mkl:
+            self.requires("onemkl/[*]")
 
     @property
     def _int_size(self):
@@ -72,6 +88,9 @@ class CoinClpConan(ConanFile):
             raise ConanInvalidConfiguration("ASL solver requires double precision")
         if self.options.with_spral and (self.options.precision != "double" or self._int_size != 32):
             raise ConanInvalidConfiguration("SPRAL solver requires double precision and 32-bit integers")
+        if self.options.with_pardiso_mkl and self.dependencies["onemkl"].options.interface != self.dependencies["blas"].options.interface:
+            raise ConanInvalidConfiguration(f"with_pardiso_mkl requires -o onemkl/*:interface={self.dependencies['blas'].options.interface} "
+                                            f"to match the {self._int_size}-bit integers of blas")
 
     def build_requirements(self):
         self.tool_requires("coin-buildtools/[*]")
@@ -119,6 +138,8 @@ class CoinClpConan(ConanFile):
             "--disable-f77",
             "--disable-java",
         ]
+        if self.options.with_pardiso_mkl:
+            tc.configure_args.append("--enable-pardisomkl")
 
         if self.options.with_spral:
             cflags, ldflags = self._flags_from_pc("spral")
@@ -126,6 +147,10 @@ class CoinClpConan(ConanFile):
             tc.configure_args.append(f"--with-spral-lflags={ldflags}")
 
         cflags, ldflags = self._flags_from_pc("lapack")
+        if self.options.with_pardiso_mkl and self.dependencies["lapack"].options.provider != "mkl":
+            # Ipopt looks for MKL's PARDISO in the Lapack libraries
+            _, mkl_ldflags = self._flags_from_pc("mkl")
+            ldflags = f"{ldflags} {mkl_ldflags}"
         tc.configure_args.append(f"--with-lapack-cflags={cflags}")
         tc.configure_args.append(f"--with-lapack-lflags={ldflags}")
 
@@ -173,6 +198,8 @@ class CoinClpConan(ConanFile):
             self.cpp_info.components["ipopt"].requires.append("coin-hsl::coin-hsl")
         if self.options.with_spral:
             self.cpp_info.components["ipopt"].requires.append("spral::spral")
+        if self.options.with_pardiso_mkl:
+            self.cpp_info.components["ipopt"].requires.append("onemkl::mkl")
         if not self.options.shared:
             if self.settings.os in ["Linux", "FreeBSD"]:
                 self.cpp_info.components["ipopt"].system_libs = ["m", "dl"]
@@ -26,11 +26,16 @@ class CoinMumpsConan(ConanFile):
         "precision": ["single", "double", "all"],
         "with_openmp": [True, False],
         "with_pthread": [True, False],
+        "ordering": ["metis", "scotch", "both"],
     }
     default_options = {
         "precision": "double",
         "with_openmp": True,
         "with_pthread": True,
+        "ordering": "metis",
+    }
+    options_description = {
+        "ordering": "Fill-reducing ordering libraries to support in addition to the built-in AMD, AMF, QAMD and PORD orderings",
     }
     languages = ["C"]
 
@@ -39,6 +44,14 @@ class CoinMumpsConan(ConanFile):
         executables = self.conf.get("tools.build:compiler_executables", default={}, check_type=dict)
         return executables.get("fortran")
 
+    @property
+    def _with_metis(self):
+        return self.options.ordering in ["metis", "both"]
+
+    @property
+    def _with_scotch(self):
+        return self.options.ordering in ["scotch", "both"]
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -48,10 +61,25 @@ class CoinMumpsConan(ConanFile):
     def requirements(self):
         self.requires("openmpi/[>=4 <6]", transitive_headers=True, transitive_libs=True)
         self.requires("lapack/latest")
-        self.requires("metis/[^5.2.1]")
+        if self._with_metis:
+            self.requires("metis/[^5.2.1]")
+        if self._with_scotch:
+            self.requires("scotch/[^7.0]")
         if self.options.with_openmp:
             self.requires("openmp/system")
 
+    @property
+    def _int_size(self):
+        return 32 if self.dependencies["blas"].options.interface == "lp64" else 64
+
+    def validate(self):
+        if self._with_scotch:
+            if not self.dependencies["scotch"].options.esmumps:
+                raise ConanInvalidConfiguration("-o scotch/*:esmumps=True is required for SCOTCH ordering support")
+            if int(self.dependencies["scotch"].options.intsize) != self._int_size:
+                raise ConanInvalidConfiguration(f"-o scotch/*:intsize={self._int_size} is required to match the "
+                                                f"{self._int_size}-bit integers of the blas interface")
+
     def build_requirements(self):
         if not self.conf.get("tools.gnu:pkg_config", check_type=str):
             self.tool_requires("pkgconf/[>=2.2 <3]")
@@ -89,20 +117,28 @@ class CoinMumpsConan(ConanFile):
 
         tc = AutotoolsToolchain(self)
         yes_no = lambda v: "yes" if v else "no"
-        int_size = 32 if self.dependencies["blas"].options.interface == "lp64" else 64
         tc.configure_args.extend([
             "--with-lapack=yes",
-            "--with-metis=yes",
+            f"--with-metis={yes_no(self._with_metis)}",
             f"--enable-pthread-mumps={yes_no(self.options.with_pthread)}",
             f"--enable-openmp={yes_no(self.options.with_openmp)}",
             f"--with-precision={self.options.precision}",
-            f"--with-intsize={int_size}",
+            f"--with-intsize={self._int_size}",
             f"F77={self._fortran_compiler}",
         ])
         cflags, ldflags = self._flags_from_pc("lapack")
         tc.configure_args.append(f"--with-lapack-cflags={cflags}")
         tc.configure_args.append(f"--with-lapack-lflags={ldflags}")
-        tc.generate()
+        env = tc.environment()
+        if self._with_scotch:
+            # The build scripts only support METIS, enable SCOTCH via the MUMPS preprocessor defines instead.
+            # CPPFLAGS is used for both the C and the preprocessed Fortran sources.
+            tc.extra_defines.append("scotch")
+            cflags, ldflags = self._flags_from_pc("scotch-esmumps")
+            tc.extra_cflags.append(cflags)
+            env = tc.environment()
+            env.append("LIBS", ldflags)
+        tc.generate(env)
 
     def build(self):
         autotools = Autotools(self)
@@ -137,7 +173,10 @@ class CoinMumpsConan(ConanFile):
         self.cpp_info.requires = [
             "openmpi::ompi-c",
             "lapack::lapack",
-            "metis::metis",
         ]
+        if self._with_metis:
+            self.cpp_info.requires.append("metis::metis")
+        if self._with_scotch:
+            self.cpp_info.requires.extend(["scotch::scotch", "scotch::esmumps"])
         if self.options.with_openmp:
             self.cpp_info.requires.append("openmp::openmp")
@@ -14,9 +14,13 @@ sys.path.append(str(Path(__file__).resolve().parent))
 
 from conan import ConanFile
 
+from src.benchmark import benchmarks_enabled, require_benchmark, run_benchmark, normalize_benchmark_results  # NOQA
+from src.debug_info import configure_debug_info, debug_info_package_id, package_debug_info  # NOQA
 from src.limit_jobs import limit_build_jobs, monitor_memory_usage  # NOQA
+from src.linker import linker_tool_requires, configure_linker  # NOQA
 from src.meson_msvc import fix_msvc_libnames, _fix_libnames  # NOQA
 from src.python_venv import PythonVenv, pip_install  # NOQA
+from src.unity_build import configure_unity_build  # NOQA
 
 required_conan_version = ">=2.1"
 
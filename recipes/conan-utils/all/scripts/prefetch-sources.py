@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Downloads the source archives of all recipes in a dependency graph concurrently into a local,
+content-addressed source mirror, which can then be used for offline builds.
+
+The mirror uses the same layout as Conan's download cache (<mirror>/s/<sha256> plus a <sha256>.json summary),
+so no recipe changes are needed to use it. Either point the download cache at it directly, by adding
+  core.sources:download_cache=/path/to/mirror
+to global.conf (or passing -cc core.sources:download_cache=/path/to/mirror to conan commands),
+or serve <mirror>/s/ over HTTP and use it as a backup sources origin:
+  core.sources:download_urls=["https://my-mirror/", "origin"]
+
+Examples:
+  conan graph info --requires=opencv/4.12.0 -o "opencv/*:with_cuda=True" --format=json > graph.json
+  ./prefetch-sources.py graph.json --mirror /srv/conan-sources -j 16
+  ./prefetch-sources.py conan.lock --mirror /srv/conan-sources --nvidia-platform linux-x86_64 --nvidia-platform linux-sbsa
+
+Inputs can be 'conan graph info --format=json' output or Conan lockfiles. For lockfiles, the recipes are
+looked up in this repository. Besides the conandata.yml 'sources' entries, the multi-part Qt sources
+(sources/<version>.yml) and the archives of NVIDIA redistributable packages (conan-cuda) are collected as well.
+Downloads are verified against their sha256, deduplicated across versions and packages,
+and interrupted downloads are resumed on the next run. Sources without a sha256 cannot be stored in
+the mirror; they are reported and make the script exit with an error, so that an incomplete mirror
+is never mistaken for a complete one.
+"""
+import argparse
+import hashlib
+import json
+import pathlib
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import requests
+import yaml
+
+recipes_root = pathlib.Path(__file__).resolve().parent.parent.parent.parent
+
+
+@dataclass
+class Recipe:
+    ref: str
+    name: str
+    version: str
+    recipe_folder: pathlib.Path
+    sources: Optional[object]
+
+
+@dataclass
+class Source:
+    sha256: str
+    urls: List[str]
+    # reference -> urls as listed in the recipe, used for the <sha256>.json summary
+    references: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def _load_recipe_from_repo(ref: str) -> Optional[Recipe]:
+    ref = ref.split("#")[0].split("%")[0].split("@")[0]
+    name, version = ref.split("/", 1)
+    config_path = recipes_root / name / "config.yml"
+    if not config_path.is_file():
+        print(f"WARNING: {ref}: recipe not found in {recipes_root}", file=sys.stderr)
+        return None
+    version_info = yaml.safe_load(config_path.read_text())["versions"].get(version)
+    if version_info is None:
+        print(f"WARNING: {ref}: version not found in {config_path}", file=sys.stderr)
+        return None
+    recipe_folder = recipes_root / name / version_info["folder"]
+    conandata_path = recipe_folder / "conandata.yml"
+    conandata = yaml.safe_load(conandata_path.read_text()) if conandata_path.is_file() else {}
+    sources = (conandata or {}).get("sources", {}).get(version)
+    return Recipe(ref, name, version, recipe_folder, sources)
+
+
+def load_recipes(path: pathlib.Path) -> List[Recipe]:
+    data = json.loads(path.read_text())
+    recipes = []
+    if "graph" in data:
+        for node in data["graph"]["nodes"].values():
+            if not node.get("ref") or not node.get("recipe_folder"):
+                continue
+            ref = node["ref"].split("#")[0]
+            version = str(node["version"])
+            sources = (node.get("conandata") or {}).get("sources", {}).get(version)
+            recipes.append(Recipe(ref, node["name"], version, pathlib.Path(node["recipe_folder"]), sources))
+    else:
+        for key in ["requires", "build_requires"]:
+            for ref in data.get(key, []):
+                recipe = _load_recipe_from_repo(ref)
+                if recipe:
+                    recipes.append(recipe)
+    return recipes
+
+
+def _iter_source_entries(sources):
+    """Yield all {url, sha256} entries in a possibly nested conandata 'sources' value."""
+    if isinstance(sources, dict):
+        if "url" in sources:
+            yield sources
+            return
+        for value in sources.values():
+            yield from _iter_source_entries(value)
+    elif isinstance(sources, list):
+        for value in sources:
+            yield from _iter_source_entries(value)
+
+
+def _qt_source_entries(recipe: Recipe):
+    """Equivalent of QtConan._get_download_info() for all modules."""
+    archive_info_path = recipe.recipe_folder / "sources" / f"{recipe.version}.yml"
+    mirrors_path = recipe.recipe_folder / "mirrors.txt"
+    if not archive_info_path.is_file() or not mirrors_path.is_file():
+        return
+    mirrors = mirrors_path.read_text().strip().split()
+    archive_info = yaml.safe_load(archive_info_path.read_text())
+    major, minor = recipe.version.split(".")[:2]
+    for component, sha256 in archive_info["hashes"].items():
+        if component in archive_info.get("git_only", []):
+            urls = [f"https://github.com/qt/{component}/archive/refs/tags/v{recipe.version}.tar.gz"]
+        else:
+            urls = [f"{base_url}qt/{major}.{minor}/{recipe.version}/submodules/{component}-everywhere-src-{recipe.version}.tar.xz"
+                    for base_url in mirrors]
+        yield {"url": urls, "sha256": sha256}
+
+
+def _is_nvidia_redist(recipe: Recipe):
+    return (isinstance(recipe.sources, dict) and isinstance(recipe.sources.get("url"), str)
+            and "redistrib" in recipe.sources["url"] and recipe.sources["url"].endswith(".json"))
+
+
+def _nvidia_package_names(recipe: Recipe, redistrib_info: Dict):
+    conanfile = recipe.recipe_folder / "conanfile.py"
+    names = []
+    if conanfile.is_file():
+        names = re.findall(r'download_package\(\s*"([\w-]+)"', conanfile.read_text())
+    names = [n for n in names if n in redistrib_info]
+    if not names:
+        # Package names are not literals in the recipe, fall back to all packages of the same version
+        names = [k for k, v in redistrib_info.items() if isinstance(v, dict) and v.get("version") == recipe.version]
+    return names
+
+
+def _nvidia_source_entries(recipe: Recipe, redistrib_info: Dict, platforms: List[str]):
+    base_url = recipe.sources["url"].rsplit("/", 1)[0] + "/"
+    for package_name in _nvidia_package_names(recipe, redistrib_info):
+        package_info = redistrib_info[package_name]
+        for platform_id in platforms:
+            archive_info = package_info.get(platform_id)
+            if not archive_info:
+                continue
+            variants = archive_info.values() if "cuda_variant" in package_info else [archive_info]
+            for variant in variants:
+                yield {"url": base_url + variant["relative_path"], "sha256": variant["sha256"]}
+
+
+def _add_entry(sources: Dict[str, Source], recipe: Recipe, entry):
+    urls = entry["url"] if isinstance(entry["url"], list) else [entry["url"]]
+    sha256 = entry["sha256"].lower()
+    source = sources.setdefault(sha256, Source(sha256, []))
+    source.urls.extend(url for url in urls if url not in source.urls)
+    recorded = source.references.setdefault(recipe.ref, [])
+    recorded.extend(url for url in urls if url not in recorded)
+
+
+def collect_sources(recipes: List[Recipe]) -> Tuple[Dict[str, Source], List[str]]:
+    """Return the sources by sha256 and the '<ref>: <url>' descriptions of the sources without a sha256."""
+    sources = {}
+    unverified = []
+    for recipe in recipes:
+        for entry in _iter_source_entries(recipe.sources):
+            if "sha256" not in entry:
+                urls = entry["url"] if isinstance(entry["url"], list) else [entry["url"]]
+                unverified.extend(f"{recipe.ref}: {url}" for url in urls)
+                continue
+            _add_entry(sources, recipe, entry)
+        if recipe.name == "qt":
+            for entry in _qt_source_entries(recipe):
+                _add_entry(sources, recipe, entry)
+    return sources, unverified
+
+
+def _sha256sum(path: pathlib.Path):
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _update_summary(path: pathlib.Path, source: Source):
+    """Create or update the <sha256>.json summary file used by Conan's download cache."""
+    summary_path = path.with_name(path.name + ".json")
+    if summary_path.is_file():
+        summary = json.loads(summary_path.read_text())
+    else:
+        summary = {"references": {}, "timestamp": time.time()}
+    for ref, urls in source.references.items():
+        recorded = summary["references"].setdefault(ref, [])
+        recorded.extend(url for url in urls if url not in recorded)
+    summary_path.write_text(json.dumps(summary))
+
+
+def fetch(source: Source, mirror: pathlib.Path, session: requests.Session, retries=2) -> str:
+    path = mirror / "s" / source.sha256
+    if path.is_file():
+        _update_summary(path, source)
+        return "cached"
+    partial = path.with_name(path.name + ".part")
+    errors = []
+    for url in source.urls:
+        for _ in range(retries + 1):
+            try:
+                offset = partial.stat().st_size if partial.is_file() else 0
+                headers = {"Range": f"bytes={offset}-"} if offset else {}
+                with session.get(url, headers=headers, stream=True, timeout=60) as r:
+                    r.raise_for_status()
+                    if offset and r.status_code != 206:
+                        # Server does not support resuming
+                        offset = 0
+                    with partial.open("ab" if offset else "wb") as f:
+                        for chunk in r.iter_content(chunk_size=1 << 20):
+                            f.write(chunk)
+                actual = _sha256sum(partial)
+                if actual != source.sha256:
+                    partial.unlink()
+                    raise ValueError(f"sha256 mismatch: expected {source.sha256}, got {actual}")
+                partial.rename(path)
+                _update_summary(path, source)
+                return "downloaded"
+            except requests.HTTPError as e:
+                errors.append(f"{url}: {e}")
+                break
+            except Exception as e:
+                errors.append(f"{url}: {e}")
+    raise RuntimeError("; ".join(errors))
+
+
+def fetch_all(sources: Dict[str, Source], mirror: pathlib.Path, jobs: int) -> List[str]:
+    failed = []
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=jobs, pool_maxsize=jobs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(fetch, source, mirror, session): source for source in sources.values()}
+        for i, future in enumerate(as_completed(futures), 1):
+            source = futures[future]
+            refs = ", ".join(sorted(source.references))
+            try:
+                status = future.result()
+                print(f"[{i}/{len(futures)}] {status}: {source.sha256[:12]} ({refs})", flush=True)
+            except Exception as e:
+                print(f"[{i}/{len(futures)}] FAILED: {source.sha256[:12]} ({refs}): {e}", file=sys.stderr, flush=True)
+                failed.append(source.sha256)
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="+", type=pathlib.Path,
+                        help="'conan graph info --format=json' output files or Conan lockfiles")
+    parser.add_argument("--mirror", required=True, type=pathlib.Path, help="source mirror folder")
+    parser.add_argument("-j", "--jobs", type=int, default=8, help="number of concurrent downloads")
+    parser.add_argument("--nvidia-platform", action="append",
+                        help="NVIDIA redistributable platform to fetch archives for, can be repeated "
+                             "(default: linux-x86_64)")
+    args = parser.parse_args()
+
+    mirror = args.mirror.resolve()
+    (mirror / "s").mkdir(parents=True, exist_ok=True)
+    recipes = []
+    for path in args.inputs:
+        recipes.extend(load_recipes(path))
+    sources, unverified = collect_sources(recipes)
+    print(f"Found {len(sources)} unique source archives in {len(recipes)} recipes")
+    for description in unverified:
+        print(f"WARNING: no sha256, not mirrored: {description}", file=sys.stderr)
+    failed = fetch_all(sources, mirror, args.jobs)
+
+    # The NVIDIA redistrib JSON files have been fetched by now and list the actual package archives
+    nvidia_sources = {}
+    for recipe in recipes:
+        if not _is_nvidia_redist(recipe):
+            continue
+        redistrib_path = mirror / "s" / recipe.sources["sha256"]
+        if not redistrib_path.is_file():
+            continue
+        redistrib_info = json.loads(redistrib_path.read_text(encoding="utf8"))
+        for entry in _nvidia_source_entries(recipe, redistrib_info, args.nvidia_platform or ["linux-x86_64"]):
+            _add_entry(nvidia_sources, recipe, entry)
+    if nvidia_sources:
+        print(f"Found {len(nvidia_sources)} NVIDIA redistributable archives")
+        failed += fetch_all(nvidia_sources, mirror, args.jobs)
+
+    if failed:
+        print(f"{len(failed)} downloads failed", file=sys.stderr)
+    if unverified:
+        print(f"{len(unverified)} sources were skipped because they have no sha256, "
+              "the mirror is incomplete", file=sys.stderr)
+    if failed or unverified:
+        sys.exit(1)
+    print(f"Done. Use the mirror by adding 'core.sources:download_cache={mirror}' to global.conf "
+          f"or by passing '-cc core.sources:download_cache={mirror}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Runs the opt-in micro-benchmarks of test_package recipes for several variants of a package
+and prints a comparison of the normalized results.
+
+Examples:
+  ./run-benchmarks.py zstd/1.5.7 -v "zstd/*:threading=True" -v "zstd/*:threading=False"
+  ./run-benchmarks.py blas/latest -v "blas/*:provider=openblas" -v "blas/*:provider=blis" -- -pr:h myprofile
+  ./run-benchmarks.py --compare-only benchmark_results/
+
+Each variant is a comma-separated list of Conan options. Any arguments after '--' are passed to 'conan test' as-is.
+"""
+import argparse
+import json
+import pathlib
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List
+
+import yaml
+
+recipes_root = pathlib.Path(__file__).resolve().parent.parent.parent.parent
+
+
+def find_test_package(name: str, version: str) -> pathlib.Path:
+    config = yaml.safe_load(recipes_root.joinpath(name, "config.yml").read_text())
+    version_info = config["versions"].get(version)
+    if version_info is None:
+        raise ValueError(f"{name}/{version} is not available in {recipes_root}")
+    return recipes_root / name / version_info["folder"] / "test_package"
+
+
+def run_variant(ref: str, options: List[str], output_folder: pathlib.Path, extra_args: List[str]):
+    name, version = ref.split("/", 1)
+    cmd = [
+        "conan", "test", str(find_test_package(name, version)), ref,
+        "--build=missing",
+        "-c", "user.benchmark:enabled=True",
+        "-c", f"user.benchmark:output_folder={output_folder}",
+    ]
+    for option in options:
+        cmd += ["-o", option]
+    cmd += extra_args
+    print(" ".join(cmd), flush=True)
+    subprocess.run(cmd, check=True)
+
+
+def load_results(output_folder: pathlib.Path) -> Dict[str, List[Dict]]:
+    results = defaultdict(list)
+    for path in sorted(output_folder.glob("*.json")):
+        data = json.loads(path.read_text())
+        if "schema_version" not in data:
+            continue
+        results[data["reference"]].append(data)
+    return results
+
+
+def variant_label(result: Dict, varying_options: List[str]) -> str:
+    if not varying_options:
+        return result["package_id"][:8]
+    return ",".join(f"{k}={result['options'].get(k)}" for k in varying_options)
+
+
+def compare(results: Dict[str, List[Dict]]):
+    for ref, variants in results.items():
+        all_options = sorted({k for v in variants for k in v["options"]})
+        varying_options = [k for k in all_options if len({v["options"].get(k) for v in variants}) > 1]
+        labels = [variant_label(v, varying_options) for v in variants]
+        print(f"\n{ref}")
+        for i, label in enumerate(labels):
+            print(f"  [{i}] {label}")
+        times = defaultdict(dict)
+        for i, variant in enumerate(variants):
+            for b in variant["benchmarks"]:
+                if b["run_type"] == "aggregate" and b.get("aggregate") != "median":
+                    continue
+                times[b["name"]][i] = b["real_time_ns"]
+        name_width = max([len(name) for name in times] + [len("benchmark")])
+        header = "".join(f"{f'[{i}] ns (ratio)':>24}" for i in range(len(variants)))
+        print(f"  {'benchmark':<{name_width}}{header}  fastest")
+        for name, per_variant in times.items():
+            best = min(per_variant, key=per_variant.get)
+            cols = []
+            for i in range(len(variants)):
+                t = per_variant.get(i)
+                cell = "-" if t is None else f"{t:.1f} ({t / per_variant[best]:.2f}x)"
+                cols.append(f"{cell:>24}")
+            print(f"  {name:<{name_width}}{''.join(cols)}  [{best}]")
+
+
+def main():
+    argv = sys.argv[1:]
+    extra_args = []
+    if "--" in argv:
+        extra_args = argv[argv.index("--") + 1:]
+        argv = argv[:argv.index("--")]
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("reference", nargs="?", help="package reference to benchmark, e.g. zstd/1.5.7")
+    parser.add_argument("-v", "--variant", action="append", default=[],
+                        help="comma-separated options for a package variant, can be repeated")
+    parser.add_argument("-o", "--output-folder", default="benchmark_results",
+                        help="folder for the normalized JSON results")
+    parser.add_argument("--compare-only", metavar="FOLDER",
+                        help="only compare the results already stored in the given folder")
+    args = parser.parse_args(argv)
+
+    if args.compare_only:
+        compare(load_results(pathlib.Path(args.compare_only)))
+        return
+    if not args.reference:
+        parser.error("a package reference is required")
+
+    output_folder = pathlib.Path(args.output_folder).resolve()
+    output_folder.mkdir(parents=True, exist_ok=True)
+    for variant in args.variant or [""]:
+        options = [o for o in variant.split(",") if o]
+        run_variant(args.reference, options, output_folder, extra_args)
+    compare(load_results(output_folder))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Opt-in micro-benchmarks for test_package recipes of performance-sensitive libraries.
+
+Convention: a test_package that supports benchmarks calls require_benchmark() in requirements(),
+builds an optional 'benchmark_package' target based on Google Benchmark when the WITH_BENCHMARK CMake variable is set
+to benchmarks_enabled() and runs it with run_benchmark() in test().
+Enable with '-c user.benchmark:enabled=True'. See scripts/run-benchmarks.py for comparing package variants.
+"""
+import json
+from pathlib import Path
+
+from conan import ConanFile
+from conan.tools.files import load, save
+
+# Google Benchmark reports times in the unit selected per benchmark
+_TIME_UNITS_TO_NS = {
+    "ns": 1,
+    "us": 1e3,
+    "ms": 1e6,
+    "s": 1e9,
+}
+
+# Fields of Google Benchmark's JSON output that are not user-defined counters
+_BENCHMARK_FIELDS = {
+    "name", "family_index", "per_family_instance_index", "run_name", "run_type", "repetitions",
+    "repetition_index", "threads", "iterations", "real_time", "cpu_time", "time_unit",
+    "bytes_per_second", "items_per_second", "aggregate_name", "aggregate_unit", "label", "error_occurred",
+    "error_message",
+}
+
+
+def benchmarks_enabled(conanfile: ConanFile):
+    """
+    Whether the opt-in benchmark mode of test_package recipes is enabled with
+    the user.benchmark:enabled conf.
+    """
+    return conanfile.conf.get("user.benchmark:enabled", default=False, check_type=bool)
+
+
+def require_benchmark(conanfile: ConanFile):
+    """
+    Add Google Benchmark as a requirement of a test_package if benchmarks are enabled.
+    To be called from requirements().
+    """
+    if benchmarks_enabled(conanfile):
+        conanfile.requires("benchmark/[^1.8]")
+
+
+def run_benchmark(conanfile: ConanFile, bin_path, args=None):
+    """
+    Run a Google Benchmark executable built by a test_package and store its results as normalized JSON.
+
+    The results are written to <user.benchmark:output_folder>/<name>-<version>-<package_id>.json
+    (the test_package build folder by default) and are keyed by the tested package reference,
+    its options and settings, so that results for different package variants can be compared directly.
+    Use user.benchmark:filter and user.benchmark:min_time confs to limit the set of benchmarks and their duration.
+    """
+    dependency = _tested_dependency(conanfile)
+    raw_json = Path(conanfile.build_folder, "benchmark_raw.json")
+    args = list(args or [])
+    args += [f'--benchmark_out="{raw_json}"', "--benchmark_out_format=json"]
+    benchmark_filter = conanfile.conf.get("user.benchmark:filter", check_type=str)
+    if benchmark_filter:
+        args.append(f'--benchmark_filter="{benchmark_filter}"')
+    min_time = conanfile.conf.get("user.benchmark:min_time", check_type=str)
+    if min_time:
+        args.append(f"--benchmark_min_time={min_time}")
+    conanfile.run(f'"{bin_path}" {" ".join(args)}', env="conanrun")
+
+    result = normalize_benchmark_results(json.loads(load(conanfile, raw_json)), dependency)
+    output_folder = conanfile.conf.get("user.benchmark:output_folder", default=conanfile.build_folder, check_type=str)
+    ref = dependency.ref
+    output_path = Path(output_folder, f"{ref.name}-{ref.version}-{dependency.pref.package_id}.json")
+    save(conanfile, output_path, json.dumps(result, indent=2, sort_keys=True))
+    conanfile.output.info(f"Saved benchmark results to {output_path}")
+    return output_path
+
+
+def normalize_benchmark_results(raw, dependency):
+    """
+    Convert the JSON output of Google Benchmark to a stable format with all times in nanoseconds.
+    """
+    context = raw.get("context", {})
+    benchmarks = []
+    for b in raw.get("benchmarks", []):
+        if b.get("error_occurred"):
+            continue
+        scale = _TIME_UNITS_TO_NS[b.get("time_unit", "ns")]
+        entry = {
+            "name": b["name"],
+            "run_type": b.get("run_type", "iteration"),
+            "threads": b.get("threads", 1),
+            "iterations": b.get("iterations"),
+            "real_time_ns": b["real_time"] * scale,
+            "cpu_time_ns": b["cpu_time"] * scale,
+        }
+        if "aggregate_name" in b:
+            entry["aggregate"] = b["aggregate_name"]
+        for key in ["bytes_per_second", "items_per_second"]:
+            if key in b:
+                entry[key] = b[key]
+        counters = {k: v for k, v in b.items() if k not in _BENCHMARK_FIELDS}
+        if counters:
+            entry["counters"] = counters
+        benchmarks.append(entry)
+    return {
+        "schema_version": 1,
+        "reference": str(dependency.ref),
+        "package_id": dependency.pref.package_id,
+        "options": {k: str(v) for k, v in dependency.options.items() if v is not None},
+        "settings": {k: str(v) for k, v in dependency.settings.serialize().items() if v is not None},
+        "host": {
+            "num_cpus": context.get("num_cpus"),
+            "mhz_per_cpu": context.get("mhz_per_cpu"),
+            "cpu_scaling_enabled": context.get("cpu_scaling_enabled"),
+            "caches": context.get("caches", []),
+            "library_build_type": context.get("library_build_type"),
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def _tested_dependency(conanfile: ConanFile):
+    name = str(conanfile.tested_reference_str).split("/")[0]
+    return conanfile.dependencies[name]
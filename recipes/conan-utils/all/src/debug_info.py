@@ -0,0 +1,128 @@
+import re
+import shutil
+from io import StringIO
+from pathlib import Path
+
+from conan import ConanFile
+from conan.tools.files import mkdir
+
+
+def configure_debug_info(conanfile: ConanFile):
+    """
+    Reduce the size of debug info according to the user.build:split_dwarf and user.build:compress_debug_sections confs.
+    Must be called at the start of generate(), before any toolchains are created.
+
+    user.build:split_dwarf=True moves DWARF data into .dwo files next to the object files with -gsplit-dwarf,
+    which greatly reduces the amount of data the linker has to process.
+    package_debug_info() then combines the .dwo files of each shared library and executable into a single .dwp file.
+    user.build:compress_debug_sections=zlib|zstd compresses the remaining debug sections with -gz.
+    The flags are added to tools.build:cflags/cxxflags/sharedlinkflags/exelinkflags, so they apply to
+    CMake, Meson and Autotools toolchains alike.
+    """
+    if not _has_debug_info(conanfile.settings) or not _is_gnu_like_elf(conanfile.settings):
+        return
+    compile_flags = []
+    link_flags = []
+    if conanfile.conf.get("user.build:split_dwarf", default=False, check_type=bool):
+        compile_flags.append("-gsplit-dwarf")
+        link_flags.append("-gsplit-dwarf")
+    compression = conanfile.conf.get("user.build:compress_debug_sections", choices=["zlib", "zstd"])
+    if compression:
+        compile_flags.append(f"-gz={compression}")
+        link_flags.append(f"-gz={compression}")
+    if not compile_flags:
+        return
+    conanfile.output.info(f"Debug info flags: {' '.join(compile_flags)}")
+    conanfile.conf.append("tools.build:cflags", compile_flags)
+    conanfile.conf.append("tools.build:cxxflags", compile_flags)
+    conanfile.conf.append("tools.build:sharedlinkflags", link_flags)
+    conanfile.conf.append("tools.build:exelinkflags", link_flags)
+
+
+def package_debug_info(conanfile: ConanFile):
+    """
+    Post-process the debug info of ELF binaries in the package folder. Must be called at the end of package(),
+    together with debug_info_package_id() in package_id().
+
+    With user.build:split_dwarf, the .dwo files referenced by each shared library and executable are packaged
+    as a <binary>.dwp file next to it. Note that static libraries keep referring to the .dwo files in the build folder.
+    With user.build:separate_debug_files=debuglink|build-id, debug info is moved out of the binaries into
+    separate .debug files, which are placed either in a .debug/ subfolder next to the binary (debuglink)
+    or under lib/debug/.build-id/xx/yyyy.debug (build-id), and a .gnu_debuglink section is added to the binary.
+    GDB finds the debuglink layout automatically. For the build-id layout, add <package_folder>/lib/debug
+    to GDB's debug-file-directory.
+    """
+    if not _has_debug_info(conanfile.settings) or not _is_gnu_like_elf(conanfile.settings):
+        return
+    split_dwarf = conanfile.conf.get("user.build:split_dwarf", default=False, check_type=bool)
+    layout = conanfile.conf.get("user.build:separate_debug_files", choices=["debuglink", "build-id"])
+    if not split_dwarf and not layout:
+        return
+    binaries = _find_elf_binaries(conanfile.package_folder)
+    if split_dwarf:
+        # GNU dwp does not support DWARF 5, which is the default since GCC 11, so prefer llvm-dwp if available
+        dwp = conanfile.conf.get("user.build:dwp", default=shutil.which("llvm-dwp") or "dwp", check_type=str)
+        for path in binaries:
+            if conanfile.run(f'"{dwp}" -e "{path}" -o "{path}.dwp"', ignore_errors=True) != 0:
+                conanfile.output.warning(f"Failed to create {path.name}.dwp, it probably has no split DWARF data")
+    if layout:
+        objcopy = conanfile.conf.get("user.build:objcopy", default="objcopy", check_type=str)
+        for path in binaries:
+            if layout == "build-id":
+                build_id = _read_build_id(conanfile, path)
+                if not build_id:
+                    conanfile.output.warning(f"{path.name} has no build-id note, falling back to debuglink layout")
+                    debug_file = path.parent / ".debug" / f"{path.name}.debug"
+                else:
+                    debug_dir = Path(conanfile.package_folder, "lib", "debug", ".build-id")
+                    debug_file = debug_dir / build_id[:2] / f"{build_id[2:]}.debug"
+            else:
+                debug_file = path.parent / ".debug" / f"{path.name}.debug"
+            mkdir(conanfile, debug_file.parent)
+            conanfile.run(f'"{objcopy}" --only-keep-debug --compress-debug-sections "{path}" "{debug_file}"')
+            conanfile.run(f'"{objcopy}" --strip-debug --add-gnu-debuglink="{debug_file}" "{path}"')
+
+
+def debug_info_package_id(conanfile: ConanFile):
+    """
+    Add the debug info confs to the package_id. Must be called in package_id() by recipes using package_debug_info().
+
+    The confs change the packaged binaries and add .dwp and .debug files,
+    so packages built with and without them must not share a package_id.
+    """
+    if not _has_debug_info(conanfile.info.settings) or not _is_gnu_like_elf(conanfile.info.settings):
+        return
+    for name in ["user.build:split_dwarf", "user.build:compress_debug_sections", "user.build:separate_debug_files"]:
+        value = conanfile.conf.get(name)
+        if value:
+            conanfile.info.conf.define(name, value)
+
+
+def _has_debug_info(settings):
+    return settings.get_safe("build_type") in ["Debug", "RelWithDebInfo"]
+
+
+def _is_gnu_like_elf(settings):
+    return (settings.get_safe("os") not in ["Windows", "Macos", "iOS", "watchOS", "tvOS", "visionOS"] and
+            settings.get_safe("compiler") in ["gcc", "clang", "intel-cc"])
+
+
+def _find_elf_binaries(package_folder):
+    binaries = []
+    for path in sorted(Path(package_folder).rglob("*")):
+        if path.is_symlink() or not path.is_file() or path.suffix in [".o", ".a", ".dwo", ".dwp", ".debug"]:
+            continue
+        if ".debug" in path.parts:
+            continue
+        with path.open("rb") as f:
+            if f.read(4) == b"\x7fELF":
+                binaries.append(path)
+    return binaries
+
+
+def _read_build_id(conanfile: ConanFile, path):
+    readelf = conanfile.conf.get("user.build:readelf", default="readelf", check_type=str)
+    output = StringIO()
+    conanfile.run(f'"{readelf}" -n "{path}"', stdout=output, quiet=True)
+    m = re.search(r"Build ID: ([0-9a-f]+)", output.getvalue())
+    return m.group(1) if m else None
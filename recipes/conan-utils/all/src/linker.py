@@ -0,0 +1,67 @@
+import os
+
+from conan import ConanFile
+from conan.tools.microsoft import is_msvc
+from conan.tools.scm import Version
+
+_LINKERS = ["mold", "lld", "gold", "bfd"]
+
+# Packages that the packaged linkers themselves depend on and therefore can't use them without a dependency loop
+_LINKER_BOOTSTRAP_PACKAGES = {
+    "mold": ["mold"],
+    "lld": ["lld", "llvm-core"],
+}
+
+
+def _selected_linker(conanfile: ConanFile):
+    return conanfile.conf.get("user.build:linker", choices=_LINKERS)
+
+
+def linker_tool_requires(conanfile: ConanFile):
+    """
+    Add a tool_requires for the linker selected with the user.build:linker conf, if it is packaged.
+    To be called from build_requirements(), followed by configure_linker() in generate().
+    """
+    linker = _selected_linker(conanfile)
+    if not linker or is_msvc(conanfile):
+        return
+    if conanfile.name in _LINKER_BOOTSTRAP_PACKAGES.get(linker, []):
+        conanfile.output.warning(f"Not adding a tool_requires for {linker} to avoid a dependency loop, "
+                                 f"{linker} must be available on the system instead")
+        return
+    if linker == "mold":
+        conanfile.tool_requires("mold/[^2]")
+    elif linker == "lld":
+        conanfile.tool_requires("lld/[>=19]")
+
+
+def configure_linker(conanfile: ConanFile):
+    """
+    Use the linker selected with the user.build:linker=mold|lld|gold|bfd conf.
+    Must be called at the start of generate(), before any toolchains are created.
+
+    The -fuse-ld flag is added to tools.build:exelinkflags and tools.build:sharedlinkflags, which are
+    respected by CMakeToolchain, MesonToolchain and AutotoolsToolchain (LDFLAGS) alike,
+    and as an -Xcompiler flag to user.tools.build:cudaflags for host links performed by nvcc via CudaToolchain.
+    Ignored for MSVC.
+    """
+    linker = _selected_linker(conanfile)
+    if not linker:
+        return
+    if is_msvc(conanfile):
+        conanfile.output.warning(f"user.build:linker={linker} is ignored for MSVC")
+        return
+    flag = f"-fuse-ld={linker}"
+    compiler = conanfile.settings.get_safe("compiler")
+    compiler_version = conanfile.settings.get_safe("compiler.version")
+    if linker == "mold" and compiler == "gcc" and compiler_version and Version(compiler_version) < "12.1":
+        # -fuse-ld=mold is only supported since GCC 12.1, fall back to mold's ld wrapper directory
+        if "mold" in conanfile.dependencies.build:
+            mold_root = conanfile.dependencies.build["mold"].package_folder
+            flag = "-B" + os.path.join(mold_root, "libexec", "mold")
+        else:
+            flag = "-B/usr/libexec/mold"
+    conanfile.output.info(f"Using {linker} as the linker: {flag}")
+    conanfile.conf.append("tools.build:exelinkflags", [flag])
+    conanfile.conf.append("tools.build:sharedlinkflags", [flag])
+    conanfile.conf.append("user.tools.build:cudaflags", [f"-Xcompiler={flag}"])
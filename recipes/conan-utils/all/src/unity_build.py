@@ -0,0 +1,28 @@
+from conan import ConanFile
+from conan.errors import ConanException
+
+
+def configure_unity_build(conanfile: ConanFile, unsupported_reason=None):
+    """
+    Enable CMake unity (jumbo) builds with the user.build:unity_build conf for CMake-based recipes.
+    Must be called at the start of generate(), before CMakeToolchain is created.
+
+    Sets CMAKE_UNITY_BUILD and, if user.build:unity_build_batch_size is set, CMAKE_UNITY_BUILD_BATCH_SIZE
+    via tools.cmake.cmaketoolchain:extra_variables.
+    Recipes whose sources are known to fail as a unity build pass unsupported_reason instead,
+    which reports that the conf is ignored for them.
+    Unity builds do not change the produced binaries' ABI, so the confs are not part of the package_id.
+    """
+    if not conanfile.conf.get("user.build:unity_build", default=False, check_type=bool):
+        return
+    if unsupported_reason:
+        conanfile.output.warning(f"user.build:unity_build is ignored for {conanfile.name}: {unsupported_reason}")
+        return
+    variables = {"CMAKE_UNITY_BUILD": {"value": "ON", "cache": True, "type": "BOOL"}}
+    batch_size = conanfile.conf.get("user.build:unity_build_batch_size", check_type=int)
+    if batch_size is not None:
+        if batch_size < 0:
+            raise ConanException(f"user.build:unity_build_batch_size must be a non-negative integer, got {batch_size}")
+        variables["CMAKE_UNITY_BUILD_BATCH_SIZE"] = {"value": str(batch_size), "cache": True, "type": "STRING"}
+    conanfile.output.info(f"Using a unity build (batch size: {batch_size if batch_size is not None else 'default'})")
+    conanfile.conf.update("tools.cmake.cmaketoolchain:extra_variables", variables)
@@ -29,6 +29,8 @@ class CPythonConan(CPythonAutotools, CPythonMSVC):
         "freethreaded": [True, False],
         "pgo": [True, False],
         "lto": [True, False],
+        "jit": [True, False],
+        "bolt": [True, False],
         "docstrings": [True, False],
         "pymalloc": [True, False],
         "with_bz2": [True, False],
@@ -49,6 +51,8 @@ class CPythonConan(CPythonAutotools, CPythonMSVC):
         "freethreaded": False,
         "pgo": False,
         "lto": False,
+        "jit": False,
+        "bolt": False,
         "docstrings": True,
         "pymalloc": True,
         "with_bz2": True,
@@ -67,6 +71,8 @@ class CPythonConan(CPythonAutotools, CPythonMSVC):
         "freethreaded": "Disable GIL for free-threaded mode (experimental as of v3.14)",
         "pgo": "Enable profile-guided optimization (PGO)",
         "lto": "Enable link-time optimization (LTO)",
+        "jit": "Enable the experimental copy-and-patch JIT compiler (requires LLVM at build time)",
+        "bolt": "Optimize the binaries with the BOLT post-link optimizer (llvm-bolt), best combined with pgo",
         "docstrings": "Enable documentation strings",
         "pymalloc": "Enable specialized mallocs",
         "with_bz2": "Add bzip2 dependency for bz2 module",
@@ -108,6 +114,9 @@ class CPythonConan(CPythonAutotools, CPythonMSVC):
             del self.options.with_readline
         if Version(self.version) < "3.13":
             del self.options.freethreaded
+            del self.options.jit
+        if is_msvc(self) or self.settings.os != "Linux" or Version(self.version) < "3.12":
+            del self.options.bolt
         if Version(self.version, qualifier=True) < "3.14":
             del self.options.with_zstd
 
@@ -164,7 +173,25 @@ class CPythonConan(CPythonAutotools, CPythonMSVC):
         if self.options.get_safe("with_curses") and not self.dependencies["ncurses"].options.with_widec:
             raise ConanInvalidConfiguration("cpython requires ncurses with wide character support")
 
+    @property
+    def _jit_llvm_version(self):
+        # https://github.com/python/cpython/blob/v3.14.0/Tools/jit/_llvm.py
+        return 18 if Version(self.version, qualifier=True) < "3.14" else 19
+
+    def validate_build(self):
+        if self.options.get_safe("jit") and self._jit_llvm_version < 19:
+            raise ConanInvalidConfiguration(f"jit=True requires LLVM {self._jit_llvm_version} for {self.ref}, "
+                                            "which is not available as a package")
+        if self.options.get_safe("bolt") and self.settings.arch not in ["x86_64", "armv8"]:
+            raise ConanInvalidConfiguration(f"bolt=True is not supported on {self.settings.arch}")
+
     def build_requirements(self):
+        if self.options.get_safe("jit") and self._jit_llvm_version >= 19:
+            # The JIT stencils are compiled with clang and processed with llvm-objdump and llvm-readobj
+            self.tool_requires(f"clang/[~{self._jit_llvm_version}]")
+            self.tool_requires(f"llvm-core/[~{self._jit_llvm_version}]")
+        if self.options.get_safe("bolt"):
+            self.tool_requires("llvm-bolt/[>=19]")
         if is_msvc(self):
             self._msvc_build_requirements()
         else:
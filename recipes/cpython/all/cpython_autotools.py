@@ -79,6 +79,10 @@ class CPythonAutotools(ConanFile):
         tc.configure_args.append(f"--with-openssl={openssl_root}")
         if Version(self.version) >= "3.13" and self.options.freethreaded:
             tc.configure_args.append("--disable-gil")
+        if self.options.get_safe("jit"):
+            tc.configure_args.append("--enable-experimental-jit")
+        if self.options.get_safe("bolt"):
+            tc.configure_args.append("--enable-bolt")
         if Version(self.version) < "3.12":
             tc.configure_args.append("--with-system-ffi")
         if Version(self.version) >= "3.10":
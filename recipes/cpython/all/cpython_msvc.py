@@ -48,6 +48,7 @@ class CPythonMSVC(ConanFile):
         tc = MSBuildToolchain(self)
         tc.properties["IncludeExternals"] = "true"
         tc.properties["DisableGil"] = "true" if self.options.get_safe("freethreaded") else "false"
+        tc.properties["UseJIT"] = "true" if self.options.get_safe("jit") else "false"
         tc.generate()
         deps = MSBuildDeps(self)
         deps.generate()
@@ -22,12 +22,60 @@ class EmbreeConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     options = {
         "shared": [True, False],
-        "fPIC": [True, False]
+        "fPIC": [True, False],
+        "sse2": [True, False],
+        "sse42": [True, False],
+        "avx": [True, False],
+        "avx2": [True, False],
+        "avx512": [True, False],
+        "neon": [True, False],
+        "neon2x": [True, False],
+        "geometry_curve": [True, False],
+        "geometry_grid": [True, False],
+        "geometry_instance": [True, False],
+        "geometry_instance_array": [True, False],
+        "geometry_point": [True, False],
+        "geometry_quad": [True, False],
+        "geometry_subdivision": [True, False],
+        "geometry_triangle": [True, False],
+        "geometry_user": [True, False],
+        "ray_packets": [True, False],
+        "ray_masking": [True, False],
+        "filter_function": [True, False],
+        "backface_culling": [True, False],
+        "ignore_invalid_rays": [True, False],
+        "with_tbb": [True, False],
     }
 
     default_options = {
         "shared": False,
-        "fPIC": True
+        "fPIC": True,
+        # All ISAs are built by default and the best one is selected at runtime
+        "sse2": True,
+        "sse42": True,
+        "avx": True,
+        "avx2": True,
+        "avx512": True,
+        "neon": True,
+        "neon2x": True,
+        "geometry_curve": True,
+        "geometry_grid": True,
+        "geometry_instance": True,
+        "geometry_instance_array": True,
+        "geometry_point": True,
+        "geometry_quad": True,
+        "geometry_subdivision": True,
+        "geometry_triangle": True,
+        "geometry_user": True,
+        "ray_packets": True,
+        "ray_masking": True,
+        "filter_function": True,
+        "backface_culling": False,
+        "ignore_invalid_rays": False,
+        "with_tbb": True,
+    }
+    options_description = {
+        "with_tbb": "Use oneTBB as the tasking system instead of Embree's internal one",
     }
     implements = ["auto_shared_fpic"]
 
@@ -39,20 +87,42 @@ class EmbreeConan(ConanFile):
     def _has_neon(self):
         return "arm" in self.settings.arch
 
+    @property
+    def _num_isa(self):
+        return sum(bool(self.options.get_safe(isa)) for isa in ["sse2", "sse42", "avx", "avx2", "avx512", "neon", "neon2x"])
+
+    def config_options(self):
+        if not self._has_sse_avx:
+            del self.options.sse2
+            del self.options.sse42
+            del self.options.avx
+            del self.options.avx2
+            del self.options.avx512
+        elif is_msvc(self):
+            self.options.avx512 = False
+        if not self._has_neon:
+            del self.options.neon
+            del self.options.neon2x
+        if is_apple_os(self) or self.settings.os == "Emscripten":
+            self.options.with_tbb = False
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
     def requirements(self):
-        if self.settings.os != "Emscripten":
+        if self.options.with_tbb:
             self.requires("onetbb/[>=2021]")
 
     def validate(self):
         check_min_cppstd(self, 11)
+        if self.settings.os != "Emscripten" and self._num_isa == 0:
+            raise ConanInvalidConfiguration("At least one ISA (simd) must be enabled")
         # See https://github.com/RenderKit/embree/blob/v4.4.0/CMakeLists.txt#L533
         if (
             self.settings.compiler == "apple-clang"
             and not self.options.shared
             and Version(self.settings.compiler.version) >= "9.0"
+            and self._num_isa > 1
         ):
             raise ConanInvalidConfiguration(f"{self.ref} static with apple-clang >=9 and multiple ISA (simd) is not supported")
 
@@ -80,20 +150,31 @@ class EmbreeConan(ConanFile):
         tc.variables["BUILD_TESTING"] = False
         tc.variables["EMBREE_INSTALL_DEPENDENCIES"] = False
         tc.variables["EMBREE_TUTORIALS"] = False
-        tc.variables["EMBREE_BACKFACE_CULLING"] = False
-        tc.variables["EMBREE_IGNORE_INVALID_RAYS"] = False
+        tc.variables["EMBREE_GEOMETRY_CURVE"] = self.options.geometry_curve
+        tc.variables["EMBREE_GEOMETRY_GRID"] = self.options.geometry_grid
+        tc.variables["EMBREE_GEOMETRY_INSTANCE"] = self.options.geometry_instance
+        tc.variables["EMBREE_GEOMETRY_INSTANCE_ARRAY"] = self.options.geometry_instance_array
+        tc.variables["EMBREE_GEOMETRY_POINT"] = self.options.geometry_point
+        tc.variables["EMBREE_GEOMETRY_QUAD"] = self.options.geometry_quad
+        tc.variables["EMBREE_GEOMETRY_SUBDIVISION"] = self.options.geometry_subdivision
+        tc.variables["EMBREE_GEOMETRY_TRIANGLE"] = self.options.geometry_triangle
+        tc.variables["EMBREE_GEOMETRY_USER"] = self.options.geometry_user
+        tc.variables["EMBREE_RAY_PACKETS"] = self.options.ray_packets
+        tc.variables["EMBREE_RAY_MASK"] = self.options.ray_masking
+        tc.variables["EMBREE_FILTER_FUNCTION"] = self.options.filter_function
+        tc.variables["EMBREE_BACKFACE_CULLING"] = self.options.backface_culling
+        tc.variables["EMBREE_IGNORE_INVALID_RAYS"] = self.options.ignore_invalid_rays
         tc.variables["EMBREE_ISPC_SUPPORT"] = False
-        tc.variables["EMBREE_TASKING_SYSTEM"] = "INTERNAL" if is_apple_os(self) or self.settings.os == "Emscripten" else "TBB"
+        tc.variables["EMBREE_TASKING_SYSTEM"] = "TBB" if self.options.with_tbb else "INTERNAL"
+        # Build all selected ISAs and dispatch at runtime. For Emscripten, all ISAs are disabled.
         tc.variables["EMBREE_MAX_ISA"] = "NONE"
-        tc.variables["EMBREE_ISA_NEON"] = self._has_neon
-        tc.variables["EMBREE_ISA_NEON2X"] = self._has_neon
-        tc.variables["EMBREE_ISA_SSE2"] = self._has_sse_avx
-        tc.variables["EMBREE_ISA_SSE42"] = self._has_sse_avx
-        # For Emscripten disable TBB and all ISAs. It will compile only for SSE
-        if self.settings.os == "Emscripten":
-            tc.variables["EMBREE_ISA_AVX"] = self._has_sse_avx
-            tc.variables["EMBREE_ISA_AVX2"] = self._has_sse_avx
-            tc.variables["EMBREE_ISA_AVX512"] = self._has_sse_avx and not is_msvc(self)
+        tc.variables["EMBREE_ISA_NEON"] = self.options.get_safe("neon", False)
+        tc.variables["EMBREE_ISA_NEON2X"] = self.options.get_safe("neon2x", False)
+        tc.variables["EMBREE_ISA_SSE2"] = self.options.get_safe("sse2", False)
+        tc.variables["EMBREE_ISA_SSE42"] = self.options.get_safe("sse42", False)
+        tc.variables["EMBREE_ISA_AVX"] = self.options.get_safe("avx", False)
+        tc.variables["EMBREE_ISA_AVX2"] = self.options.get_safe("avx2", False)
+        tc.variables["EMBREE_ISA_AVX512"] = self.options.get_safe("avx512", False)
         if is_msvc(self):
             tc.variables["USE_STATIC_RUNTIME"] = is_msvc_static_runtime(self)
         tc.generate()
@@ -126,12 +207,15 @@ class EmbreeConan(ConanFile):
         self.cpp_info.libs = ["embree4"]
         if not self.options.shared:
             self.cpp_info.libs.extend(["sys", "math", "simd", "lexers", "tasking"])
-            if self._has_sse_avx:
-                self.cpp_info.libs.extend(["embree_sse42", "embree_avx", "embree_avx2"])
-                if not is_msvc(self):
-                    self.cpp_info.libs.append("embree_avx512")
-            if self._has_neon:
-                self.cpp_info.libs.extend(["embree_avx2"])
+            if self.options.get_safe("sse42"):
+                self.cpp_info.libs.append("embree_sse42")
+            if self.options.get_safe("avx"):
+                self.cpp_info.libs.append("embree_avx")
+            # NEON2X is built as the AVX2 variant
+            if self.options.get_safe("avx2") or self.options.get_safe("neon2x"):
+                self.cpp_info.libs.append("embree_avx2")
+            if self.options.get_safe("avx512"):
+                self.cpp_info.libs.append("embree_avx512")
 
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs = ["dl", "m", "pthread"]
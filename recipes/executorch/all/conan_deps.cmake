@@ -0,0 +1,15 @@
+# Provides the dependencies that ExecuTorch otherwise builds from its git submodules
+
+find_package(flatbuffers REQUIRED CONFIG)
+find_program(FLATC_EXECUTABLE flatc REQUIRED)
+# The generated schema headers include flatbuffers/flatbuffers.h
+include_directories($<TARGET_PROPERTY:flatbuffers::flatbuffers,INTERFACE_INCLUDE_DIRECTORIES>)
+
+if(EXECUTORCH_BUILD_XNNPACK OR EXECUTORCH_BUILD_KERNELS_OPTIMIZED)
+    find_package(cpuinfo REQUIRED CONFIG)
+    find_package(pthreadpool REQUIRED CONFIG)
+endif()
+
+if(EXECUTORCH_BUILD_XNNPACK)
+    find_package(xnnpack REQUIRED CONFIG)
+endif()
@@ -0,0 +1,268 @@
+import os
+
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.apple import is_apple_os
+from conan.tools.build import check_min_cppstd
+from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
+from conan.tools.files import *
+from conan.tools.microsoft import is_msvc
+
+required_conan_version = ">=2.1"
+
+
+class ExecuTorchConan(ConanFile):
+    name = "executorch"
+    description = "ExecuTorch: on-device AI inference runtime for ahead-of-time exported PyTorch models"
+    license = "BSD-3-Clause"
+    homepage = "https://github.com/pytorch/executorch"
+    topics = ("pytorch", "deep-learning", "inference", "edge", "mobile", "embedded")
+    package_type = "static-library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "fPIC": [True, False],
+        "portable_kernels": [True, False],
+        "optimized_kernels": [True, False],
+        "quantized_kernels": [True, False],
+        "with_xnnpack": [True, False],
+        "select_ops": [None, "ANY"],
+        "extensions": [True, False],
+        "enable_logging": [True, False],
+        "optimize_size": [True, False],
+    }
+    default_options = {
+        "fPIC": True,
+        "portable_kernels": True,
+        "optimized_kernels": False,
+        "quantized_kernels": False,
+        "with_xnnpack": False,
+        "select_ops": None,
+        "extensions": True,
+        "enable_logging": True,
+        "optimize_size": False,
+    }
+    options_description = {
+        "portable_kernels": "Build the portable ATen-compatible operator library",
+        "optimized_kernels": "Build the optimized CPU operator library (falls back to the portable kernels)",
+        "quantized_kernels": "Build the quantized operator library",
+        "with_xnnpack": "Build the XNNPACK delegate backend",
+        "select_ops": ("Comma-separated list of root operators to register from the kernel libraries "
+                       "for a selective build, e.g. 'aten::add.out,aten::mm.out'. All operators are registered by default."),
+        "extensions": "Build the Module, DataLoader, FlatTensor and Tensor extension libraries",
+        "enable_logging": "Enable ET_LOG messages",
+        "optimize_size": "Optimize the runtime for binary size instead of speed",
+    }
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
+    @property
+    def _torch_version(self):
+        # The PyTorch release that the ExecuTorch code generation (torchgen) and the optimized kernels are built against
+        return {
+            "0.7.0": "2.8.0",
+        }[self.version]
+
+    @property
+    def _with_threadpool(self):
+        return self.options.with_xnnpack or self.options.optimized_kernels
+
+    def export_sources(self):
+        copy(self, "conan_deps.cmake", self.recipe_folder, os.path.join(self.export_sources_folder, "src"))
+
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
+
+    def requirements(self):
+        # Only the headers are used, for the code generated from the .pte schema
+        self.requires("flatbuffers/[>=24.3.25]", visible=False)
+        if self._with_threadpool:
+            self.requires("cpuinfo/[>=cci.20250110]")
+            self.requires("pthreadpool/[>=cci.20250101]")
+        if self.options.with_xnnpack:
+            self.requires("xnnpack/cci.20250729")
+
+    def validate(self):
+        check_min_cppstd(self, 17)
+        if is_msvc(self):
+            raise ConanInvalidConfiguration(f"{self.ref} does not support MSVC")
+        if self.options.quantized_kernels and not self.options.portable_kernels:
+            raise ConanInvalidConfiguration("quantized_kernels=True requires portable_kernels=True")
+
+    def validate_build(self):
+        # torch is not downloaded by the recipe, it must come from a Python installation provided by the user
+        if not self.conf.get("user.cpython:python", check_type=str):
+            raise ConanInvalidConfiguration(
+                f"{self.ref} requires a Python interpreter with torch=={self._torch_version} installed for code generation. "
+                "Please provide one by setting user.cpython:python=/path/to/python."
+            )
+
+    def build_requirements(self):
+        self.tool_requires("cmake/[>=3.24 <5]")
+        self.tool_requires("flatbuffers/<host_version>")
+
+    def source(self):
+        sources = self.conan_data["sources"][self.version]
+        get(self, **sources["executorch"], strip_root=True)
+        get(self, **sources["eigen"], strip_root=True, destination="kernels/optimized/third-party/eigen")
+        # Use flatc from the flatbuffers package instead of building the flatbuffers and flatcc submodules
+        save(self, "third-party/CMakeLists.txt",
+             "add_executable(flatc IMPORTED GLOBAL)\n"
+             "set_target_properties(flatc PROPERTIES IMPORTED_LOCATION ${FLATC_EXECUTABLE})\n")
+        # XNNPACK and its dependencies are provided by conan_deps.cmake
+        save(self, "backends/xnnpack/cmake/Dependencies.cmake", "")
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.cache_variables["CMAKE_PROJECT_executorch_INCLUDE"] = "conan_deps.cmake"
+        tc.cache_variables["EXECUTORCH_BUILD_PORTABLE_OPS"] = self.options.portable_kernels
+        tc.cache_variables["EXECUTORCH_BUILD_KERNELS_OPTIMIZED"] = self.options.optimized_kernels
+        tc.cache_variables["EXECUTORCH_BUILD_KERNELS_QUANTIZED"] = self.options.quantized_kernels
+        tc.cache_variables["EXECUTORCH_BUILD_XNNPACK"] = self.options.with_xnnpack
+        if self.options.select_ops:
+            tc.cache_variables["EXECUTORCH_SELECT_OPS_LIST"] = str(self.options.select_ops)
+        tc.cache_variables["EXECUTORCH_BUILD_EXTENSION_DATA_LOADER"] = self.options.extensions
+        tc.cache_variables["EXECUTORCH_BUILD_EXTENSION_FLAT_TENSOR"] = self.options.extensions
+        tc.cache_variables["EXECUTORCH_BUILD_EXTENSION_MODULE"] = self.options.extensions
+        tc.cache_variables["EXECUTORCH_BUILD_EXTENSION_TENSOR"] = self.options.extensions
+        tc.cache_variables["EXECUTORCH_BUILD_EXTENSION_RUNNER_UTIL"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_EXTENSION_LLM"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_EXTENSION_TRAINING"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_KERNELS_CUSTOM"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_KERNELS_LLM"] = False
+        tc.cache_variables["EXECUTORCH_ENABLE_LOGGING"] = self.options.enable_logging
+        tc.cache_variables["EXECUTORCH_OPTIMIZE_SIZE"] = self.options.optimize_size
+        # Provided by Conan instead of the submodules
+        tc.cache_variables["EXECUTORCH_BUILD_CPUINFO"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_PTHREADPOOL"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_FLATC"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_EXECUTOR_RUNNER"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_DEVTOOLS"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_PYBIND"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_TESTS"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_COREML"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_MPS"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_QNN"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_VULKAN"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_ARM_BAREMETAL"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_NEURON"] = False
+        tc.cache_variables["EXECUTORCH_BUILD_CADENCE"] = False
+        tc.cache_variables["CMAKE_TRY_COMPILE_CONFIGURATION"] = str(self.settings.build_type)
+        tc.generate()
+
+        deps = CMakeDeps(self)
+        deps.set_property("flatbuffers", "cmake_target_name", "flatbuffers::flatbuffers")
+        deps.set_property("cpuinfo::cpuinfo", "cmake_target_name", "cpuinfo")
+        deps.set_property("pthreadpool", "cmake_target_name", "pthreadpool")
+        deps.set_property("xnnpack::core", "cmake_target_name", "XNNPACK")
+        deps.set_property("xnnpack::microkernels-prod", "cmake_target_name", "xnnpack-microkernels-prod")
+        deps.generate()
+
+        # torchgen and the ATen headers used by the optimized kernels come from the torch package of the base interpreter
+        venv = self._utils.PythonVenv(self)
+        venv.generate(system_site_packages=True)
+
+    def build(self):
+        self._utils.pip_install(self, ["pyyaml"])
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def package(self):
+        copy(self, "LICENSE", self.source_folder, os.path.join(self.package_folder, "licenses"))
+        cmake = CMake(self)
+        cmake.install()
+        rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+        rmdir(self, os.path.join(self.package_folder, "share"))
+
+    def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "executorch")
+
+        def _add_whole_archive_lib(component, libname):
+            # Operator and backend libraries register themselves with static initializers,
+            # see executorch_target_link_options_shared_lib() in tools/cmake/Utils.cmake
+            lib_fullpath = os.path.join(self.package_folder, "lib", f"lib{libname}.a")
+            if is_apple_os(self):
+                whole_archive = f"-Wl,-force_load,{lib_fullpath}"
+            else:
+                whole_archive = f"-Wl,--whole-archive,{lib_fullpath},--no-whole-archive"
+            self.cpp_info.components[component].exelinkflags.append(whole_archive)
+            self.cpp_info.components[component].sharedlinkflags.append(whole_archive)
+
+        core = self.cpp_info.components["executorch_core"]
+        core.set_property("cmake_target_name", "executorch_core")
+        core.libs = ["executorch_core"]
+        core.includedirs = ["include", os.path.join("include", "executorch", "runtime", "core", "portable_type", "c10")]
+        # The vendored c10 headers are used without the generated cmake_macros.h
+        core.defines = ["C10_USING_CUSTOM_GENERATED_MACROS"]
+        if self.settings.os in ["Linux", "FreeBSD"]:
+            core.system_libs = ["m", "pthread", "dl"]
+        elif self.settings.os == "Android":
+            core.system_libs = ["log"]
+
+        executorch = self.cpp_info.components["executorch_"]
+        executorch.set_property("cmake_target_name", "executorch")
+        executorch.libs = ["executorch"]
+        executorch.requires = ["executorch_core"]
+
+        if self.options.portable_kernels:
+            self.cpp_info.components["portable_kernels"].set_property("cmake_target_name", "portable_kernels")
+            self.cpp_info.components["portable_kernels"].libs = ["portable_kernels"]
+            self.cpp_info.components["portable_kernels"].requires = ["executorch_core"]
+
+            self.cpp_info.components["portable_ops_lib"].set_property("cmake_target_name", "portable_ops_lib")
+            _add_whole_archive_lib("portable_ops_lib", "portable_ops_lib")
+            self.cpp_info.components["portable_ops_lib"].requires = ["executorch", "portable_kernels"]
+
+        if self._with_threadpool:
+            self.cpp_info.components["extension_threadpool"].set_property("cmake_target_name", "extension_threadpool")
+            self.cpp_info.components["extension_threadpool"].libs = ["extension_threadpool"]
+            self.cpp_info.components["extension_threadpool"].requires = ["executorch_core", "cpuinfo::cpuinfo", "pthreadpool::pthreadpool"]
+
+        if self.options.optimized_kernels:
+            self.cpp_info.components["optimized_kernels"].set_property("cmake_target_name", "optimized_kernels")
+            self.cpp_info.components["optimized_kernels"].libs = ["optimized_kernels", "cpublas", "eigen_blas"]
+            self.cpp_info.components["optimized_kernels"].requires = ["executorch_core", "extension_threadpool"]
+            if self.options.portable_kernels:
+                self.cpp_info.components["optimized_kernels"].requires.append("portable_kernels")
+
+            self.cpp_info.components["optimized_native_cpu_ops_lib"].set_property("cmake_target_name", "optimized_native_cpu_ops_lib")
+            _add_whole_archive_lib("optimized_native_cpu_ops_lib", "optimized_native_cpu_ops_lib")
+            self.cpp_info.components["optimized_native_cpu_ops_lib"].requires = ["executorch", "optimized_kernels"]
+
+        if self.options.quantized_kernels:
+            self.cpp_info.components["quantized_kernels"].set_property("cmake_target_name", "quantized_kernels")
+            self.cpp_info.components["quantized_kernels"].libs = ["quantized_kernels"]
+            self.cpp_info.components["quantized_kernels"].requires = ["executorch_core", "portable_kernels"]
+
+            self.cpp_info.components["quantized_ops_lib"].set_property("cmake_target_name", "quantized_ops_lib")
+            _add_whole_archive_lib("quantized_ops_lib", "quantized_ops_lib")
+            self.cpp_info.components["quantized_ops_lib"].requires = ["executorch", "quantized_kernels"]
+
+        if self.options.with_xnnpack:
+            self.cpp_info.components["xnnpack_backend"].set_property("cmake_target_name", "xnnpack_backend")
+            _add_whole_archive_lib("xnnpack_backend", "xnnpack_backend")
+            self.cpp_info.components["xnnpack_backend"].requires = ["executorch", "extension_threadpool", "xnnpack::xnnpack"]
+
+        if self.options.extensions:
+            self.cpp_info.components["extension_data_loader"].set_property("cmake_target_name", "extension_data_loader")
+            self.cpp_info.components["extension_data_loader"].libs = ["extension_data_loader"]
+            self.cpp_info.components["extension_data_loader"].requires = ["executorch_core"]
+
+            self.cpp_info.components["extension_flat_tensor"].set_property("cmake_target_name", "extension_flat_tensor")
+            self.cpp_info.components["extension_flat_tensor"].libs = ["extension_flat_tensor"]
+            self.cpp_info.components["extension_flat_tensor"].requires = ["executorch_core"]
+
+            self.cpp_info.components["extension_tensor"].set_property("cmake_target_name", "extension_tensor")
+            self.cpp_info.components["extension_tensor"].libs = ["extension_tensor"]
+            self.cpp_info.components["extension_tensor"].requires = ["executorch_core"]
+
+            self.cpp_info.components["extension_module"].set_property("cmake_target_name", "extension_module_static")
+            self.cpp_info.components["extension_module"].libs = ["extension_module_static"]
+            self.cpp_info.components["extension_module"].requires = ["executorch", "extension_data_loader", "extension_flat_tensor"]
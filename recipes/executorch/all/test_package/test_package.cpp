@@ -0,0 +1,12 @@
+#include <cstdio>
+
+#include <executorch/runtime/kernel/operator_registry.h>
+#include <executorch/runtime/platform/runtime.h>
+
+int main()
+{
+    executorch::runtime::runtime_init();
+    auto kernels = executorch::runtime::get_registered_kernels();
+    printf("ExecuTorch registered kernels: %zu\n", kernels.size());
+    return 0;
+}
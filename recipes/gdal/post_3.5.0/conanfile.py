@@ -152,6 +152,12 @@ class GdalConan(ConanFile):
         "ogr_optional_drivers": True,
     }
 
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
     def export_sources(self):
         copy(self, "CMakeLists.txt", src=self.recipe_folder, dst=self.export_sources_folder)
         export_conandata_patches(self)
@@ -330,6 +336,7 @@ class GdalConan(ConanFile):
         apply_conandata_patches(self)
 
     def generate(self):
+        self._utils.configure_unity_build(self)
         tc = CMakeToolchain(self)
         tc.cache_variables["GDAL_OBJECT_LIBRARIES_POSITION_INDEPENDENT_CODE"] = self.options.get_safe("fPIC", True)
         tc.cache_variables["GDAL_SET_INSTALL_RELATIVE_RPATH"] = True
@@ -91,6 +91,12 @@ class GtsamConan(ConanFile):
         "with_eigen_MKL_OPENMP": "Eigen, when using Intel MKL, will also use OpenMP for multithreading if available",
     }
 
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
     def export_sources(self):
         export_conandata_patches(self)
         copy(self, "conan_deps.cmake", self.recipe_folder, os.path.join(self.export_sources_folder, "src"))
@@ -184,6 +190,7 @@ class GtsamConan(ConanFile):
             replace_in_file(self, "cmake/GtsamMakeConfigFile.cmake", "${${PACKAGE_NAME}_VERSION}", f'"{self.version}"')
 
     def generate(self):
+        self._utils.configure_unity_build(self)
         tc = CMakeToolchain(self)
         tc.variables["CMAKE_PROJECT_GTSAM_INCLUDE"] = "conan_deps.cmake"
         # https://github.com/borglab/gtsam/blob/4.2.0/cmake/HandleGeneralOptions.cmake
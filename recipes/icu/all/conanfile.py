@@ -1,4 +1,5 @@
 import hashlib
+import json
 import os
 import re
 import shutil
@@ -34,6 +35,8 @@ class ICUConan(ConanFile):
         "data_packaging": ["files", "archive", "library", "static"],
         "with_dyload": [True, False],
         "dat_package_file": [None, "ANY"],
+        "data_filter": [None, "ANY"],
+        "data_locales": [None, "ANY"],
         "with_icuio": [True, False],
         "with_extras": [True, False],
     }
@@ -43,14 +46,26 @@ class ICUConan(ConanFile):
         "data_packaging": "archive",
         "with_dyload": True,
         "dat_package_file": None,
+        "data_filter": None,
+        "data_locales": None,
         "with_icuio": True,
         "with_extras": False,
     }
+    options_description = {
+        "data_filter": ("Path to an ICU data filter JSON file to build a reduced data set with. "
+                        "See https://unicode-org.github.io/icu/userguide/icu_data/buildtool.html"),
+        "data_locales": ("Comma-separated list of languages to include in the data, e.g. 'en,de,fr'. "
+                         "Replaces the localeFilter of the data_filter file, if any."),
+    }
 
     @property
     def _enable_icu_tools(self):
         return self.settings.os not in ["iOS", "tvOS", "watchOS", "Emscripten"]
 
+    @property
+    def _with_data_filter(self):
+        return bool(self.options.data_filter or self.options.data_locales)
+
     @property
     def _with_unit_tests(self):
         return not self.conf.get("tools.build:skip_test", default=True, check_type=bool)
@@ -71,6 +86,15 @@ class ICUConan(ConanFile):
         if self.options.dat_package_file:
             if not os.path.exists(str(self.options.dat_package_file)):
                 raise ConanInvalidConfiguration("Non-existent dat_package_file specified")
+        if self.options.data_filter:
+            if not os.path.exists(str(self.options.data_filter)):
+                raise ConanInvalidConfiguration("Non-existent data_filter specified")
+        if self._with_data_filter:
+            if self.options.dat_package_file:
+                raise ConanInvalidConfiguration("dat_package_file cannot be combined with data_filter or data_locales")
+            if self.version not in self.conan_data.get("data_sources", {}):
+                raise ConanInvalidConfiguration(f"ICU data sources are not available for {self.ref}, "
+                                                "data_filter and data_locales cannot be used")
         if Version(self.version) >= "75.1":
             check_min_cppstd(self, 17)
 
@@ -88,6 +112,8 @@ class ICUConan(ConanFile):
     def package_id(self):
         if self.info.options.dat_package_file:
             self.info.options.dat_package_file = self._sha256sum(str(self.info.options.dat_package_file))
+        if self.info.options.data_filter:
+            self.info.options.data_filter = self._sha256sum(str(self.info.options.data_filter))
 
     def build_requirements(self):
         if self.settings_build.os == "Windows":
@@ -97,6 +123,9 @@ class ICUConan(ConanFile):
 
         if cross_building(self):
             self.tool_requires(str(self.ref))
+        if self._with_data_filter:
+            # Building the data from source runs ICU's Python buildtool
+            self.tool_requires("cpython/[^3.12]")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -153,12 +182,32 @@ class ICUConan(ConanFile):
                 env.define("icu_cv_host_frag", "mh-msys-msvc")
             env.vars(self).save_script("conanbuild_icu_msvc")
 
+        if not self._with_unit_tests and not self._with_data_filter:
+            # Python is only needed for unit tests and for building the data from source
+            env = Environment()
+            env.define("CONAN_ICU_DISABLE_PYTHON", "1")
+            env.vars(self).save_script("conanbuild_icu_python")
+
+        if self._with_data_filter:
+            data_filter = {}
+            if self.options.data_filter:
+                data_filter = json.loads(load(self, str(self.options.data_filter)))
+            if self.options.data_locales:
+                data_filter["localeFilter"] = {
+                    "filterType": "language",
+                    "includelist": [l.strip() for l in str(self.options.data_locales).split(",") if l.strip()],
+                }
+            data_filter_path = os.path.join(self.generators_folder, "icu_data_filter.json")
+            save(self, data_filter_path, json.dumps(data_filter, indent=2))
+            env = Environment()
+            env.define_path("ICU_DATA_FILTER_FILE", data_filter_path)
+            env.vars(self).save_script("conanbuild_icu_data_filter")
+
     def _patch_sources(self):
-        if not self._with_unit_tests:
-            # Prevent any call to python during configuration, it's only needed for unit tests
-            replace_in_file(self, os.path.join(self.source_folder, "source", "configure"),
-                            'if test -z "$PYTHON"',
-                            "if true")
+        # Allow preventing any call to python during configuration
+        replace_in_file(self, os.path.join(self.source_folder, "source", "configure"),
+                        'if test -z "$PYTHON"',
+                        'if test -z "$PYTHON" || test -n "$CONAN_ICU_DISABLE_PYTHON"')
 
         if self.settings_build.os == "Windows":
             # https://unicode-org.atlassian.net/projects/ICU/issues/ICU-20545
@@ -176,7 +225,21 @@ class ICUConan(ConanFile):
             "-install_name @rpath/$(notdir $(MIDDLE_SO_TARGET))",
         )
 
+    def _copy_sources_with_full_data(self):
+        # Filtering requires building the data from source, which is not included in the -src archive.
+        # Use a copy of the sources with the data from the data archive, the source folder is shared with other configurations.
+        original_sources = os.path.join(self.source_folder, "source")
+        sources = os.path.join(self.build_folder, "source-full-data")
+        rmdir(self, sources)
+        shutil.copytree(original_sources, sources, ignore=lambda folder, names: ["data"] if folder == original_sources else [])
+        get(self, **self.conan_data["data_sources"][self.version], destination=sources)
+        return sources
+
     def build(self):
+        build_script_folder = "source"
+        if self._with_data_filter:
+            build_script_folder = self._copy_sources_with_full_data()
+
         # workaround for https://unicode-org.atlassian.net/browse/ICU-20531
         mkdir(self, os.path.join(self.build_folder, "data", "out", "tmp"))
 
@@ -189,7 +252,7 @@ class ICUConan(ConanFile):
                 shutil.copy(str(self.options.dat_package_file), dat_package_file[0])
 
         autotools = Autotools(self)
-        autotools.configure(build_script_folder="source")
+        autotools.configure(build_script_folder=build_script_folder)
         autotools.make()
         if self._with_unit_tests:
             autotools.make(target="check")
@@ -30,6 +30,12 @@ class ITKConan(ConanFile):
     }
     implements = ["auto_shared_fpic"]
 
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
     def export_sources(self):
         export_conandata_patches(self)
         copy(self, "conan_cmake_project_include.cmake", self.recipe_folder, os.path.join(self.export_sources_folder, "src"))
@@ -73,6 +79,7 @@ class ITKConan(ConanFile):
                         "cmake_minimum_required(VERSION 3.5)")
 
     def generate(self):
+        self._utils.configure_unity_build(self)
         tc = CMakeToolchain(self)
         #call find_package on top level
         tc.cache_variables["CMAKE_PROJECT_ITK_INCLUDE"] = "conan_cmake_project_include.cmake"
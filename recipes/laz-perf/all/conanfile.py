@@ -0,0 +1,72 @@
+import os
+
+from conan import ConanFile
+from conan.tools.apple import fix_apple_shared_install_name
+from conan.tools.build import check_min_cppstd
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
+from conan.tools.files import *
+
+required_conan_version = ">=2.1"
+
+
+class LazPerfConan(ConanFile):
+    name = "laz-perf"
+    description = "Alternative LAZ implementation for C++ and JavaScript, with chunked and streaming point decompression"
+    license = "Apache-2.0"
+    homepage = "https://github.com/hobuinc/laz-perf"
+    topics = ("laz", "las", "lidar", "point-cloud", "compression")
+    package_type = "library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+    }
+    implements = ["auto_shared_fpic"]
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
+
+    def validate(self):
+        check_min_cppstd(self, 17)
+
+    def build_requirements(self):
+        self.tool_requires("cmake/[>=3.15 <5]")
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.cache_variables["WITH_TESTS"] = False
+        tc.cache_variables["WITH_BENCHMARKS"] = False
+        tc.generate()
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def package(self):
+        copy(self, "LICENSE", self.source_folder, os.path.join(self.package_folder, "licenses"))
+        cmake = CMake(self)
+        cmake.install()
+        # Both the shared (lazperf) and the static (lazperf_s) library are always built upstream
+        if self.options.shared:
+            rm(self, "*lazperf_s.*", os.path.join(self.package_folder, "lib"))
+        else:
+            rm(self, "*lazperf.*", os.path.join(self.package_folder, "lib"))
+            rm(self, "*.dll", os.path.join(self.package_folder, "bin"))
+        rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+        fix_apple_shared_install_name(self)
+
+    def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "lazperf")
+        self.cpp_info.set_property("cmake_target_name", "LAZPERF::lazperf" if self.options.shared else "LAZPERF::lazperf_s")
+        self.cpp_info.set_property("cmake_target_aliases", ["lazperf::lazperf"])
+        self.cpp_info.libs = ["lazperf" if self.options.shared else "lazperf_s"]
+        if self.settings.os in ["Linux", "FreeBSD"]:
+            self.cpp_info.system_libs = ["m"]
@@ -0,0 +1,22 @@
+#include <lazperf/lazperf.hpp>
+
+#include <cstddef>
+#include <iostream>
+#include <vector>
+
+int main()
+{
+    std::vector<unsigned char> buf;
+    lazperf::OutCbStream stream([&buf](const unsigned char *b, size_t n) {
+        buf.insert(buf.end(), b, b + n);
+    });
+
+    // Compress a single zeroed point of format 0 (20 bytes)
+    lazperf::las_compressor::ptr compressor = lazperf::build_las_compressor(stream, 0);
+    char point[20] = {};
+    compressor->compress(point);
+    compressor->done();
+
+    std::cout << "Compressed one point into " << buf.size() << " bytes" << std::endl;
+    return 0;
+}
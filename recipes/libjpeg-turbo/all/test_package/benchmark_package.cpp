@@ -0,0 +1,81 @@
+#include <benchmark/benchmark.h>
+
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <vector>
+
+#include <jpeglib.h>
+
+static const int width = 1920;
+static const int height = 1080;
+
+static std::vector<uint8_t> encode(const std::vector<uint8_t> &rgb, int quality) {
+    jpeg_compress_struct cinfo;
+    jpeg_error_mgr jerr;
+    cinfo.err = jpeg_std_error(&jerr);
+    jpeg_create_compress(&cinfo);
+    unsigned char *buffer = nullptr;
+    unsigned long size = 0;
+    jpeg_mem_dest(&cinfo, &buffer, &size);
+    cinfo.image_width = width;
+    cinfo.image_height = height;
+    cinfo.input_components = 3;
+    cinfo.in_color_space = JCS_RGB;
+    jpeg_set_defaults(&cinfo);
+    jpeg_set_quality(&cinfo, quality, TRUE);
+    jpeg_start_compress(&cinfo, TRUE);
+    while (cinfo.next_scanline < cinfo.image_height) {
+        JSAMPROW row = const_cast<JSAMPROW>(&rgb[static_cast<size_t>(cinfo.next_scanline) * width * 3]);
+        jpeg_write_scanlines(&cinfo, &row, 1);
+    }
+    jpeg_finish_compress(&cinfo);
+    jpeg_destroy_compress(&cinfo);
+    std::vector<uint8_t> result(buffer, buffer + size);
+    free(buffer);
+    return result;
+}
+
+// A full HD frame of RGB gradients
+static const std::vector<uint8_t> &image() {
+    static const std::vector<uint8_t> rgb = [] {
+        std::vector<uint8_t> rgb(static_cast<size_t>(width) * height * 3);
+        for (size_t i = 0; i < rgb.size(); i++) {
+            rgb[i] = static_cast<uint8_t>(i % 3 == 0 ? i / 3 % width : i / 3 / width);
+        }
+        return rgb;
+    }();
+    return rgb;
+}
+
+static void BM_encode(benchmark::State &state) {
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(encode(image(), 90).data());
+    }
+    state.SetBytesProcessed(state.iterations() * image().size());
+}
+BENCHMARK(BM_encode)->Unit(benchmark::kMillisecond);
+
+static void BM_decode(benchmark::State &state) {
+    const auto jpeg = encode(image(), 90);
+    std::vector<uint8_t> rgb(image().size());
+    for (auto _ : state) {
+        jpeg_decompress_struct cinfo;
+        jpeg_error_mgr jerr;
+        cinfo.err = jpeg_std_error(&jerr);
+        jpeg_create_decompress(&cinfo);
+        jpeg_mem_src(&cinfo, jpeg.data(), jpeg.size());
+        jpeg_read_header(&cinfo, TRUE);
+        cinfo.out_color_space = JCS_RGB;
+        jpeg_start_decompress(&cinfo);
+        while (cinfo.output_scanline < cinfo.output_height) {
+            JSAMPROW row = &rgb[static_cast<size_t>(cinfo.output_scanline) * width * 3];
+            jpeg_read_scanlines(&cinfo, &row, 1);
+        }
+        jpeg_finish_decompress(&cinfo);
+        jpeg_destroy_decompress(&cinfo);
+        benchmark::DoNotOptimize(rgb.data());
+    }
+    state.SetBytesProcessed(state.iterations() * rgb.size());
+}
+BENCHMARK(BM_decode)->Unit(benchmark::kMillisecond);
@@ -0,0 +1,56 @@
+#include <benchmark/benchmark.h>
+#include <png.h>
+
+#include <cstdint>
+#include <cstring>
+#include <vector>
+
+static void write_callback(png_structp png_ptr, png_bytep data, png_size_t length) {
+    auto *out = static_cast<std::vector<uint8_t> *>(png_get_io_ptr(png_ptr));
+    out->insert(out->end(), data, data + length);
+}
+
+static void flush_callback(png_structp) {}
+
+static void read_callback(png_structp png_ptr, png_bytep data, png_size_t length) {
+    auto *in = static_cast<const uint8_t **>(png_get_io_ptr(png_ptr));
+    memcpy(data, *in, length);
+    *in += length;
+}
+
+// Decoding (inflate + row unfiltering) dominates libpng consumers, so only that is measured
+static void BM_decode(benchmark::State &state) {
+    const png_uint_32 width = 1920, height = 1080;
+    std::vector<uint8_t> row(width * 3);
+    std::vector<uint8_t> png;
+    png_structp write_ptr = png_create_write_struct(PNG_LIBPNG_VER_STRING, nullptr, nullptr, nullptr);
+    png_infop write_info = png_create_info_struct(write_ptr);
+    png_set_write_fn(write_ptr, &png, write_callback, flush_callback);
+    png_set_IHDR(write_ptr, write_info, width, height, 8, PNG_COLOR_TYPE_RGB, PNG_INTERLACE_NONE,
+                 PNG_COMPRESSION_TYPE_DEFAULT, PNG_FILTER_TYPE_DEFAULT);
+    png_write_info(write_ptr, write_info);
+    for (png_uint_32 y = 0; y < height; y++) {
+        for (png_uint_32 i = 0; i < row.size(); i++) {
+            row[i] = static_cast<uint8_t>(i * y / 64);
+        }
+        png_write_row(write_ptr, row.data());
+    }
+    png_write_end(write_ptr, nullptr);
+    png_destroy_write_struct(&write_ptr, &write_info);
+
+    for (auto _ : state) {
+        const uint8_t *in = png.data();
+        png_structp png_ptr = png_create_read_struct(PNG_LIBPNG_VER_STRING, nullptr, nullptr, nullptr);
+        png_infop info_ptr = png_create_info_struct(png_ptr);
+        png_set_read_fn(png_ptr, &in, read_callback);
+        png_read_info(png_ptr, info_ptr);
+        for (png_uint_32 y = 0; y < height; y++) {
+            png_read_row(png_ptr, row.data(), nullptr);
+        }
+        png_read_end(png_ptr, nullptr);
+        png_destroy_read_struct(&png_ptr, &info_ptr, nullptr);
+        benchmark::DoNotOptimize(row.data());
+    }
+    state.SetBytesProcessed(state.iterations() * static_cast<int64_t>(width) * height * 3);
+}
+BENCHMARK(BM_decode)->Unit(benchmark::kMillisecond);
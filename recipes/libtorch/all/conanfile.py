@@ -192,6 +192,9 @@ class LibtorchConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def package_id(self):
+        self._utils.debug_info_package_id(self)
+
     @property
     def _require_sleef(self):
         return not self._is_mobile_os and not self.settings.os == "Emscripten"
@@ -326,6 +329,7 @@ class LibtorchConan(ConanFile):
             self.tool_requires("flatbuffers/<host_version>")
         if self.options.with_cuda:
             self.cuda.tool_requires("nvcc")
+        self._utils.linker_tool_requires(self)
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version]["pytorch"], strip_root=True)
@@ -346,6 +350,8 @@ class LibtorchConan(ConanFile):
         replace_in_file(self, "caffe2/CMakeLists.txt", "TARGET_LINK_LIBRARIES(torch_cpu PRIVATE fxdiv)", "")
 
     def generate(self):
+        self._utils.configure_debug_info(self)
+        self._utils.configure_linker(self)
         tc = CMakeToolchain(self)
         tc.cache_variables["CMAKE_PROJECT_Torch_INCLUDE"] = "conan_deps.cmake"
         tc.cache_variables["ATEN_NO_TEST"] = True
@@ -494,6 +500,7 @@ class LibtorchConan(ConanFile):
         copy(self, "conan-official-libtorch-vars.cmake",
              self.export_sources_folder,
              os.path.join(self.package_folder, "lib/cmake/Torch"))
+        self._utils.package_debug_info(self)
 
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "Torch")
@@ -0,0 +1,66 @@
+import os
+
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.files import *
+from conan.tools.layout import basic_layout
+from conan.tools.meson import Meson, MesonToolchain
+
+required_conan_version = ">=2.4"
+
+
+class LibtraceeventConan(ConanFile):
+    name = "libtraceevent"
+    description = "Library to parse raw trace event formats of the Linux kernel"
+    license = ("LGPL-2.1-only", "GPL-2.0-only")
+    homepage = "https://git.kernel.org/pub/scm/libs/libtrace/libtraceevent.git"
+    topics = ("linux", "ftrace", "tracing", "perf", "tracepoints")
+    package_type = "library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+    }
+    implements = ["auto_shared_fpic"]
+    languages = ["C"]
+
+    def layout(self):
+        basic_layout(self, src_folder="src")
+
+    def validate(self):
+        if self.settings.os != "Linux":
+            raise ConanInvalidConfiguration(f"{self.ref} is only supported on Linux")
+
+    def build_requirements(self):
+        self.tool_requires("meson/[>=1.2.3 <2]")
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+    def generate(self):
+        tc = MesonToolchain(self)
+        tc.project_options["docs-build"] = False
+        tc.generate()
+
+    def build(self):
+        meson = Meson(self)
+        meson.configure()
+        meson.build()
+
+    def package(self):
+        copy(self, "*", os.path.join(self.source_folder, "LICENSES"), os.path.join(self.package_folder, "licenses"))
+        meson = Meson(self)
+        meson.install()
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        rmdir(self, os.path.join(self.package_folder, "share"))
+
+    def package_info(self):
+        self.cpp_info.libs = ["traceevent"]
+        self.cpp_info.set_property("pkg_config_name", "libtraceevent")
+        self.cpp_info.system_libs = ["dl"]
+        # The event format plugins are loaded at runtime from a path that is hardcoded at build time
+        self.runenv_info.define_path("TRACEEVENT_PLUGIN_DIR", os.path.join(self.package_folder, "lib", "traceevent", "plugins"))
@@ -0,0 +1,15 @@
+#include <traceevent/event-parse.h>
+
+#include <stdio.h>
+
+int main(void)
+{
+    struct tep_handle *tep = tep_alloc();
+    if (!tep) {
+        return 1;
+    }
+    tep_set_long_size(tep, sizeof(long));
+    printf("tep long size: %d\n", tep_get_long_size(tep));
+    tep_free(tep);
+    return 0;
+}
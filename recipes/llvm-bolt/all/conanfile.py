@@ -0,0 +1,88 @@
+import os
+
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.build import check_min_cppstd
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
+from conan.tools.files import *
+
+required_conan_version = ">=2.1"
+
+
+class LlvmBoltConan(ConanFile):
+    name = "llvm-bolt"
+    description = "BOLT: a post-link optimizer that improves the code layout of binaries based on execution profiles"
+    license = "Apache-2.0 WITH LLVM-exception"
+    homepage = "https://github.com/llvm/llvm-project/tree/main/bolt"
+    topics = ("llvm", "bolt", "optimization", "pgo", "post-link")
+    package_type = "application"
+    settings = "os", "arch", "compiler", "build_type"
+
+    no_copy_source = True
+
+    @property
+    def _llvm_target(self):
+        return {
+            "x86_64": "X86",
+            "armv8": "AArch64",
+            "riscv64": "RISCV",
+        }.get(str(self.settings.arch))
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
+
+    def package_id(self):
+        del self.info.settings.compiler
+
+    def validate_build(self):
+        check_min_cppstd(self, 17)
+
+    def validate(self):
+        if self.settings.os != "Linux":
+            raise ConanInvalidConfiguration("BOLT only supports Linux ELF binaries")
+        if self._llvm_target is None:
+            raise ConanInvalidConfiguration(f"BOLT does not support {self.settings.arch}")
+
+    def build_requirements(self):
+        self.tool_requires("cmake/[>=3.20 <5]")
+
+    def source(self):
+        sources = self.conan_data["sources"][self.version]
+        get(self, **sources["llvm"], destination="llvm", strip_root=True)
+        get(self, **sources["bolt"], destination="bolt", strip_root=True)
+        get(self, **sources["cmake"], destination="cmake", strip_root=True)
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.cache_variables["LLVM_ENABLE_PROJECTS"] = "bolt"
+        tc.cache_variables["LLVM_TARGETS_TO_BUILD"] = self._llvm_target
+        tc.cache_variables["BOLT_ENABLE_RUNTIME"] = True
+        tc.cache_variables["LLVM_INCLUDE_TESTS"] = False
+        tc.cache_variables["LLVM_INCLUDE_BENCHMARKS"] = False
+        tc.cache_variables["LLVM_INCLUDE_EXAMPLES"] = False
+        tc.cache_variables["LLVM_INCLUDE_DOCS"] = False
+        tc.cache_variables["LLVM_ENABLE_BINDINGS"] = False
+        tc.cache_variables["LLVM_ENABLE_ZLIB"] = False
+        tc.cache_variables["LLVM_ENABLE_ZSTD"] = False
+        tc.cache_variables["LLVM_ENABLE_LIBXML2"] = False
+        tc.cache_variables["LLVM_ENABLE_LIBEDIT"] = False
+        tc.cache_variables["LLVM_ENABLE_TERMINFO"] = False
+        tc.cache_variables["LLVM_ENABLE_Z3_SOLVER"] = False
+        tc.cache_variables["LLVM_ENABLE_ASSERTIONS"] = self.settings.build_type == "Debug"
+        tc.generate()
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure(build_script_folder="llvm")
+        # Only build llvm-bolt, perf2bolt, merge-fdata and the instrumentation runtime
+        cmake.build(target="bolt")
+
+    def package(self):
+        copy(self, "LICENSE.TXT", os.path.join(self.source_folder, "bolt"), os.path.join(self.package_folder, "licenses"))
+        cmake = CMake(self)
+        cmake.install(component="bolt")
+
+    def package_info(self):
+        self.cpp_info.includedirs = []
+        # lib/ only contains the libbolt_rt_*.a runtimes, which llvm-bolt locates relative to its own path
+        self.cpp_info.libdirs = []
@@ -116,6 +116,12 @@ class LLVMCoreConan(ConanFile):
 
     no_copy_source = True
 
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
     @property
     def _host_target(self):
         arch = str(self.settings.arch)
@@ -190,6 +196,9 @@ class LLVMCoreConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def package_id(self):
+        self._utils.debug_info_package_id(self)
+
     def requirements(self):
         if self.options.with_ffi:
             self.requires("libffi/[^3.4.4]")
@@ -207,6 +216,7 @@ class LLVMCoreConan(ConanFile):
     def build_requirements(self):
         self.tool_requires("cmake/[>=3.20 <5]")
         self.tool_requires("ninja/[^1.10]")
+        self._utils.linker_tool_requires(self)
 
     def validate(self):
         check_min_cppstd(self, 17)
@@ -257,6 +267,8 @@ class LLVMCoreConan(ConanFile):
             cmake_definitions["LLVM_RAM_PER_LINK_JOB"] = ram_per_link_job
 
     def generate(self):
+        self._utils.configure_debug_info(self)
+        self._utils.configure_linker(self)
         tc = CMakeToolchain(self, generator="Ninja")
         # https://releases.llvm.org/19.1.0/docs/CMake.html
         # Enables LLVM to find conan libraries during try_compile
@@ -472,6 +484,7 @@ class LLVMCoreConan(ConanFile):
         )
 
         self._write_build_info(self._build_info_file)
+        self._utils.package_debug_info(self)
 
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "LLVM")
@@ -0,0 +1,236 @@
+import os
+
+from conan import ConanFile
+from conan.tools.build import check_min_cppstd
+from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
+from conan.tools.files import *
+
+required_conan_version = ">=2.1"
+
+
+class NcnnConan(ConanFile):
+    name = "ncnn"
+    description = "ncnn is a high-performance neural network inference framework optimized for mobile and embedded platforms"
+    license = "BSD-3-Clause"
+    homepage = "https://github.com/Tencent/ncnn"
+    topics = ("deep-learning", "neural-network", "inference", "vulkan", "arm-neon", "mobile")
+    package_type = "library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "with_vulkan": [True, False],
+        "with_openmp": [True, False],
+        "int8": [True, False],
+        "bf16": [True, False],
+        "runtime_cpu": [True, False],
+        "c_api": [True, False],
+        "pixel": [True, False],
+        "stdio": [True, False],
+        "string": [True, False],
+        "simpleocv": [True, False],
+        # x86
+        "avx": [True, False],
+        "fma": [True, False],
+        "f16c": [True, False],
+        "avx2": [True, False],
+        "avx_vnni": [True, False],
+        "avx512": [True, False],
+        "avx512_vnni": [True, False],
+        "avx512_bf16": [True, False],
+        # armv7
+        "vfpv4": [True, False],
+        # armv8
+        "arm82": [True, False],
+        "arm82_dot": [True, False],
+        "arm84_bf16": [True, False],
+        "arm84_i8mm": [True, False],
+        # riscv
+        "rvv": [True, False],
+        "zfh": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "with_vulkan": False,
+        "with_openmp": True,
+        "int8": True,
+        "bf16": True,
+        "runtime_cpu": True,
+        "c_api": True,
+        "pixel": True,
+        "stdio": True,
+        "string": True,
+        "simpleocv": False,
+        "avx": True,
+        "fma": True,
+        "f16c": True,
+        "avx2": True,
+        "avx_vnni": True,
+        "avx512": True,
+        "avx512_vnni": True,
+        "avx512_bf16": True,
+        "vfpv4": True,
+        "arm82": True,
+        "arm82_dot": True,
+        "arm84_bf16": True,
+        "arm84_i8mm": True,
+        "rvv": True,
+        "zfh": True,
+    }
+    options_description = {
+        "with_vulkan": "Vulkan GPU compute support, using the glslang and vulkan-loader packages",
+        "int8": "int8 quantized inference",
+        "bf16": "bf16 storage and inference",
+        "runtime_cpu": "Build the enabled instruction set variants of the kernels and select one at runtime",
+        "c_api": "Build the C API",
+        "pixel": "Image pixel conversion, resize, rotate, affine and drawing routines",
+        "stdio": "Load models from files with stdio",
+        "string": "Load param files with plain strings and print verbose messages",
+        "simpleocv": "Provide a minimal OpenCV-compatible cv::Mat and imread/imwrite emulation",
+        "vfpv4": "Build the VFPv4 (fp16 conversion) kernels for armv7 NEON",
+        "arm82": "Build the ARMv8.2 fp16 arithmetic NEON kernels",
+        "arm82_dot": "Build the ARMv8.2 dot product NEON kernels",
+        "arm84_bf16": "Build the ARMv8.4 bf16 NEON kernels",
+        "arm84_i8mm": "Build the ARMv8.4 int8 matrix multiplication NEON kernels",
+        "rvv": "Build the RISC-V vector extension kernels",
+        "zfh": "Build the RISC-V half-precision floating point kernels",
+    }
+    implements = ["auto_shared_fpic"]
+
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+
+        arch = str(self.settings.arch)
+        if arch not in ["x86", "x86_64"]:
+            del self.options.avx
+            del self.options.fma
+            del self.options.f16c
+            del self.options.avx2
+            del self.options.avx_vnni
+            del self.options.avx512
+            del self.options.avx512_vnni
+            del self.options.avx512_bf16
+        if not arch.startswith("armv7"):
+            del self.options.vfpv4
+        if arch not in ["armv8", "armv8.3", "arm64ec"]:
+            del self.options.arm82
+            del self.options.arm82_dot
+            del self.options.arm84_bf16
+            del self.options.arm84_i8mm
+        if arch != "riscv64":
+            del self.options.rvv
+            del self.options.zfh
+
+    def configure(self):
+        if self.options.shared:
+            self.options.rm_safe("fPIC")
+        if not self.options.int8:
+            self.options.rm_safe("avx_vnni")
+            self.options.rm_safe("avx512_vnni")
+            self.options.rm_safe("arm82_dot")
+            self.options.rm_safe("arm84_i8mm")
+        if not self.options.bf16:
+            self.options.rm_safe("avx512_bf16")
+            self.options.rm_safe("arm84_bf16")
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
+
+    def requirements(self):
+        if self.options.with_openmp:
+            self.requires("openmp/system")
+        if self.options.with_vulkan:
+            # gpu.h includes vulkan.h
+            self.requires("vulkan-loader/[^1.3]", transitive_headers=True, transitive_libs=True)
+            self.requires("glslang/[>=1.3.296 <2]")
+
+    def validate(self):
+        check_min_cppstd(self, 11)
+
+    def build_requirements(self):
+        self.tool_requires("cmake/[>=3.15 <5]")
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.cache_variables["NCNN_SHARED_LIB"] = self.options.shared
+        tc.cache_variables["NCNN_INSTALL_SDK"] = True
+        tc.cache_variables["NCNN_BUILD_TOOLS"] = False
+        tc.cache_variables["NCNN_BUILD_EXAMPLES"] = False
+        tc.cache_variables["NCNN_BUILD_BENCHMARK"] = False
+        tc.cache_variables["NCNN_BUILD_TESTS"] = False
+        tc.cache_variables["NCNN_PYTHON"] = False
+        tc.cache_variables["NCNN_ENABLE_LTO"] = False
+
+        tc.cache_variables["NCNN_OPENMP"] = self.options.with_openmp
+        tc.cache_variables["NCNN_SIMPLEOMP"] = False
+        tc.cache_variables["NCNN_INT8"] = self.options.int8
+        tc.cache_variables["NCNN_BF16"] = self.options.bf16
+        tc.cache_variables["NCNN_RUNTIME_CPU"] = self.options.runtime_cpu
+        tc.cache_variables["NCNN_C_API"] = self.options.c_api
+        tc.cache_variables["NCNN_PIXEL"] = self.options.pixel
+        tc.cache_variables["NCNN_STDIO"] = self.options.stdio
+        tc.cache_variables["NCNN_STRING"] = self.options.string
+        tc.cache_variables["NCNN_SIMPLEOCV"] = self.options.simpleocv
+
+        # Vulkan
+        tc.cache_variables["NCNN_VULKAN"] = self.options.with_vulkan
+        if self.options.with_vulkan:
+            # Link against the packaged loader and glslang instead of the bundled simplevk loader
+            # and the glslang git submodule, which is not part of the release tarball
+            tc.cache_variables["NCNN_SIMPLEVK"] = False
+            tc.cache_variables["NCNN_SYSTEM_GLSLANG"] = True
+
+        # CPU dispatch variants, each one is only available if supported by the compiler
+        tc.cache_variables["NCNN_AVX"] = self.options.get_safe("avx", False)
+        tc.cache_variables["NCNN_FMA"] = self.options.get_safe("fma", False)
+        tc.cache_variables["NCNN_F16C"] = self.options.get_safe("f16c", False)
+        tc.cache_variables["NCNN_AVX2"] = self.options.get_safe("avx2", False)
+        tc.cache_variables["NCNN_AVXVNNI"] = self.options.get_safe("avx_vnni", False)
+        tc.cache_variables["NCNN_AVX512"] = self.options.get_safe("avx512", False)
+        tc.cache_variables["NCNN_AVX512VNNI"] = self.options.get_safe("avx512_vnni", False)
+        tc.cache_variables["NCNN_AVX512BF16"] = self.options.get_safe("avx512_bf16", False)
+        tc.cache_variables["NCNN_VFPV4"] = self.options.get_safe("vfpv4", False)
+        tc.cache_variables["NCNN_ARM82"] = self.options.get_safe("arm82", False)
+        tc.cache_variables["NCNN_ARM82DOT"] = self.options.get_safe("arm82_dot", False)
+        tc.cache_variables["NCNN_ARM84BF16"] = self.options.get_safe("arm84_bf16", False)
+        tc.cache_variables["NCNN_ARM84I8MM"] = self.options.get_safe("arm84_i8mm", False)
+        tc.cache_variables["NCNN_RVV"] = self.options.get_safe("rvv", False)
+        tc.cache_variables["NCNN_ZFH"] = self.options.get_safe("zfh", False)
+        tc.generate()
+
+        deps = CMakeDeps(self)
+        deps.set_property("vulkan-loader", "cmake_target_name", "Vulkan::Vulkan")
+        deps.generate()
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def package(self):
+        copy(self, "LICENSE.txt", self.source_folder, os.path.join(self.package_folder, "licenses"))
+        cmake = CMake(self)
+        cmake.install()
+        rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+
+    def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "ncnn")
+        self.cpp_info.set_property("cmake_target_name", "ncnn")
+        self.cpp_info.set_property("pkg_config_name", "ncnn")
+        self.cpp_info.libs = ["ncnnd" if self.settings.build_type == "Debug" else "ncnn"]
+        self.cpp_info.includedirs.append(os.path.join("include", "ncnn"))
+        if self.settings.os in ["Linux", "FreeBSD"]:
+            self.cpp_info.system_libs = ["m", "pthread", "dl"]
+        elif self.settings.os == "Android":
+            self.cpp_info.system_libs = ["android", "jnigraphics", "log"]
+
+        if self.options.with_openmp:
+            self.cpp_info.requires.append("openmp::openmp")
+        if self.options.with_vulkan:
+            self.cpp_info.requires.extend(["vulkan-loader::vulkan-loader", "glslang::glslang-core", "glslang::spirv"])
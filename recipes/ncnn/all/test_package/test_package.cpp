@@ -0,0 +1,25 @@
+#include <cstdio>
+
+#include <ncnn/layer.h>
+#include <ncnn/mat.h>
+#include <ncnn/net.h>
+
+int main()
+{
+    ncnn::Net net;
+    net.opt.num_threads = 1;
+
+    ncnn::Layer* relu = ncnn::create_layer("ReLU");
+    ncnn::ParamDict pd;
+    relu->load_param(pd);
+    relu->create_pipeline(net.opt);
+
+    ncnn::Mat m(4, 4, 3);
+    m.fill(-1.f);
+    relu->forward_inplace(m, net.opt);
+    relu->destroy_pipeline(net.opt);
+    delete relu;
+
+    printf("ncnn ReLU(-1) = %f\n", m[0]);
+    return m[0] == 0.f ? 0 : 1;
+}
@@ -38,9 +38,13 @@ class Open3dConan(ConanFile):
     }
     implements = ["auto_shared_fpic"]
 
-    python_requires = "conan-cuda/latest"
+    python_requires = ["conan-cuda/latest", "conan-utils/latest"]
     python_requires_extend = "conan-cuda.Cuda"
 
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
     def export_sources(self):
         export_conandata_patches(self)
         copy(self, "conan_deps.cmake", self.recipe_folder, os.path.join(self.export_sources_folder, "src"))
@@ -130,6 +134,7 @@ class Open3dConan(ConanFile):
                 rmdir(self, p)
 
     def generate(self):
+        self._utils.configure_unity_build(self)
         tc = CMakeToolchain(self)
         tc.cache_variables["CMAKE_PROJECT_Open3D_INCLUDE"] = "conan_deps.cmake"
         tc.cache_variables["BUILD_EXAMPLES"] = False
@@ -34,6 +34,7 @@ class OpenCascadeConan(ConanFile):
         "with_tk": [True, False],
         "with_tbb": [True, False],
         "with_opengl": [True, False],
+        "allocator": ["native", "tbb", "jemalloc"],
         "extended_debug_messages": [True, False],
     }
     default_options = {
@@ -47,8 +48,18 @@ class OpenCascadeConan(ConanFile):
         "with_tk": True,
         "with_tbb": True,
         "with_opengl": True,
+        "allocator": "native",
         "extended_debug_messages": False,
     }
+    options_description = {
+        "allocator": "Memory manager used by Standard::Allocate() (USE_MMGR_TYPE)",
+    }
+
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
 
     @property
     def _is_linux(self):
@@ -88,6 +99,8 @@ class OpenCascadeConan(ConanFile):
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.allocator == "tbb":
+            self.options["onetbb"].tbbmalloc = True
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -113,20 +126,25 @@ class OpenCascadeConan(ConanFile):
             self.requires("rapidjson/[>=cci.20250205]")
         if self.options.get_safe("with_draco"):
             self.requires("draco/1.5.6")
-        if self.options.with_tbb:
+        if self.options.with_tbb or self.options.allocator == "tbb":
             self.requires("onetbb/[>=2021 <2023]")
+        if self.options.allocator == "jemalloc":
+            self.requires("jemalloc/[^5.3.0]")
 
     def validate(self):
         check_min_cppstd(self, self._min_cppstd)
         if self.settings.compiler == "clang" and self.settings.compiler.version == "6.0" and \
            self.settings.build_type == "Release":
             raise ConanInvalidConfiguration(f"{self.ref} doesn't support Clang 6.0 if Release build type")
+        if self.options.allocator == "tbb" and not self.dependencies["onetbb"].options.tbbmalloc:
+            raise ConanInvalidConfiguration(f"{self.ref} allocator=tbb requires -o onetbb/*:tbbmalloc=True")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
         apply_conandata_patches(self)
 
     def generate(self):
+        self._utils.configure_unity_build(self)
         tc = CMakeToolchain(self)
 
         if Version(self.version) >= "7.8.0":
@@ -167,6 +185,7 @@ class OpenCascadeConan(ConanFile):
         tc.cache_variables["USE_FFMPEG"] = self.options.with_ffmpeg
         tc.cache_variables["USE_TBB"] = self.options.with_tbb
         tc.cache_variables["USE_RAPIDJSON"] = self.options.with_rapidjson
+        tc.cache_variables["USE_MMGR_TYPE"] = str(self.options.allocator).upper()
         if Version(self.version) >= "7.6.0":
             tc.cache_variables["USE_DRACO"] = self.options.with_draco
             tc.cache_variables["USE_TK"] = self.options.with_tk
@@ -297,6 +316,23 @@ class OpenCascadeConan(ConanFile):
                 "set (CSF_TBB \"tbb tbbmalloc\")",
                 f"set (CSF_TBB \"{tbb_libs}\")",
             )
+        ## memory manager
+        if self.options.allocator == "tbb":
+            tbbmalloc_libs = " ".join(self.dependencies["onetbb"].cpp_info.components["tbbmalloc"].libs)
+            replace_in_file(
+                self,
+                occt_csf_cmake,
+                "set (CSF_MMGR \"tbbmalloc\")",
+                f"set (CSF_MMGR \"{tbbmalloc_libs}\")",
+            )
+        elif self.options.allocator == "jemalloc":
+            jemalloc_libs = " ".join(self.dependencies["jemalloc"].cpp_info.aggregated_components().libs)
+            replace_in_file(
+                self,
+                occt_csf_cmake,
+                "set (CSF_MMGR \"jemalloc\")",
+                f"set (CSF_MMGR \"{jemalloc_libs}\")",
+            )
         ## ffmpeg
         if self.options.with_ffmpeg:
             deps_targets.append("ffmpeg::ffmpeg")
@@ -448,8 +484,8 @@ class OpenCascadeConan(ConanFile):
             "CSF_Draco": {"externals": ["draco::draco"] if self.options.get_safe("with_draco") else []},
             "CSF_TBB": {"externals": ["onetbb::onetbb"] if self.options.with_tbb else []},
             "CSF_VTK": {},
-            # TODO: If requested, allow jemalloc/tbb instead of default native
-            "CSF_MMGR": {},
+            "CSF_MMGR": {"externals": ["onetbb::tbbmalloc"] if self.options.allocator == "tbb" else
+                                      ["jemalloc::jemalloc"] if self.options.allocator == "jemalloc" else []},
             # Android system libs
             "CSF_androidlog": {"system_libs": ["log"] if self.settings.os == "Android" else []},
             # Linux system libs
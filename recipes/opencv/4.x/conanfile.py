@@ -134,7 +134,7 @@ class OpenCVConan(ConanFile):
         "with_jpeg": [True, False],
         "with_jpegxl": [True, False],
         "with_jpeg2000": [False, "jasper", "openjpeg"],
-        "with_png": [True, False],
+        "with_png": [False, "libpng", "libspng"],
         "with_tiff": [True, False],
         "with_openexr": [True, False],
         "with_webp": [True, False],
@@ -205,7 +205,7 @@ class OpenCVConan(ConanFile):
         "with_jpeg": True,
         "with_jpegxl": False,
         "with_jpeg2000": False,
-        "with_png": True,
+        "with_png": "libpng",
         "with_tiff": True,
         "with_openexr": False,
         "with_webp": True,
@@ -255,9 +255,13 @@ class OpenCVConan(ConanFile):
     }
     default_options.update({_name: False for _name in OPENCV_EXTRA_MODULES_OPTIONS})
 
-    python_requires = "conan-cuda/latest"
+    python_requires = ["conan-cuda/latest", "conan-utils/latest"]
     python_requires_extend = "conan-cuda.Cuda"
 
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
     @property
     def _is_cl_like(self):
         return self.settings.compiler.get_safe("runtime") is not None
@@ -479,8 +483,10 @@ class OpenCVConan(ConanFile):
                 components.append("libjxl::libjxl")
             if self.options.get_safe("with_jpeg2000"):
                 components.append("{0}::{0}".format(self.options.with_jpeg2000))
-            if self.options.get_safe("with_png"):
+            if self.options.get_safe("with_png") == "libpng":
                 components.append("libpng::libpng")
+            elif self.options.get_safe("with_png") == "libspng":
+                components.append("libspng::libspng")
             if self.options.get_safe("with_tiff"):
                 components.append("libtiff::tiff")
             if self.options.get_safe("with_openexr"):
@@ -1244,6 +1250,7 @@ class OpenCVConan(ConanFile):
     def package_id(self):
         del self.info.options.build_all_base
         del self.info.options.build_all_contrib
+        self._utils.debug_info_package_id(self)
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -1313,8 +1320,10 @@ class OpenCVConan(ConanFile):
             self.requires("openjpeg/[^2.5.2]")
         elif self.options.get_safe("with_jpeg2000") == "jasper":
             self.requires("jasper/[^4.2]")
-        if self.options.get_safe("with_png"):
+        if self.options.get_safe("with_png") == "libpng":
             self.requires("libpng/[~1.6]")
+        elif self.options.get_safe("with_png") == "libspng":
+            self.requires("libspng/[>=0.7.4 <1]")
         if self.options.get_safe("with_openexr"):
             self.requires("openexr/[^3.3.3]")
         if self.options.get_safe("with_tiff"):
@@ -1410,6 +1419,8 @@ class OpenCVConan(ConanFile):
             )
         if self.options.get_safe("with_jpeg2000") == "openjpeg" and Version(self.version) < "4.3.0":
             raise ConanInvalidConfiguration("openjpeg is not available for OpenCV before 4.3.0")
+        if self.options.get_safe("with_png") == "libspng" and Version(self.version) < "4.7.0":
+            raise ConanInvalidConfiguration("libspng is not available for OpenCV before 4.7.0")
         if self.options.with_cuda:
             self.cuda.validate_settings()
             if Version(self.version) <= "4.12.0" and self.cuda.major >= 13:
@@ -1522,6 +1533,8 @@ class OpenCVConan(ConanFile):
                             "# ocv_set_cuda_arch_bin_and_ptx(")
 
     def generate(self):
+        self._utils.configure_debug_info(self)
+        self._utils.configure_unity_build(self, unsupported_reason="conflicting file-local symbols in module sources")
         tc = CMakeToolchain(self)
         tc.variables["OPENCV_CONFIG_INSTALL_PATH"] = "cmake"
         tc.variables["OPENCV_BIN_INSTALL_PATH"] = "bin"
@@ -1636,7 +1649,7 @@ class OpenCVConan(ConanFile):
         tc.variables["WITH_WEBP"] = self.options.get_safe("with_webp", False)
         tc.variables["WITH_JPEG"] = bool(self.options.get_safe("with_jpeg", False))
         tc.variables["WITH_JPEGXL"] = self.options.get_safe("with_jpegxl", False)
-        tc.variables["WITH_PNG"] = self.options.get_safe("with_png", False)
+        tc.variables["WITH_PNG"] = self.options.get_safe("with_png") == "libpng"
         if self._has_with_tiff_option:
             tc.variables["WITH_TIFF"] = self.options.get_safe("with_tiff", False)
         if self._has_with_jpeg2000_option:
@@ -1671,7 +1684,8 @@ class OpenCVConan(ConanFile):
         if Version(self.version) >= "4.7.0":
             tc.variables["ENABLE_DELAYLOAD"] = False
             tc.variables["WITH_CANN"] = False
-            tc.variables["WITH_SPNG"] = False # TODO: change with_png recipe option in order to use either libpng or libspng
+            tc.variables["WITH_SPNG"] = self.options.get_safe("with_png") == "libspng"
+            tc.variables["BUILD_SPNG"] = False
             tc.variables["WITH_WAYLAND"] = self.options.get_safe("with_wayland", False)
 
         if Version(self.version) >= "4.8.0":
@@ -1762,6 +1776,8 @@ class OpenCVConan(ConanFile):
         deps.set_property("ittapi", "cmake_file_name", "ITT")
         deps.set_property("libjxl", "cmake_file_name", "JPEGXL")
         deps.set_property("openni2", "cmake_file_name", "OPENNI2")
+        # OpenCV links against spng::spng regardless of the libspng library type
+        deps.set_property("libspng", "cmake_target_name", "spng::spng")
         deps.generate()
 
         if self._build_depends_on_pkgconfig:
@@ -1848,6 +1864,7 @@ class OpenCVConan(ConanFile):
             rename(self, os.path.join(self.package_folder, "setup_vars_opencv4.cmd"),
                          os.path.join(self.package_folder, "share", "setup_vars_opencv4.cmd"))
         self._create_cmake_module_variables(os.path.join(self.package_folder, self._module_vars_rel_path))
+        self._utils.package_debug_info(self)
 
     def _create_cmake_module_variables(self, module_file):
         """
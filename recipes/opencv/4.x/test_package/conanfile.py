@@ -36,7 +36,7 @@ class TestPackageConan(ConanFile):
             if module == "core":
                 tc.variables[cmake_option] = True
             elif module == "imgcodecs":
-                tc.variables[cmake_option] = self.dependencies["opencv"].options.imgcodecs and self.dependencies["opencv"].options.with_png
+                tc.variables[cmake_option] = bool(self.dependencies["opencv"].options.imgcodecs and self.dependencies["opencv"].options.with_png)
             elif module == "videoio":
                 tc.variables[cmake_option] = self.dependencies["opencv"].options.videoio and self.dependencies["opencv"].options.with_ffmpeg
             else:
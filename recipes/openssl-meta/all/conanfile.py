@@ -0,0 +1,98 @@
+import os
+import textwrap
+
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.files import *
+
+required_conan_version = ">=2.1"
+
+
+class OpensslMetaConan(ConanFile):
+    name = "openssl-meta"
+    version = "latest"
+    description = ("Conan meta-package to replace OpenSSL with one of its API-compatible alternatives. "
+                   "Use '[replace_requires] openssl/*: openssl-meta/latest' in a profile to swap the provider "
+                   "for all consumers of openssl. OpenSSL itself is not a provider, since it would require itself.")
+    topics = ("ssl", "tls", "openssl", "meta-package")
+    package_type = "header-library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "provider": ["aws-lc", "libressl"],
+    }
+    default_options = {
+        "shared": False,
+        "provider": "aws-lc",
+    }
+    options_description = {
+        "shared": "Must match the shared option of the provider, exposed for consumers that check openssl/*:shared",
+    }
+
+    def requirements(self):
+        if self.options.provider == "aws-lc":
+            self.requires("aws-lc/[^1.48]", transitive_headers=True, transitive_libs=True)
+        elif self.options.provider == "libressl":
+            self.requires("libressl/[>=3.5.3]", transitive_headers=True, transitive_libs=True)
+
+    def validate(self):
+        provider = str(self.options.provider)
+        if self.dependencies[provider].options.shared != self.options.shared:
+            raise ConanInvalidConfiguration(f"-o {provider}/*:shared={self.options.shared} is required to match openssl-meta/*:shared")
+        if self.options.provider == "aws-lc" and not self.dependencies["aws-lc"].options.build_libssl:
+            raise ConanInvalidConfiguration("-o aws-lc/*:build_libssl=True is required")
+
+    def package_id(self):
+        self.info.settings.clear()
+        del self.info.options.shared
+
+    def _cmake_variables(self):
+        # Mimic the result variables of CMake's FindOpenSSL
+        provider_cmake_name = {
+            "aws-lc": "aws-lc",
+            "libressl": "LibreSSL",
+        }[str(self.options.provider)]
+        # The OPENSSL_VERSION_NUMBER reported by the providers' headers
+        openssl_version = {
+            "aws-lc": "1.1.1",
+            "libressl": "2.0.0",
+        }[str(self.options.provider)]
+        return textwrap.dedent(f"""\
+            set(OPENSSL_FOUND TRUE)
+            set(OPENSSL_INCLUDE_DIR ${{{provider_cmake_name}_INCLUDE_DIR}})
+            set(OPENSSL_CRYPTO_LIBRARY OpenSSL::Crypto)
+            set(OPENSSL_CRYPTO_LIBRARIES OpenSSL::Crypto)
+            set(OPENSSL_SSL_LIBRARY OpenSSL::SSL)
+            set(OPENSSL_SSL_LIBRARIES OpenSSL::SSL)
+            set(OPENSSL_LIBRARIES OpenSSL::SSL OpenSSL::Crypto)
+            set(OPENSSL_VERSION {openssl_version})
+        """)
+
+    def package(self):
+        save(self, os.path.join(self.package_folder, "share", "conan", "openssl-variables.cmake"),
+             self._cmake_variables())
+
+    def package_info(self):
+        provider = str(self.options.provider)
+        self.cpp_info.set_property("cmake_find_mode", "both")
+        self.cpp_info.set_property("cmake_file_name", "OpenSSL")
+        self.cpp_info.set_property("cmake_build_modules", ["share/conan/openssl-variables.cmake"])
+        self.cpp_info.components["crypto"].set_property("cmake_target_name", "OpenSSL::Crypto")
+        self.cpp_info.components["ssl"].set_property("cmake_target_name", "OpenSSL::SSL")
+        self.cpp_info.builddirs = ["share/conan"]
+        # The pkg-config files (openssl.pc, libssl.pc, libcrypto.pc) are provided by all providers
+        self.cpp_info.set_property("pkg_config_name", "none")
+
+        # Use the same component names as the openssl package, so that openssl::ssl and openssl::crypto
+        # in consumers are mapped correctly with [replace_requires]
+        self.cpp_info.components["crypto"].requires = [f"{provider}::crypto"]
+        self.cpp_info.components["ssl"].requires = ["crypto", f"{provider}::ssl"]
+
+        def _clear_dirs(cpp_info):
+            cpp_info.includedirs = []
+            cpp_info.libdirs = []
+            cpp_info.bindirs = []
+
+        _clear_dirs(self.cpp_info)
+        _clear_dirs(self.cpp_info.components["crypto"])
+        _clear_dirs(self.cpp_info.components["ssl"])
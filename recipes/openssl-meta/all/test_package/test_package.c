@@ -0,0 +1,28 @@
+#include <stdio.h>
+#include <string.h>
+
+#include <openssl/crypto.h>
+#include <openssl/evp.h>
+#include <openssl/ssl.h>
+
+int main()
+{
+    const char message[] = "openssl-meta";
+    unsigned char digest[EVP_MAX_MD_SIZE];
+    unsigned int digest_len = 0;
+
+    printf("%s\n", OpenSSL_version(OPENSSL_VERSION));
+
+    if (!EVP_Digest(message, strlen(message), digest, &digest_len, EVP_sha256(), NULL))
+        return 1;
+    printf("SHA-256: ");
+    for (unsigned int i = 0; i < digest_len; i++)
+        printf("%02x", digest[i]);
+    printf("\n");
+
+    SSL_CTX *ctx = SSL_CTX_new(TLS_method());
+    if (ctx == NULL)
+        return 1;
+    SSL_CTX_free(ctx);
+    return 0;
+}
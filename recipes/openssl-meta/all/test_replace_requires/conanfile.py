@@ -0,0 +1,35 @@
+import os
+
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.build import can_run
+from conan.tools.cmake import CMake, cmake_layout
+
+
+# Consumes openssl like any other recipe does, run with the replace_requires.profile in this folder:
+#   conan test test_replace_requires openssl-meta/latest -pr:h default -pr:h test_replace_requires/replace_requires.profile
+# Consumers reading openssl options must use get_safe(), since openssl-meta does not mirror them. podofo is checked with:
+#   conan create ../../podofo/all --version 0.10.5 -pr:h default -pr:h test_replace_requires/replace_requires.profile
+class TestPackageConan(ConanFile):
+    settings = "os", "arch", "compiler", "build_type"
+    generators = "CMakeToolchain", "CMakeDeps"
+
+    def layout(self):
+        cmake_layout(self)
+
+    def requirements(self):
+        self.requires("openssl/[>=1.1 <4]")
+
+    def validate(self):
+        if "openssl-meta" not in [dep.ref.name for dep in self.dependencies.values()]:
+            raise ConanInvalidConfiguration("openssl was not replaced, add -pr:h test_replace_requires/replace_requires.profile")
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def test(self):
+        if can_run(self):
+            bin_path = os.path.join(self.cpp.build.bindir, "test_package")
+            self.run(bin_path, env="conanrun")
@@ -0,0 +1,2 @@
+[replace_requires]
+openssl/*: openssl-meta/latest
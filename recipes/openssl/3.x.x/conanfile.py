@@ -1,5 +1,6 @@
 import fnmatch
 import os
+import re
 import textwrap
 
 from conan import ConanFile
@@ -31,6 +32,7 @@ class OpenSSLConan(ConanFile):
         "capieng_dialog": [True, False],
         "enable_capieng": [True, False],
         "enable_trace": [True, False],
+        "with_ktls": [True, False],
         "no_aria": [True, False],
         "no_apps": [True, False],
         "no_autoload_config": [True, False],
@@ -114,6 +116,8 @@ class OpenSSLConan(ConanFile):
             self.options.rm_safe("enable_capieng")
         else:
             self.options.rm_safe("fPIC")
+        if self.settings.os not in ["Linux", "FreeBSD"]:
+            self.options.rm_safe("with_ktls")
 
     def configure(self):
         if self.options.shared:
@@ -367,6 +371,9 @@ class OpenSSLConan(ConanFile):
         if self.options.get_safe("enable_trace"):
             args.append("enable-trace")
 
+        if self.options.get_safe("with_ktls"):
+            args.append("enable-ktls")
+
         if self.settings.os == "Neutrino":
             args.append("no-asm -lsocket -latomic")
 
@@ -512,6 +519,8 @@ class OpenSSLConan(ConanFile):
                                 r'$makedepcmd $cflags $defs $srcs > $dep 2>&1')
 
             self.run(f"{self._perl} ./Configure {args}", env="conanbuild")
+            if self.options.get_safe("with_ktls"):
+                self._check_ktls_enabled()
             if self._use_nmake:
                 # When `--prefix=/`, the scripts derive `\` without escaping, which
                 # causes issues on Windows
@@ -534,6 +543,15 @@ class OpenSSLConan(ConanFile):
                 else:
                     raise
 
+    def _check_ktls_enabled(self):
+        # Configure silently disables kTLS if the target's kernel headers are too old (Linux < 4.13)
+        configdata = load(self, os.path.join(self.source_folder, "configdata.pm"))
+        disabled = re.search(r"our %disabled = \((.*?)\);", configdata, re.DOTALL)
+        reason = re.search(r'"ktls"\s*=>\s*"([^"]+)"', disabled.group(1)) if disabled else None
+        if reason:
+            raise ConanException(f"with_ktls=True, but kTLS support was disabled by Configure ({reason.group(1)}). "
+                                 "Kernel headers with linux/tls.h from Linux 4.13 or newer are required.")
+
     def _make_install(self):
         with chdir(self, self.source_folder):
             self._run_make(targets=["install_sw"], parallel=False, install=True)
@@ -20,11 +20,16 @@ class TestPackageConan(ConanFile):
             ((not self.dependencies["openssl"].options.no_md4) or
               (not self.dependencies["openssl"].options.no_rmd160)))
 
+    @property
+    def _with_ktls(self):
+        return bool(self.dependencies["openssl"].options.get_safe("with_ktls"))
+
     def generate(self):
         tc = CMakeToolchain(self)
         tc.cache_variables["OPENSSL_WITH_LEGACY"] = self._with_legacy()
         tc.cache_variables["OPENSSL_WITH_MD4"] = not self.dependencies["openssl"].options.no_md4
         tc.cache_variables["OPENSSL_WITH_RIPEMD160"] = not self.dependencies["openssl"].options.no_rmd160
+        tc.cache_variables["OPENSSL_WITH_KTLS"] = self._with_ktls
         tc.generate()
 
     def build(self):
@@ -36,3 +41,6 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindir, "test_package")
             self.run(bin_path, env="conanrun")
+            if self._with_ktls:
+                bin_path = os.path.join(self.cpp.build.bindir, "test_ktls")
+                self.run(bin_path, env="conanrun")
@@ -0,0 +1,155 @@
+// Performs a TLS 1.3 handshake over loopback TCP and checks that kTLS was enabled for sending.
+#include <stdio.h>
+#include <string.h>
+#include <fcntl.h>
+#include <unistd.h>
+#include <arpa/inet.h>
+#include <netinet/in.h>
+#include <sys/socket.h>
+
+#include <openssl/ssl.h>
+#include <openssl/err.h>
+#include <openssl/evp.h>
+#include <openssl/x509.h>
+
+static int kernel_tls_available(void)
+{
+#if defined(__linux__)
+    char buf[256] = {0};
+    FILE *f = fopen("/proc/sys/net/ipv4/tcp_available_ulp", "r");
+    if (f == NULL)
+        return 0;
+    size_t n = fread(buf, 1, sizeof(buf) - 1, f);
+    fclose(f);
+    buf[n] = '\0';
+    return strstr(buf, "tls") != NULL;
+#else
+    return 1;
+#endif
+}
+
+static X509 *make_cert(EVP_PKEY *pkey)
+{
+    X509 *cert = X509_new();
+    X509_set_version(cert, 2);
+    ASN1_INTEGER_set(X509_get_serialNumber(cert), 1);
+    X509_gmtime_adj(X509_getm_notBefore(cert), 0);
+    X509_gmtime_adj(X509_getm_notAfter(cert), 3600);
+    X509_set_pubkey(cert, pkey);
+    X509_NAME *name = X509_get_subject_name(cert);
+    X509_NAME_add_entry_by_txt(name, "CN", MBSTRING_ASC, (const unsigned char *)"localhost", -1, -1, 0);
+    X509_set_issuer_name(cert, name);
+    X509_sign(cert, pkey, EVP_sha256());
+    return cert;
+}
+
+static int tcp_pair(int *client_fd, int *server_fd)
+{
+    struct sockaddr_in addr;
+    socklen_t len = sizeof(addr);
+    int listen_fd = socket(AF_INET, SOCK_STREAM, 0);
+    memset(&addr, 0, sizeof(addr));
+    addr.sin_family = AF_INET;
+    addr.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+    if (listen_fd < 0 || bind(listen_fd, (struct sockaddr *)&addr, sizeof(addr)) != 0 ||
+        listen(listen_fd, 1) != 0 || getsockname(listen_fd, (struct sockaddr *)&addr, &len) != 0)
+        return 0;
+    *client_fd = socket(AF_INET, SOCK_STREAM, 0);
+    if (*client_fd < 0 || connect(*client_fd, (struct sockaddr *)&addr, sizeof(addr)) != 0)
+        return 0;
+    *server_fd = accept(listen_fd, NULL, NULL);
+    close(listen_fd);
+    if (*server_fd < 0)
+        return 0;
+    fcntl(*client_fd, F_SETFL, O_NONBLOCK);
+    fcntl(*server_fd, F_SETFL, O_NONBLOCK);
+    return 1;
+}
+
+static int handshake(SSL *client, SSL *server)
+{
+    int client_done = 0, server_done = 0;
+    for (int i = 0; i < 1000 && !(client_done && server_done); i++) {
+        if (!client_done) {
+            int ret = SSL_do_handshake(client);
+            if (ret == 1)
+                client_done = 1;
+            else if (SSL_get_error(client, ret) != SSL_ERROR_WANT_READ)
+                return 0;
+        }
+        if (!server_done) {
+            int ret = SSL_do_handshake(server);
+            if (ret == 1)
+                server_done = 1;
+            else if (SSL_get_error(server, ret) != SSL_ERROR_WANT_READ)
+                return 0;
+        }
+        usleep(1000);
+    }
+    return client_done && server_done;
+}
+
+int main()
+{
+    if (!kernel_tls_available()) {
+        printf("The kernel 'tls' module is not loaded, skipping the kTLS test\n");
+        return 0;
+    }
+
+    EVP_PKEY *pkey = EVP_EC_gen("P-256");
+    X509 *cert = make_cert(pkey);
+    SSL_CTX *server_ctx = SSL_CTX_new(TLS_server_method());
+    SSL_CTX *client_ctx = SSL_CTX_new(TLS_client_method());
+    SSL_CTX_use_certificate(server_ctx, cert);
+    SSL_CTX_use_PrivateKey(server_ctx, pkey);
+    SSL_CTX *ctxs[] = {server_ctx, client_ctx};
+    for (int i = 0; i < 2; i++) {
+        SSL_CTX_set_options(ctxs[i], SSL_OP_ENABLE_KTLS);
+        SSL_CTX_set_min_proto_version(ctxs[i], TLS1_3_VERSION);
+        SSL_CTX_set_ciphersuites(ctxs[i], "TLS_AES_128_GCM_SHA256");
+    }
+
+    int client_fd, server_fd;
+    if (!tcp_pair(&client_fd, &server_fd)) {
+        perror("Failed to create a loopback TCP connection");
+        return 1;
+    }
+    SSL *server = SSL_new(server_ctx);
+    SSL *client = SSL_new(client_ctx);
+    SSL_set_fd(server, server_fd);
+    SSL_set_fd(client, client_fd);
+    SSL_set_accept_state(server);
+    SSL_set_connect_state(client);
+    if (!handshake(client, server)) {
+        printf("TLS handshake failed\n");
+        ERR_print_errors_fp(stdout);
+        return 1;
+    }
+
+    int ktls_send = BIO_get_ktls_send(SSL_get_wbio(server));
+    int ktls_recv = BIO_get_ktls_recv(SSL_get_rbio(client));
+    printf("kTLS send: %s, kTLS receive: %s\n", ktls_send ? "yes" : "no", ktls_recv ? "yes" : "no");
+    if (!ktls_send)
+        return 1;
+
+    const char message[] = "kTLS";
+    char buf[sizeof(message)] = {0};
+    if (SSL_write(server, message, sizeof(message)) != sizeof(message))
+        return 1;
+    for (int i = 0; i < 1000 && SSL_read(client, buf, sizeof(buf)) <= 0; i++)
+        usleep(1000);
+    if (strcmp(buf, message) != 0) {
+        printf("Failed to read the data sent over kTLS\n");
+        return 1;
+    }
+
+    SSL_free(client);
+    SSL_free(server);
+    close(client_fd);
+    close(server_fd);
+    SSL_CTX_free(client_ctx);
+    SSL_CTX_free(server_ctx);
+    X509_free(cert);
+    EVP_PKEY_free(pkey);
+    return 0;
+}
@@ -28,6 +28,7 @@ class OpenvinoConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "threading": ["tbb", "tbb_auto", "omp", "seq"],
         # HW plugins
         "enable_cpu": [True, False],
         "enable_gpu": [True, False],
@@ -46,6 +47,7 @@ class OpenvinoConan(ConanFile):
     default_options = {
         "shared": False,
         "fPIC": True,
+        "threading": "tbb",
         # HW plugins
         "enable_cpu": True,
         "enable_gpu": True,
@@ -61,6 +63,11 @@ class OpenvinoConan(ConanFile):
         "enable_paddle_frontend": False,
         "enable_pytorch_frontend": True,
     }
+    options_description = {
+        "threading": ("Threading backend used by the CPU plugin and the runtime. With tbb and tbb_auto, inference streams "
+                      "are pinned to NUMA nodes and hybrid core types through oneTBB's TBBBind library, "
+                      "which is controlled by the onetbb/*:tbbbind option (enabled by default)"),
+    }
 
     @property
     def _protobuf_required(self):
@@ -74,6 +81,10 @@ class OpenvinoConan(ConanFile):
     def _target_x86_64(self):
         return self.settings.arch == "x86_64"
 
+    @property
+    def _with_tbb(self):
+        return self.options.threading in ["tbb", "tbb_auto"]
+
     @property
     def _npu_option_available(self):
         return self.settings.os in ["Linux", "Windows"] and self._target_x86_64
@@ -106,7 +117,10 @@ class OpenvinoConan(ConanFile):
         return f"{dependency}/{self._dependency_versions[dependency]}"
 
     def requirements(self):
-        self.requires("onetbb/[>=2021 <2023]")
+        if self._with_tbb:
+            self.requires("onetbb/[>=2021 <2023]")
+        elif self.options.threading == "omp":
+            self.requires("intel-openmp/[>=2024.0.3]")
         self.requires("pugixml/[^1.14]")
         if Version(self.version) >= "2025.1.0":
                 self.requires("nlohmann_json/3.11.3")
@@ -127,6 +141,8 @@ class OpenvinoConan(ConanFile):
     def validate(self):
         if self.settings.os == "Emscripten":
             raise ConanInvalidConfiguration(f"{self.ref} does not support Emscripten")
+        if self.options.threading == "omp" and not self._target_x86_64:
+            raise ConanInvalidConfiguration(f"{self.ref} supports threading=omp only on x86_64")
 
     def build_requirements(self):
         if self._target_arm:
@@ -198,8 +214,13 @@ class OpenvinoConan(ConanFile):
         tc.cache_variables["ENABLE_OV_PYTORCH_FRONTEND"] = self.options.enable_pytorch_frontend
         tc.cache_variables["ENABLE_OV_JAX_FRONTEND"] = False
         # Dependencies
-        tc.cache_variables["ENABLE_SYSTEM_TBB"] = True
+        tc.cache_variables["THREADING"] = str(self.options.threading).upper()
+        tc.cache_variables["ENABLE_SYSTEM_TBB"] = self._with_tbb
+        # ENABLE_TBBBIND_2_5 downloads a prebuilt static TBBBind, the TBBBind library of onetbb is
+        # loaded at runtime by libtbb instead and provides the NUMA and core type information
         tc.cache_variables["ENABLE_TBBBIND_2_5"] = False
+        if self.options.threading == "omp":
+            tc.cache_variables["OMP"] = self.dependencies["intel-openmp"].package_folder.replace("\\", "/")
         tc.cache_variables["ENABLE_SYSTEM_PUGIXML"] = True
         if self._protobuf_required:
             tc.cache_variables["ENABLE_SYSTEM_PROTOBUF"] = True
@@ -245,7 +266,11 @@ class OpenvinoConan(ConanFile):
 
         openvino_runtime = self.cpp_info.components["Runtime"]
         openvino_runtime.set_property("cmake_target_name", "openvino::runtime")
-        openvino_runtime.requires = ["onetbb::libtbb", "pugixml::pugixml"]
+        openvino_runtime.requires = ["pugixml::pugixml"]
+        if self._with_tbb:
+            openvino_runtime.requires.append("onetbb::libtbb")
+        elif self.options.threading == "omp":
+            openvino_runtime.requires.append("intel-openmp::intel-openmp")
         if Version(self.version) >= "2025.1.0":
             openvino_runtime.requires.append("nlohmann_json::nlohmann_json")
         openvino_runtime.libs = ["openvino"]
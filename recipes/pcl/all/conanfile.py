@@ -154,9 +154,13 @@ class PclConan(ConanFile):
         "use_sse": True,
     }
 
-    python_requires = "conan-cuda/latest"
+    python_requires = ["conan-cuda/latest", "conan-utils/latest"]
     python_requires_extend = "conan-cuda.Cuda"
 
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
     # The component details have been extracted from their CMakeLists.txt files using
     # https://gist.github.com/valgur/e54e39b6a8931b58cc1776515104c828
     @property
@@ -541,6 +545,7 @@ class PclConan(ConanFile):
                         "message(TRACE # vtk_module_autoinit(")
 
     def generate(self):
+        self._utils.configure_unity_build(self)
         tc = CMakeToolchain(self)
         tc.cache_variables["PCL_SHARED_LIBS"] = self.options.shared
         tc.cache_variables["WITH_LIBUSB"] = self._is_enabled("libusb")
@@ -49,6 +49,7 @@ class PdalConan(ConanFile):
         self.requires("gdal/[^3.10.0]", transitive_headers=True, transitive_libs=True)
         self.requires("h3/4.1.0")
         self.requires("json-schema-validator/2.3.0")
+        self.requires("laz-perf/[^3.4.0]")
         self.requires("libcurl/[>=7.78 <9]") # for arbiter
         self.requires("libgeotiff/[^1.7.1]")
         self.requires("nanoflann/[^1.6.0]", transitive_headers=True, transitive_libs=True)
@@ -67,7 +68,6 @@ class PdalConan(ConanFile):
         if self.options.get_safe("with_unwind"):
             self.requires("libunwind/[^1.8.1]")
         # TODO: unvendor kazhdan (not on CCI, https://github.com/mkazhdan/PoissonRecon)
-        # TODO: unvendor lazperf (not on CCI, https://github.com/hobuinc/laz-perf)
         # TODO: unvendor lepcc (not on CCI, https://github.com/Esri/lepcc)
         # TODO: add arrow support (requires parquet)
         # TODO: add cpd support (not on CCI, https://github.com/gadomski/cpd)
@@ -174,6 +174,9 @@ class PdalConan(ConanFile):
         rmdir(self, os.path.join(self.source_folder, "vendor", "nanoflann"))
         replace_in_file(self, os.path.join(self.source_folder, "pdal", "private", "KDImpl.hpp"),
                         "#include <nanoflann/nanoflann.hpp>", "#include <nanoflann.hpp>")
+        # Unvendor lazperf
+        rmdir(self, os.path.join(self.source_folder, "vendor", "lazperf"))
+        save(self, os.path.join(self.source_folder, "vendor", "lazperf", "CMakeLists.txt"), "")
         # Unvendor utfcpp
         rmdir(self, os.path.join(self.source_folder, "vendor", "utfcpp"))
         save(self, os.path.join(self.source_folder, "vendor", "utfcpp", "CMakeLists.txt"), "")
@@ -4,8 +4,9 @@ from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
 from conan.tools.build import can_run
 from conan.tools.files import *
-from conan.tools.gnu import Autotools, GnuToolchain, AutotoolsDeps
+from conan.tools.gnu import Autotools, GnuToolchain, AutotoolsDeps, PkgConfigDeps
 from conan.tools.layout import basic_layout
+from conan.tools.scm import Version
 
 required_conan_version = ">=2.1"
 
@@ -19,10 +20,36 @@ class Perf(ConanFile):
 
     package_type = "application"
     settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "with_libtraceevent": [True, False],
+        "with_babeltrace": [True, False],
+        "with_capstone": [True, False],
+        "with_python": [True, False],
+        "unwind": ["libunwind", "libdw"],
+    }
+    default_options = {
+        "with_libtraceevent": True,
+        "with_babeltrace": False,
+        "with_capstone": True,
+        "with_python": False,
+        "unwind": "libunwind",
+    }
+    options_description = {
+        "with_libtraceevent": "Tracepoint decoding for perf trace, perf script and perf report",
+        "with_babeltrace": "CTF export with 'perf data convert --to-ctf'",
+        "with_capstone": "Instruction disassembly with capstone in perf script and perf annotate",
+        "with_python": "Python scripting support for perf script",
+        "unwind": "Library used for DWARF post-unwinding of --call-graph=dwarf samples",
+    }
 
     def export_sources(self):
         export_conandata_patches(self)
 
+    def config_options(self):
+        if Version(self.version) < "6.2":
+            # libtraceevent was still part of the kernel tree and always built
+            del self.options.with_libtraceevent
+
     def layout(self):
         basic_layout(self, src_folder="src")
 
@@ -54,17 +81,23 @@ class Perf(ConanFile):
         }.get(str(self.settings.arch))
 
     def requirements(self):
-        self.requires("capstone/5.0.1")
         self.requires("libbpf/1.4.6")
         self.requires("libcap/[^2.69]")
         self.requires("elfutils/[>=0.191 <1]")
         self.requires("libnuma/[^2.0.16]")
-        self.requires("libunwind/[^1.8.1]")
         self.requires("openssl/[>=1.1 <4]")
         self.requires("xz_utils/[^5.4.5]")
         self.requires("zstd/[~1.5]")
-        # TODO: libtraceevent
-        # TODO: babeltrace
+        if self.options.unwind == "libunwind":
+            self.requires("libunwind/[^1.8.1]")
+        if self.options.with_capstone:
+            self.requires("capstone/[^5.0.1]")
+        if self.options.get_safe("with_libtraceevent"):
+            self.requires("libtraceevent/[^1.8]")
+        if self.options.with_babeltrace:
+            self.requires("babeltrace/[^1.5.11]")
+        if self.options.with_python:
+            self.requires("cpython/[^3.12]")
 
     def validate(self):
         if self.settings.os not in ["Linux", "FreeBSD"]:
@@ -73,6 +106,9 @@ class Perf(ConanFile):
     def build_requirements(self):
         self.tool_requires("flex/[^2.6.4]")
         self.tool_requires("bison/[^3.8.2]")
+        if self.options.get_safe("with_libtraceevent") and not self.conf.get("tools.gnu:pkg_config", default=False, check_type=str):
+            # Used by tools/perf/Makefile.config to query the libtraceevent version
+            self.tool_requires("pkgconf/[>=2.2 <3]")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -82,9 +118,21 @@ class Perf(ConanFile):
         tc = GnuToolchain(self)
         tc_vars = tc.extra_env.vars(self)
         deps_vars = AutotoolsDeps(self).vars()
-        tc.make_args["NO_LIBPYTHON"] = 1
         tc.make_args["NO_LIBPERL"] = 1
-        tc.make_args["NO_LIBTRACEEVENT"] = 1
+        if self.options.with_python:
+            tc.make_args["PYTHON"] = os.path.join(self.dependencies["cpython"].package_folder, "bin", "python3")
+        else:
+            tc.make_args["NO_LIBPYTHON"] = 1
+        if not self.options.get_safe("with_libtraceevent", True):
+            tc.make_args["NO_LIBTRACEEVENT"] = 1
+        if self.options.with_babeltrace:
+            # CTF conversion is opt-in upstream
+            tc.make_args["LIBBABELTRACE"] = 1
+        if not self.options.with_capstone:
+            tc.make_args["NO_CAPSTONE"] = 1
+        if self.options.unwind == "libdw":
+            # libdw from elfutils is used for DWARF unwinding when libunwind is disabled
+            tc.make_args["NO_LIBUNWIND"] = 1
         tc.make_args["SRCARCH"] = self._arch
         tc.make_args["CC"] = tc_vars["CC"]
         tc.make_args["CPPFLAGS"] = deps_vars["CPPFLAGS"]
@@ -102,6 +150,7 @@ class Perf(ConanFile):
             if not tc.make_args[val]:
                 del tc.make_args[val]
         tc.generate()
+        PkgConfigDeps(self).generate()
 
     def build(self):
         autotools = Autotools(self)
@@ -12,4 +12,4 @@ class TestPackageConan(ConanFile):
         self.tool_requires(self.tested_reference_str)
 
     def test(self):
-        self.run("perf version")
+        self.run("perf version --build-options")
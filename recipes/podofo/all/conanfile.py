@@ -105,8 +105,10 @@ class PodofoConan(ConanFile):
         tc.variables["PODOFO_WITH_UNISTRING"] = self.options.with_unistring
 
         tc.variables["PODOFO_HAVE_OPENSSL_1_1"] = self.dependencies["openssl"].ref.version >= "1.1"
-        if "no_rc4" in self.dependencies["openssl"].options:
-            tc.variables["PODOFO_HAVE_OPENSSL_NO_RC4"] = self.dependencies["openssl"].options.no_rc4
+        # Replacements of openssl such as openssl-meta have no no_rc4 option, let podofo detect it then
+        no_rc4 = self.dependencies["openssl"].options.get_safe("no_rc4")
+        if no_rc4 is not None:
+            tc.variables["PODOFO_HAVE_OPENSSL_NO_RC4"] = no_rc4
 
         tc.generate()
 
@@ -169,6 +169,12 @@ class QtConan(ConanFile):
     options.update({f"{status}_modules": [True, False] for status in _module_statuses})
     default_options.update({f"{status}_modules": False for status in _module_statuses})
 
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
     @cached_property
     def _qtmodules_info(self):
         """
@@ -412,6 +418,7 @@ class QtConan(ConanFile):
             del self.info.options.android_sdk
         for status in self._module_statuses:
             self.info.options.rm_safe(f"{status}_modules")
+        self._utils.debug_info_package_id(self)
 
     def requirements(self):
         self.requires("zlib-ng/[^2.0]")
@@ -505,6 +512,7 @@ class QtConan(ConanFile):
     def build_requirements(self):
         self.tool_requires("cmake/[>=3.21.1 <5]")
         self.tool_requires("ninja/[^1.10]")
+        self._utils.linker_tool_requires(self)
         if not self.conf.get("tools.gnu:pkg_config", check_type=str):
             self.tool_requires("pkgconf/[>=2.2 <3]")
         if self.options.get_safe("qtwebengine"):
@@ -556,6 +564,8 @@ class QtConan(ConanFile):
             })
 
     def generate(self):
+        self._utils.configure_debug_info(self)
+        self._utils.configure_linker(self)
         vbe = VirtualBuildEnv(self)
         vbe.generate()
         if not cross_building(self):
@@ -1048,6 +1058,8 @@ class QtConan(ConanFile):
             if self.options.gui and self.options.qtshadertools:
                 _create_private_module("Quick", ["CorePrivate", "GuiPrivate", "QmlPrivate", "Quick"])
 
+        self._utils.package_debug_info(self)
+
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "Qt6")
         self.cpp_info.set_property("pkg_config_name", "qt6")
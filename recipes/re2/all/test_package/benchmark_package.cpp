@@ -0,0 +1,68 @@
+#include <benchmark/benchmark.h>
+#include <re2/re2.h>
+
+#include <cstdint>
+#include <string>
+
+static std::string make_log(size_t size) {
+    static const char *levels[] = {"INFO", "DEBUG", "WARNING", "ERROR"};
+    std::string s;
+    s.reserve(size + 128);
+    uint32_t seed = 12345;
+    while (s.size() < size) {
+        seed = seed * 1103515245u + 12345u;
+        s += "2024-01-01T12:" + std::to_string(seed % 60) + ":00 " + levels[(seed >> 8) % 4] +
+             " request from 10.0." + std::to_string((seed >> 4) % 256) + "." + std::to_string(seed % 256) +
+             " took " + std::to_string((seed >> 12) % 1000) + "ms user=user" + std::to_string(seed % 997) +
+             "@example.com\n";
+    }
+    return s;
+}
+
+static void BM_literal_search(benchmark::State &state) {
+    const std::string input = make_log(1 << 22);
+    const RE2 re("user123@example\\.org");
+    for (auto _ : state) {
+        bool found = RE2::PartialMatch(input, re);
+        benchmark::DoNotOptimize(found);
+    }
+    state.SetBytesProcessed(state.iterations() * input.size());
+}
+BENCHMARK(BM_literal_search);
+
+static void BM_find_all(benchmark::State &state) {
+    const std::string input = make_log(1 << 22);
+    const RE2 re("(ERROR|WARNING) request from (\\d+\\.\\d+\\.\\d+\\.\\d+) took (\\d+)ms");
+    for (auto _ : state) {
+        re2::StringPiece text(input);
+        std::string level, ip;
+        int ms = 0;
+        size_t count = 0;
+        while (RE2::FindAndConsume(&text, re, &level, &ip, &ms)) {
+            count++;
+        }
+        benchmark::DoNotOptimize(count);
+    }
+    state.SetBytesProcessed(state.iterations() * input.size());
+}
+BENCHMARK(BM_find_all)->Unit(benchmark::kMillisecond);
+
+static void BM_full_match(benchmark::State &state) {
+    const RE2 re("[a-z0-9._%+-]+@[a-z0-9.-]+\\.[a-z]{2,}");
+    const std::string email = "some.user+tag@subdomain.example.com";
+    for (auto _ : state) {
+        bool matched = RE2::FullMatch(email, re);
+        benchmark::DoNotOptimize(matched);
+    }
+    state.SetItemsProcessed(state.iterations());
+}
+BENCHMARK(BM_full_match);
+
+static void BM_compile(benchmark::State &state) {
+    for (auto _ : state) {
+        RE2 re("(\\d{4})-(\\d{2})-(\\d{2})T(\\d{2}):(\\d+):(\\d{2}) (INFO|DEBUG|WARNING|ERROR) .*");
+        benchmark::DoNotOptimize(re.ok());
+    }
+    state.SetItemsProcessed(state.iterations());
+}
+BENCHMARK(BM_compile);
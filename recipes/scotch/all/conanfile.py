@@ -0,0 +1,149 @@
+import os
+
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.build import cross_building
+from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
+from conan.tools.files import *
+from conan.tools.microsoft import is_msvc
+
+required_conan_version = ">=2.1"
+
+
+class ScotchConan(ConanFile):
+    name = "scotch"
+    description = ("SCOTCH and PT-SCOTCH: software packages and libraries for sequential and parallel "
+                   "graph partitioning, static mapping and clustering, sequential mesh and hypergraph partitioning, "
+                   "and sequential and parallel sparse matrix block ordering")
+    license = "CECILL-C"
+    homepage = "https://gitlab.inria.fr/scotch/scotch"
+    topics = ("graph-partitioning", "sparse-matrix", "ordering", "mesh", "mpi")
+    package_type = "library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "ptscotch": [True, False],
+        "threads": [True, False],
+        "esmumps": [True, False],
+        "intsize": ["32", "64"],
+        "with_zlib": [True, False],
+        "with_bzip2": [True, False],
+        "with_lzma": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "ptscotch": False,
+        "threads": True,
+        "esmumps": True,
+        "intsize": "32",
+        "with_zlib": True,
+        "with_bzip2": False,
+        "with_lzma": False,
+    }
+    options_description = {
+        "ptscotch": "Build the MPI-based PT-SCOTCH libraries",
+        "threads": "Use multiple threads in SCOTCH and PT-SCOTCH",
+        "esmumps": "Build the libesmumps ordering library used by MUMPS",
+        "intsize": "Size of the SCOTCH_Num integer type",
+    }
+    implements = ["auto_shared_fpic"]
+    languages = ["C"]
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
+
+    def requirements(self):
+        if self.options.ptscotch:
+            self.requires("openmpi/[>=4 <6]", transitive_headers=True, transitive_libs=True)
+        if self.options.with_zlib:
+            self.requires("zlib-ng/[^2.0]")
+        if self.options.with_bzip2:
+            self.requires("bzip2/[^1.0.8]")
+        if self.options.with_lzma:
+            self.requires("xz_utils/[^5.4.5]")
+
+    def validate(self):
+        if is_msvc(self):
+            raise ConanInvalidConfiguration(f"{self.ref} does not support MSVC")
+
+    def validate_build(self):
+        if cross_building(self):
+            # The build runs the dummysizes executable to generate the public headers
+            raise ConanInvalidConfiguration("Cross-building is not supported")
+
+    def build_requirements(self):
+        self.tool_requires("cmake/[>=3.15 <5]")
+        self.tool_requires("bison/[^3.8.2]")
+        self.tool_requires("flex/[^2.6.4]")
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.cache_variables["BUILD_PTSCOTCH"] = self.options.ptscotch
+        tc.cache_variables["BUILD_LIBESMUMPS"] = self.options.esmumps
+        tc.cache_variables["BUILD_LIBSCOTCHMETIS"] = False
+        tc.cache_variables["INSTALL_METIS_HEADERS"] = False
+        tc.cache_variables["BUILD_FORTRAN"] = False
+        tc.cache_variables["ENABLE_TESTS"] = False
+        tc.cache_variables["THREADS"] = self.options.threads
+        tc.cache_variables["MPI_THREAD_MULTIPLE"] = self.options.threads
+        tc.cache_variables["INTSIZE"] = str(self.options.intsize)
+        tc.cache_variables["USE_ZLIB"] = self.options.with_zlib
+        tc.cache_variables["USE_BZ2"] = self.options.with_bzip2
+        tc.cache_variables["USE_LZMA"] = self.options.with_lzma
+        tc.generate()
+
+        deps = CMakeDeps(self)
+        deps.set_property("zlib-ng", "cmake_file_name", "ZLIB")
+        deps.set_property("zlib-ng", "cmake_target_name", "ZLIB::ZLIB")
+        deps.generate()
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def package(self):
+        copy(self, "LICENSE_en.txt", self.source_folder, os.path.join(self.package_folder, "licenses"))
+        cmake = CMake(self)
+        cmake.install()
+        rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        rmdir(self, os.path.join(self.package_folder, "share"))
+
+    def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "SCOTCH")
+
+        def _add_component(name, requires=None):
+            component = self.cpp_info.components[name]
+            component.set_property("cmake_target_name", f"SCOTCH::{name}")
+            component.libs = [name]
+            component.requires = requires or []
+            return component
+
+        # libscotcherrexit is an alternative to libscotcherr and is not exposed as a component,
+        # since linking both would result in duplicate symbols
+        _add_component("scotcherr")
+        scotch = _add_component("scotch", ["scotcherr"])
+        if self.options.with_zlib:
+            scotch.requires.append("zlib-ng::zlib-ng")
+        if self.options.with_bzip2:
+            scotch.requires.append("bzip2::bzip2")
+        if self.options.with_lzma:
+            scotch.requires.append("xz_utils::xz_utils")
+        if self.settings.os in ["Linux", "FreeBSD"]:
+            scotch.system_libs = ["m", "rt"]
+            if self.options.threads:
+                scotch.system_libs.append("pthread")
+        if self.options.esmumps:
+            _add_component("esmumps", ["scotch"])
+
+        if self.options.ptscotch:
+            _add_component("ptscotcherr", ["openmpi::ompi-c"])
+            _add_component("ptscotch", ["scotch", "ptscotcherr", "openmpi::ompi-c"])
+            if self.options.esmumps:
+                _add_component("ptesmumps", ["ptscotch"])
@@ -0,0 +1,27 @@
+#include <stdio.h>
+#include <stdint.h>
+#include <scotch.h>
+
+int main(void)
+{
+    // Cycle graph with 6 vertices in compressed sparse row format
+    SCOTCH_Num verttab[7] = {0, 2, 4, 6, 8, 10, 12};
+    SCOTCH_Num edgetab[12] = {1, 5, 0, 2, 1, 3, 2, 4, 3, 5, 4, 0};
+    SCOTCH_Num permtab[6];
+    SCOTCH_Num peritab[6];
+    SCOTCH_Graph graph;
+    SCOTCH_Strat strat;
+
+    if (SCOTCH_graphInit(&graph) != 0)
+        return 1;
+    if (SCOTCH_graphBuild(&graph, 0, 6, verttab, verttab + 1, NULL, NULL, 12, edgetab, NULL) != 0)
+        return 1;
+    SCOTCH_stratInit(&strat);
+    if (SCOTCH_graphOrder(&graph, &strat, permtab, peritab, NULL, NULL, NULL) != 0)
+        return 1;
+    SCOTCH_stratExit(&strat);
+    SCOTCH_graphExit(&graph);
+
+    printf("SCOTCH version %d.%d.%d\n", SCOTCH_VERSION, SCOTCH_RELEASE, SCOTCH_PATCHLEVEL);
+    return 0;
+}
@@ -0,0 +1,59 @@
+#include <benchmark/benchmark.h>
+#include <simdjson.h>
+
+#include <cstdint>
+#include <string>
+
+static std::string make_document(size_t num_records) {
+    std::string s = "[";
+    uint32_t seed = 12345;
+    for (size_t i = 0; i < num_records; i++) {
+        seed = seed * 1103515245u + 12345u;
+        if (i > 0)
+            s += ",";
+        s += "{\"id\":" + std::to_string(i) + ",\"name\":\"record " + std::to_string(seed % 100000) +
+             "\",\"score\":" + std::to_string((seed >> 8) % 1000 / 7.0) +
+             ",\"active\":" + ((seed & 1) ? "true" : "false") + ",\"tags\":[\"a\",\"bb\",\"ccc\"]}";
+    }
+    s += "]";
+    return s;
+}
+
+static void BM_dom_parse(benchmark::State &state) {
+    const simdjson::padded_string json(make_document(state.range(0)));
+    simdjson::dom::parser parser;
+    for (auto _ : state) {
+        simdjson::dom::element doc;
+        auto error = parser.parse(json).get(doc);
+        benchmark::DoNotOptimize(error);
+    }
+    state.SetBytesProcessed(state.iterations() * json.size());
+}
+BENCHMARK(BM_dom_parse)->Arg(100)->Arg(100000)->ArgName("records");
+
+static void BM_ondemand_sum(benchmark::State &state) {
+    const simdjson::padded_string json(make_document(state.range(0)));
+    simdjson::ondemand::parser parser;
+    for (auto _ : state) {
+        double sum = 0;
+        auto doc = parser.iterate(json);
+        for (auto record : doc.get_array()) {
+            sum += double(record["score"]);
+        }
+        benchmark::DoNotOptimize(sum);
+    }
+    state.SetBytesProcessed(state.iterations() * json.size());
+}
+BENCHMARK(BM_ondemand_sum)->Arg(100)->Arg(100000)->ArgName("records");
+
+static void BM_minify(benchmark::State &state) {
+    const simdjson::padded_string json(make_document(state.range(0)));
+    std::string output(json.size(), '\0');
+    for (auto _ : state) {
+        size_t size = 0;
+        auto error = simdjson::minify(json.data(), json.size(), output.data(), size);
+        benchmark::DoNotOptimize(error);
+    }
+    state.SetBytesProcessed(state.iterations() * json.size());
+}
+BENCHMARK(BM_minify)->Arg(100000)->ArgName("records");
@@ -0,0 +1,33 @@
+#include <benchmark/benchmark.h>
+#include <snappy.h>
+
+#include <string>
+
+static void BM_compress(benchmark::State &state) {
+    std::string input;
+    for (int i = 0; input.size() < static_cast<size_t>(state.range(0)); i++) {
+        input += std::to_string(i) + ',';
+    }
+    std::string output;
+    for (auto _ : state) {
+        snappy::Compress(input.data(), input.size(), &output);
+        benchmark::DoNotOptimize(output.data());
+    }
+    state.SetBytesProcessed(state.iterations() * input.size());
+}
+BENCHMARK(BM_compress)->Arg(4 << 10)->Arg(4 << 20)->ArgName("bytes");
+
+static void BM_uncompress(benchmark::State &state) {
+    std::string input;
+    for (int i = 0; input.size() < static_cast<size_t>(state.range(0)); i++) {
+        input += std::to_string(i) + ',';
+    }
+    std::string compressed, output;
+    snappy::Compress(input.data(), input.size(), &compressed);
+    for (auto _ : state) {
+        snappy::Uncompress(compressed.data(), compressed.size(), &output);
+        benchmark::DoNotOptimize(output.data());
+    }
+    state.SetBytesProcessed(state.iterations() * input.size());
+}
+BENCHMARK(BM_uncompress)->Arg(4 << 10)->Arg(4 << 20)->ArgName("bytes");
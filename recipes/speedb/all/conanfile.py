@@ -25,6 +25,10 @@ class SpeedbConan(ConanFile):
         "with_zlib": [True, False],
         "with_zstd": [True, False],
         "with_core_tools": [True, False],
+        "with_jemalloc": [True, False],
+        "with_liburing": [True, False],
+        "with_tbb": [True, False],
+        "with_folly": [True, False],
     }
     default_options = {
         "shared": False,
@@ -34,6 +38,10 @@ class SpeedbConan(ConanFile):
         "with_zlib": True,
         "with_zstd": True,
         "with_core_tools": True,
+        "with_jemalloc": False,
+        "with_liburing": False,
+        "with_tbb": False,
+        "with_folly": False,
     }
     implements = ["auto_shared_fpic"]
 
@@ -53,11 +61,18 @@ class SpeedbConan(ConanFile):
     def export_sources(self):
         export_conandata_patches(self)
 
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+        if self.settings.os != "Linux":
+            del self.options.with_liburing
+        if self.settings.arch != "x86_64":
+            del self.options.with_tbb
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
     def requirements(self):
-        # TODO: support jemalloc, liburing
         if self.options.with_snappy:
             self.requires("snappy/[^1.1.9]")
         if self.options.with_lz4:
@@ -69,6 +84,14 @@ class SpeedbConan(ConanFile):
         if self.options.with_core_tools:
             self.requires("gflags/2.2.2")
             self.requires("readline/[^8.2]")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/[^2.7]")
+        if self.options.get_safe("with_tbb"):
+            self.requires("onetbb/[>=2021]")
+        if self.options.with_jemalloc:
+            self.requires("jemalloc/[^5.3.0]")
+        if self.options.with_folly:
+            self.requires("folly/[*]")
 
     def validate(self):
         check_min_cppstd(self, self._min_cppstd)
@@ -77,15 +100,20 @@ class SpeedbConan(ConanFile):
             raise ConanInvalidConfiguration(
                 f"{self.ref} requires C++{self._min_cppstd}, which your compiler does not support."
             )
+        if self.options.shared and self.options.with_folly:
+            raise ConanInvalidConfiguration(f"{self.ref} does not support a shared build with folly")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
         apply_conandata_patches(self)
+        replace_in_file(self, "CMakeLists.txt", "find_package(uring)", "find_package(uring REQUIRED CONFIG)")
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["WITH_JEMALLOC"] = False
-        tc.variables["WITH_LIBURING"] = False
+        tc.variables["WITH_JEMALLOC"] = self.options.with_jemalloc
+        tc.variables["WITH_LIBURING"] = self.options.get_safe("with_liburing", False)
+        tc.variables["WITH_TBB"] = self.options.get_safe("with_tbb", False)
+        tc.variables["USE_FOLLY"] = self.options.with_folly
         tc.variables["WITH_SNAPPY"] = self.options.with_snappy
         tc.variables["WITH_LZ4"] = self.options.with_lz4
         tc.variables["WITH_ZLIB"] = self.options.with_zlib
@@ -99,6 +127,16 @@ class SpeedbConan(ConanFile):
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
         tc.generate()
         deps = CMakeDeps(self)
+        if self.options.with_jemalloc:
+            deps.set_property("jemalloc", "cmake_file_name", "JeMalloc")
+            deps.set_property("jemalloc", "cmake_target_name", "JeMalloc::JeMalloc")
+        if self.options.get_safe("with_liburing"):
+            deps.set_property("liburing", "cmake_file_name", "uring")
+            deps.set_property("liburing", "cmake_target_name", "uring::uring")
+        if self.options.with_folly:
+            deps.set_property("folly", "cmake_additional_variables_prefixes", ["FOLLY"])
+        if self.options.get_safe("with_tbb"):
+            deps.set_property("onetbb", "cmake_target_name", "TBB::TBB")
         deps.generate()
 
     def _patch_sources(self):
@@ -0,0 +1,50 @@
+// Exercises the GraphBLAS JIT for the semirings listed in conan_prejit_semirings.h,
+// so that the generated kernels can be placed in GraphBLAS/PreJIT and compiled into the library.
+
+#include <GraphBLAS.h>
+#include <stdio.h>
+
+#define OK(method)                                          \
+    if ((method) != GrB_SUCCESS)                            \
+    {                                                       \
+        fprintf (stderr, "conan_prejit: %s failed\n", #method) ; \
+        return 1 ;                                          \
+    }
+
+static int warm (GrB_Semiring semiring, GrB_Type type)
+{
+    const GrB_Index n = 16 ;
+    GrB_Matrix A = NULL, B = NULL, C = NULL ;
+    GrB_Vector u = NULL, w = NULL ;
+    OK (GrB_Matrix_new (&A, type, n, n)) ;
+    OK (GrB_Matrix_new (&B, type, n, n)) ;
+    OK (GrB_Matrix_new (&C, type, n, n)) ;
+    OK (GrB_Vector_new (&u, type, n)) ;
+    OK (GrB_Vector_new (&w, type, n)) ;
+    for (GrB_Index i = 0 ; i < n ; i++)
+    {
+        OK (GrB_Matrix_setElement_INT32 (A, 1, i, (i * 7) % n)) ;
+        OK (GrB_Matrix_setElement_INT32 (B, 1, (i * 3) % n, i)) ;
+        OK (GrB_Vector_setElement_INT32 (u, 1, i)) ;
+    }
+    // saxpy-based and dot-product-based mxm, and mxv
+    OK (GrB_mxm (C, NULL, NULL, semiring, A, B, NULL)) ;
+    OK (GrB_mxm (C, NULL, NULL, semiring, A, B, GrB_DESC_T0)) ;
+    OK (GrB_mxv (w, NULL, NULL, semiring, A, u, NULL)) ;
+    GrB_free (&A) ;
+    GrB_free (&B) ;
+    GrB_free (&C) ;
+    GrB_free (&u) ;
+    GrB_free (&w) ;
+    return 0 ;
+}
+
+#define WARM(semiring, type) if (warm (semiring, type) != 0) return 1 ;
+
+int main (void)
+{
+    OK (GrB_init (GrB_NONBLOCKING)) ;
+#include "conan_prejit_semirings.h"
+    OK (GrB_finalize ()) ;
+    return 0 ;
+}
@@ -1,6 +1,11 @@
 import os
+import shutil
+import textwrap
+from pathlib import Path
 
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.build import cross_building
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.env import Environment
 from conan.tools.files import *
@@ -22,22 +27,32 @@ class SuiteSparseGraphBlasConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "compact": [True, False],
+        "prejit_semirings": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "compact": True,
+        "prejit_semirings": None,
     }
     options_description = {
         "compact": ("If True, disable creation of many fast FactoryKernels at compile time. "
                     "The necessary kernels are compiled at run-time, via JIT, instead and "
-                    "performance will be the same. JIT-compiled kernels are placed in <package_folder>/share. "
-                    "Non-compact builds are significantly slower to compile and produce a larger library (both about 15x).")
+                    "performance will be the same. JIT-compiled kernels are cached in ~/.SuiteSparse/GrB<version> "
+                    "(%LOCALAPPDATA%\\SuiteSparse\\GrB<version> on Windows) by default, "
+                    "which can be changed with the user.suitesparse-graphblas:jit_cache_path conf. "
+                    "Non-compact builds are significantly slower to compile and produce a larger library (both about 15x)."),
+        "prejit_semirings": ("Comma-separated list of built-in semirings to pre-compile into the library at build time "
+                             "to avoid JIT compilation at run-time, e.g. 'PLUS_TIMES_FP64,MIN_PLUS_INT64,ANY_SECONDI_INT64'. "
+                             "Kernels are generated for mxm (saxpy and dot) and mxv with matrices of the semiring's type."),
     }
     implements = ["auto_shared_fpic"]
     # note: C++ is used if CUDA is enabled
     languages = ["C"]
 
+    def export_sources(self):
+        copy(self, "conan_prejit.c", self.recipe_folder, os.path.join(self.export_sources_folder, "src"))
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -45,15 +60,60 @@ class SuiteSparseGraphBlasConan(ConanFile):
         # OpenMP is not used in any public headers
         self.requires("openmp/system")
 
+    @property
+    def _prejit_semirings(self):
+        if not self.options.prejit_semirings:
+            return []
+        return [s.strip().upper() for s in str(self.options.prejit_semirings).split(",") if s.strip()]
+
+    def validate_build(self):
+        if self._prejit_semirings and cross_building(self):
+            raise ConanInvalidConfiguration("prejit_semirings requires running the built library and is not supported when cross-building")
+        for semiring in self._prejit_semirings:
+            if semiring.rsplit("_", 1)[-1] not in self._grb_types:
+                raise ConanInvalidConfiguration(f"Invalid semiring in prejit_semirings: {semiring}. "
+                                                f"Expected <ADD>_<MULT>_<TYPE> with a built-in TYPE, e.g. PLUS_TIMES_FP64.")
+
     def build_requirements(self):
         self.tool_requires("cmake/[>=3.20 <5]")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
+        # Helper program for prejit_semirings, only added to the build when the option is set
+        save(self, "CMakeLists.txt", textwrap.dedent("""
+            if(CONAN_GRAPHBLAS_PREJIT)
+                add_executable(conan_prejit conan_prejit.c)
+                target_include_directories(conan_prejit PRIVATE ${CMAKE_BINARY_DIR})
+                if(TARGET GraphBLAS)
+                    target_link_libraries(conan_prejit PRIVATE GraphBLAS)
+                else()
+                    target_link_libraries(conan_prejit PRIVATE GraphBLAS_static)
+                endif()
+            endif()
+        """), append=True)
 
     @property
     def _jit_cache_dir(self):
-        return os.path.join(self.package_folder, "share")
+        # Used only during the build, consumers use the per-user default or the user.suitesparse-graphblas:jit_cache_path conf
+        return os.path.join(self.build_folder, "jit_cache")
+
+    @property
+    def _grb_types(self):
+        return {
+            "BOOL": "GrB_BOOL",
+            "INT8": "GrB_INT8",
+            "INT16": "GrB_INT16",
+            "INT32": "GrB_INT32",
+            "INT64": "GrB_INT64",
+            "UINT8": "GrB_UINT8",
+            "UINT16": "GrB_UINT16",
+            "UINT32": "GrB_UINT32",
+            "UINT64": "GrB_UINT64",
+            "FP32": "GrB_FP32",
+            "FP64": "GrB_FP64",
+            "FC32": "GxB_FC32",
+            "FC64": "GxB_FC64",
+        }
 
     def generate(self):
         tc = CMakeToolchain(self)
@@ -67,6 +127,7 @@ class SuiteSparseGraphBlasConan(ConanFile):
         tc.variables["SUITESPARSE_USE_FORTRAN"] = False  # Fortran sources are translated to C instead
         tc.variables["SUITESPARSE_DEMOS"] = False
         tc.variables["BUILD_TESTING"] = False
+        tc.variables["CONAN_GRAPHBLAS_PREJIT"] = bool(self._prejit_semirings)
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -76,10 +137,42 @@ class SuiteSparseGraphBlasConan(ConanFile):
         env.define_path("GRAPHBLAS_CACHE_PATH", self._jit_cache_dir)
         env.vars(self).save_script("graphblas_jit_cache")
 
+        if self._prejit_semirings:
+            calls = []
+            for semiring in self._prejit_semirings:
+                grb_type = self._grb_types[semiring.rsplit("_", 1)[-1]]
+                calls.append(f"WARM (GxB_{semiring}, {grb_type})\n")
+            save(self, os.path.join(self.build_folder, "conan_prejit_semirings.h"), "".join(calls))
+
+    @property
+    def _prejit_source_folder(self):
+        # The PreJIT kernels are specific to this configuration, so they are added to a copy of the sources
+        # in the build folder instead of the source folder, which is shared with other configurations.
+        return os.path.join(self.build_folder, "src-prejit")
+
+    def _prejit(self):
+        # Run the JIT for the requested semirings and move the generated kernels to GraphBLAS/PreJIT
+        rmdir(self, self._jit_cache_dir)
+        bin_name = "conan_prejit.exe" if self.settings.os == "Windows" else "conan_prejit"
+        bin_path = next(Path(self.build_folder).rglob(bin_name))
+        self.run(f'"{bin_path}"')
+        kernels = copy(self, "*GB_jit__*.c", os.path.join(self._jit_cache_dir, "c"), os.path.join(self._prejit_source_folder, "PreJIT"), keep_path=False)
+        self.output.info(f"Pre-compiling {len(kernels)} JIT kernels into the library")
+
     def build(self):
+        build_script_folder = None
+        if self._prejit_semirings:
+            rmdir(self, self._prejit_source_folder)
+            shutil.copytree(self.source_folder, self._prejit_source_folder)
+            build_script_folder = self._prejit_source_folder
         cmake = CMake(self)
-        cmake.configure()
+        cmake.configure(build_script_folder=build_script_folder)
         cmake.build()
+        if self._prejit_semirings:
+            self._prejit()
+            # Reconfigure to pick up the PreJIT kernels
+            cmake.configure(build_script_folder=build_script_folder)
+            cmake.build()
 
     def package(self):
         copy(self, "LICENSE", self.source_folder, os.path.join(self.package_folder, "licenses"))
@@ -106,7 +199,9 @@ class SuiteSparseGraphBlasConan(ConanFile):
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs.extend(["m", "pthread", "dl"])
 
-        # FIXME: The JIT cache contains both input sources as well as the compilation cache.
-        # The latter should not be located under the Conan package folder.
-        self.buildenv_info.define_path("GRAPHBLAS_CACHE_PATH", self._jit_cache_dir)
-        self.runenv_info.define_path("GRAPHBLAS_CACHE_PATH", self._jit_cache_dir)
+        # The JIT cache is written to at run-time, so it must not be located in the package folder.
+        # GraphBLAS defaults to a per-user cache folder, which can be overridden with a conf.
+        jit_cache_path = self.conf.get("user.suitesparse-graphblas:jit_cache_path", check_type=str)
+        if jit_cache_path:
+            self.buildenv_info.define_path("GRAPHBLAS_CACHE_PATH", jit_cache_path)
+            self.runenv_info.define_path("GRAPHBLAS_CACHE_PATH", jit_cache_path)
@@ -32,6 +32,7 @@ class ThorvgConan(ConanFile):
         "with_bindings": [False, 'capi', 'wasm_beta'],
         "with_tools": [False, 'svg2tvg', 'svg2png', 'lottie2gif', 'all'],
         "with_threads": [True, False],
+        "with_openmp": [True, False],
         "with_simd": [True, False],
         "with_examples": [True, False],
         "with_extra": [False, 'lottie_expressions'],
@@ -46,6 +47,7 @@ class ThorvgConan(ConanFile):
         "with_bindings": 'capi',
         "with_tools": False,
         "with_threads": True,
+        "with_openmp": False,
         "with_simd": False,
         "with_examples": False,
         "with_extra": 'lottie_expressions',
@@ -57,6 +59,7 @@ class ThorvgConan(ConanFile):
         "with_loaders": "Enable File Loaders in thorvg",
         "with_savers": "Enable File Savers in thorvg",
         "with_threads": "Enable the multi-threading task scheduler in thorvg",
+        "with_openmp": "Parallelize the software rasterizer with OpenMP, on top of the task scheduler",
         "with_simd": "Enable CPU Vectorization(SIMD) in thorvg",
         "with_bindings": "Enable API bindings",
         "with_tools": "Enable building thorvg tools",
@@ -71,10 +74,15 @@ class ThorvgConan(ConanFile):
             del self.options.fPIC
         if Version(self.version) < "0.15.6":
             del self.options.with_file
+        if Version(self.version) < "0.15.1":
+            del self.options.with_openmp
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if not self.options.with_threads:
+            # OpenMP is only looked up by the sw_engine when threads are enabled
+            self.options.rm_safe("with_openmp")
 
     def layout(self):
         basic_layout(self, src_folder="src")
@@ -103,6 +111,8 @@ class ThorvgConan(ConanFile):
         if self.settings.os == "Linux":
             if self.options.with_engines in ["gl", "gl_beta"]:
                 self.requires("opengl/system")
+        if self.options.get_safe("with_openmp"):
+            self.requires("openmp/system")
 
     def build_requirements(self):
         self.tool_requires("meson/[>=1.2.3 <2]")
@@ -145,13 +155,19 @@ class ThorvgConan(ConanFile):
         if is_msvc(self) and self.options.shared:
             replace_in_file(self, os.path.join(self.source_folder, "meson.build"), ", 'strip=true'", "")
 
-        # TODO: As OpenMP is tagged as "required: false", let's disable it for now to avoid extra flags and requirements injections.
-        if Version(self.version) >= "0.15.1" and self.options.with_threads:
+        # OpenMP is tagged as "required: false", so either make it a hard requirement or disable it
+        # to avoid extra flags and requirements injections
+        sw_engine_meson_build = os.path.join(self.source_folder, "src", "renderer", "sw_engine", "meson.build")
+        if self.options.get_safe("with_openmp"):
+            replace_in_file(self, sw_engine_meson_build,
+                            "omp_dep = dependency('openmp', required: false)",
+                            "omp_dep = dependency('openmp', required: true)")
+        elif Version(self.version) >= "0.15.1" and self.options.with_threads:
             # Notice that the use of disabler() is not working here. If it's used, there is no targets to build.
-            replace_in_file(self, os.path.join(self.source_folder, "src", "renderer", "sw_engine", "meson.build"),
+            replace_in_file(self, sw_engine_meson_build,
                             "omp_dep = dependency('openmp', required: false)",
                             "omp_dep = []")
-            replace_in_file(self, os.path.join(self.source_folder, "src", "renderer", "sw_engine", "meson.build"),
+            replace_in_file(self, sw_engine_meson_build,
                             "omp_dep.found()",
                             "false")
 
@@ -24,7 +24,7 @@ class USearchConan(ConanFile):
         "fPIC": [True, False],
         "with_fp16": [True, False],
         "with_jemalloc": [True, False],
-        # "with_openmp": [True, False], # TODO: add after #22353 has been merged
+        "with_openmp": [True, False],
         # "with_simsimd": [True, False], # TODO: add simsimd to CCI
     }
     default_options = {
@@ -33,7 +33,7 @@ class USearchConan(ConanFile):
         "fPIC": True,
         "with_fp16": True,
         "with_jemalloc": False,
-        # "with_openmp": False,
+        "with_openmp": False,
         # "with_simsimd": False,
     }
     settings = "os", "arch", "compiler", "build_type"
@@ -67,8 +67,8 @@ class USearchConan(ConanFile):
             self.requires("fp16/[>=cci.20210320]", transitive_headers=True)
         if self.options.with_jemalloc:
             self.requires("jemalloc/[^5.3.0]")
-        # if self.options.with_openmp:
-        #     self.requires("llvm-openmp/17.0.6")
+        if self.options.with_openmp:
+            self.requires("openmp/system", transitive_headers=True, transitive_libs=True)
 
     def validate(self):
         check_min_cppstd(self, 11)
@@ -87,7 +87,7 @@ class USearchConan(ConanFile):
             tc = CMakeToolchain(self)
             tc.variables["CMAKE_WINDOWS_EXPORT_ALL_SYMBOLS"] = True
             tc.variables["CMAKE_PROJECT_usearch_INCLUDE"] = "conan_deps.cmake"
-            tc.variables["USEARCH_USE_OPENMP"] = self.options.get_safe("with_openmp", False)
+            tc.variables["USEARCH_USE_OPENMP"] = self.options.with_openmp
             tc.variables["USEARCH_USE_SIMSIMD"] = self.options.get_safe("with_simsimd", False)
             tc.variables["USEARCH_USE_JEMALLOC"] = self.options.with_jemalloc
             tc.variables["USEARCH_USE_FP16LIB"] = self.options.with_fp16
@@ -134,7 +134,7 @@ class USearchConan(ConanFile):
                 self.cpp_info.system_libs.append(stdcpp_library(self))
 
         self.cpp_info.defines += [
-            f"USEARCH_USE_OPENMP={int(self.options.get_safe('with_openmp', False))}",
+            f"USEARCH_USE_OPENMP={int(bool(self.options.with_openmp))}",
             f"USEARCH_USE_FP16LIB={int(bool(self.options.with_fp16))}",
             f"USEARCH_USE_SIMSIMD={int(self.options.get_safe('with_simsimd', False))}",
         ]
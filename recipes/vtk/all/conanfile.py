@@ -186,6 +186,12 @@ class VtkConan(ConanFile):
     # Note that only YES/NO values are validated in the Conan recipe,
     # WANT/DONT_WANT are only checked in the CMake configure step.
 
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
+
     def export(self):
         copy(self, "*.json", self.recipe_folder, self.export_folder)
 
@@ -258,6 +264,7 @@ class VtkConan(ConanFile):
 
     def package_id(self):
         del self.info.options.debug_modules
+        self._utils.debug_info_package_id(self)
 
     def requirements(self):
         # These are always required by CommonArchive, CommonCore, CommonMath, CommonDataModel, CommonMisc, IOCore, FiltersCore, FiltersGeneral
@@ -571,6 +578,8 @@ class VtkConan(ConanFile):
         apply_conandata_patches(self)
 
     def generate(self):
+        self._utils.configure_debug_info(self)
+        self._utils.configure_unity_build(self)
         tc = CMakeToolchain(self)
 
         # No need for versions on installed names
@@ -1073,6 +1082,8 @@ class VtkConan(ConanFile):
             autoinit_file = os.path.join(self.package_folder, "include", "vtk", "vtk-conan", f"vtk_autoinit_vtk{implementable}.h")
             save(self, autoinit_file, content)
 
+        self._utils.package_debug_info(self)
+
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "VTK")
 
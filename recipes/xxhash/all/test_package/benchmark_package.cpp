@@ -0,0 +1,51 @@
+#include <benchmark/benchmark.h>
+#include <xxhash.h>
+
+#include <cstdint>
+#include <vector>
+
+static std::vector<uint8_t> make_input(size_t size) {
+    std::vector<uint8_t> data(size);
+    uint32_t seed = 12345;
+    for (auto &byte : data) {
+        seed = seed * 1103515245u + 12345u;
+        byte = static_cast<uint8_t>(seed >> 16);
+    }
+    return data;
+}
+
+static void BM_XXH32(benchmark::State &state) {
+    const auto input = make_input(state.range(0));
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(XXH32(input.data(), input.size(), 0));
+    }
+    state.SetBytesProcessed(state.iterations() * input.size());
+}
+BENCHMARK(BM_XXH32)->Arg(16)->Arg(4 << 10)->Arg(4 << 20)->ArgName("bytes");
+
+static void BM_XXH64(benchmark::State &state) {
+    const auto input = make_input(state.range(0));
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(XXH64(input.data(), input.size(), 0));
+    }
+    state.SetBytesProcessed(state.iterations() * input.size());
+}
+BENCHMARK(BM_XXH64)->Arg(16)->Arg(4 << 10)->Arg(4 << 20)->ArgName("bytes");
+
+static void BM_XXH3_64bits(benchmark::State &state) {
+    const auto input = make_input(state.range(0));
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(XXH3_64bits(input.data(), input.size()));
+    }
+    state.SetBytesProcessed(state.iterations() * input.size());
+}
+BENCHMARK(BM_XXH3_64bits)->Arg(16)->Arg(4 << 10)->Arg(4 << 20)->ArgName("bytes");
+
+static void BM_XXH3_128bits(benchmark::State &state) {
+    const auto input = make_input(state.range(0));
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(XXH3_128bits(input.data(), input.size()));
+    }
+    state.SetBytesProcessed(state.iterations() * input.size());
+}
+BENCHMARK(BM_XXH3_128bits)->Arg(16)->Arg(4 << 10)->Arg(4 << 20)->ArgName("bytes");
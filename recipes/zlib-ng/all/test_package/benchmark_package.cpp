@@ -0,0 +1,67 @@
+#include <benchmark/benchmark.h>
+
+#include <cstdint>
+#include <vector>
+
+#ifdef ZLIB_COMPAT
+#  include <zlib.h>
+#  define ZNG(name) name
+#  define dest_len_t uLongf
+#else
+#  include <zlib-ng.h>
+#  define ZNG(name) zng_##name
+#  define dest_len_t size_t
+#endif
+
+// 4 MiB with short repeated runs, so that both the match finder and the literal coder are exercised
+static const std::vector<uint8_t> &input() {
+    static const std::vector<uint8_t> data = [] {
+        std::vector<uint8_t> data(4 << 20);
+        for (size_t i = 0; i < data.size(); i++) {
+            data[i] = static_cast<uint8_t>((i / 7) ^ (i >> 12));
+        }
+        return data;
+    }();
+    return data;
+}
+
+static void BM_compress(benchmark::State &state) {
+    std::vector<uint8_t> output(ZNG(compressBound)(input().size()));
+    for (auto _ : state) {
+        dest_len_t size = output.size();
+        ZNG(compress2)(output.data(), &size, input().data(), input().size(), static_cast<int>(state.range(0)));
+        benchmark::DoNotOptimize(size);
+    }
+    state.SetBytesProcessed(state.iterations() * input().size());
+}
+BENCHMARK(BM_compress)->Arg(1)->Arg(6)->ArgName("level")->Unit(benchmark::kMillisecond);
+
+static void BM_uncompress(benchmark::State &state) {
+    std::vector<uint8_t> compressed(ZNG(compressBound)(input().size()));
+    dest_len_t compressed_size = compressed.size();
+    ZNG(compress2)(compressed.data(), &compressed_size, input().data(), input().size(), 6);
+    std::vector<uint8_t> output(input().size());
+    for (auto _ : state) {
+        dest_len_t size = output.size();
+        ZNG(uncompress)(output.data(), &size, compressed.data(), compressed_size);
+        benchmark::DoNotOptimize(size);
+    }
+    state.SetBytesProcessed(state.iterations() * input().size());
+}
+BENCHMARK(BM_uncompress)->Unit(benchmark::kMillisecond);
+
+static void BM_crc32(benchmark::State &state) {
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(ZNG(crc32)(0, input().data(), input().size()));
+    }
+    state.SetBytesProcessed(state.iterations() * input().size());
+}
+BENCHMARK(BM_crc32);
+
+static void BM_adler32(benchmark::State &state) {
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(ZNG(adler32)(1, input().data(), input().size()));
+    }
+    state.SetBytesProcessed(state.iterations() * input().size());
+}
+BENCHMARK(BM_adler32);
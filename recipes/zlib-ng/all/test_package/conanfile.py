@@ -8,16 +8,23 @@ from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     generators = "CMakeDeps"
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
 
     def layout(self):
         cmake_layout(self)
 
     def requirements(self):
         self.requires(self.tested_reference_str)
+        self._utils.require_benchmark(self)
 
     def generate(self):
         tc = CMakeToolchain(self)
         tc.variables["ZLIB_COMPAT"] = bool(self.dependencies["zlib-ng"].options.zlib_compat)
+        tc.cache_variables["WITH_BENCHMARK"] = self._utils.benchmarks_enabled(self)
         tc.generate()
 
     def build(self):
@@ -29,3 +36,5 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             cmd = os.path.join(self.cpp.build.bindir, "test_package")
             self.run(cmd, env="conanrun")
+            if self._utils.benchmarks_enabled(self):
+                self._utils.run_benchmark(self, os.path.join(self.cpp.build.bindir, "benchmark_package"))
@@ -0,0 +1,45 @@
+#include <benchmark/benchmark.h>
+#include <zstd.h>
+
+#include <string>
+#include <vector>
+
+// 4 MiB of decimal numbers: compressible, but not trivially so
+static const std::string &input() {
+    static const std::string s = [] {
+        std::string s;
+        for (unsigned i = 0; s.size() < (4u << 20); i++) {
+            s += std::to_string(i * 2654435761u) + ' ';
+        }
+        return s;
+    }();
+    return s;
+}
+
+static void BM_compress(benchmark::State &state) {
+    std::vector<char> output(ZSTD_compressBound(input().size()));
+    ZSTD_CCtx *cctx = ZSTD_createCCtx();
+    ZSTD_CCtx_setParameter(cctx, ZSTD_c_compressionLevel, static_cast<int>(state.range(0)));
+    if (ZSTD_isError(ZSTD_CCtx_setParameter(cctx, ZSTD_c_nbWorkers, static_cast<int>(state.range(1))))) {
+        state.SkipWithError("zstd was built without multithreading support");
+    }
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(ZSTD_compress2(cctx, output.data(), output.size(), input().data(), input().size()));
+    }
+    state.SetBytesProcessed(state.iterations() * input().size());
+    ZSTD_freeCCtx(cctx);
+}
+BENCHMARK(BM_compress)->ArgsProduct({{1, 3, 19}, {0, 4}})->ArgNames({"level", "workers"})->Unit(benchmark::kMillisecond);
+
+static void BM_decompress(benchmark::State &state) {
+    std::vector<char> compressed(ZSTD_compressBound(input().size()));
+    compressed.resize(ZSTD_compress(compressed.data(), compressed.size(), input().data(), input().size(), 3));
+    std::vector<char> output(input().size());
+    ZSTD_DCtx *dctx = ZSTD_createDCtx();
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(ZSTD_decompressDCtx(dctx, output.data(), output.size(), compressed.data(), compressed.size()));
+    }
+    state.SetBytesProcessed(state.iterations() * input().size());
+    ZSTD_freeDCtx(dctx);
+}
+BENCHMARK(BM_decompress)->Unit(benchmark::kMillisecond);
@@ -2,18 +2,29 @@ import os
 
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeToolchain", "CMakeDeps"
+    generators = "CMakeDeps"
+    python_requires = "conan-utils/latest"
+
+    @property
+    def _utils(self):
+        return self.python_requires["conan-utils"].module
 
     def layout(self):
         cmake_layout(self)
 
     def requirements(self):
         self.requires(self.tested_reference_str, run=True)
+        self._utils.require_benchmark(self)
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.cache_variables["WITH_BENCHMARK"] = self._utils.benchmarks_enabled(self)
+        tc.generate()
 
     def build(self):
         cmake = CMake(self)
@@ -26,3 +37,5 @@ class TestPackageConan(ConanFile):
 
         bin_path = os.path.join(self.cpp.build.bindir, "test_package")
         self.run(bin_path, env="conanrun")
+        if self._utils.benchmarks_enabled(self):
+            self._utils.run_benchmark(self, os.path.join(self.cpp.build.bindir, "benchmark_package"))